@@ -0,0 +1,103 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+
+
+def normalize_question(question):
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return " ".join(re.findall(r"[a-z0-9]+", question.lower()))
+
+
+class AnswerCache:
+    """Answer cache for repeated questions.
+
+    A lookup first tries the exact normalized question, then the most similar
+    cached question in the same scope (e.g. provider/model) whose embedding
+    cosine similarity is at least `similarity_threshold`. Entries expire
+    after `ttl` seconds and are dropped when the vector store generation they
+    were answered against changes.
+    """
+
+    def __init__(self, embed_func=None, similarity_threshold=0.95, ttl=3600, max_entries=512):
+        self.embed_func = embed_func
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _embed(self, question):
+        if not self.embed_func:
+            return None
+        vector = np.asarray(self.embed_func(question), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _is_valid(self, entry, generation):
+        return entry["expires"] > time.time() and entry["generation"] == generation
+
+    def get(self, question, scope="", generation=None, semantic=True):
+        """Return the cached answer or None; semantic=False only tries the exact question (no embedding call)."""
+        key = (scope, normalize_question(question))
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry and self._is_valid(entry, generation):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry["value"]
+            candidates = [
+                (k, e) for k, e in self.entries.items()
+                if k[0] == scope and e["embedding"] is not None and self._is_valid(e, generation)
+            ]
+
+        if candidates and semantic and self.embed_func:
+            query = self._embed(question)
+            similarities = np.stack([e["embedding"] for _, e in candidates]) @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.similarity_threshold:
+                best_key, best_entry = candidates[best]
+                with self._lock:
+                    if best_key in self.entries:
+                        self.entries.move_to_end(best_key)
+                    self.hits += 1
+                    self.semantic_hits += 1
+                return best_entry["value"]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, question, value, scope="", generation=None, embed=True):
+        """embed=False stores the answer for exact repeats only, without embedding the question."""
+        key = (scope, normalize_question(question))
+        entry = {
+            "question": question,
+            "value": value,
+            "embedding": self._embed(question) if embed else None,
+            "expires": time.time() + self.ttl,
+            "generation": generation
+        }
+        with self._lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self):
+        with self._lock:
+            self.entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
@@ -0,0 +1,91 @@
+"""
+Compare questions/sec of SunbeamRAG.query (sequential) and SunbeamRAG.aquery (concurrent).
+
+Run from the repo root (needs an ingested chroma_db; no LLM or LM Studio required):
+    python -m benchmarks.bench_async_query
+    python -m benchmarks.bench_async_query --questions 100 --concurrency 20 --chat-latency 0.5
+
+Embeddings and chat completions are served by benchmarks.mock_server with a
+fixed latency. The collection is copied to a temp dir and a fresh embedding
+cache is used, so every question pays for one embedding + one LLM call.
+"""
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+import llm_client
+from benchmarks.mock_server import MockServer
+from sunbeam_rag_simple import SunbeamRAG
+
+TOPICS = ["Python", "Java", "data science", "machine learning", "web development", "DevOps", "C++", "cloud computing"]
+TEMPLATES = [
+    "What does the {} course cover?",
+    "How long is the {} course?",
+    "Who should take the {} course?",
+    "What are the prerequisites for {}?",
+    "Is there an internship in {}?"
+]
+
+
+def make_questions(n):
+    questions = [t.format(topic) for t in TEMPLATES for topic in TOPICS]
+    return [f"{questions[i % len(questions)]} ({i})" for i in range(n)]
+
+
+def run_sequential(rag, questions):
+    start = time.perf_counter()
+    for q in questions:
+        rag.query(q)
+    return time.perf_counter() - start
+
+
+async def run_concurrent(rag, questions, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(q):
+        async with semaphore:
+            return await rag.aquery(q)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(q) for q in questions))
+    elapsed = time.perf_counter() - start
+    await rag.aclose()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--persist-dir", default="chroma_db")
+    parser.add_argument("--questions", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--embed-latency", type=float, default=0.02, help="seconds per mock embedding request")
+    parser.add_argument("--chat-latency", type=float, default=0.2, help="seconds per mock chat completion")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="bench_async_")
+    with MockServer(embed_latency=args.embed_latency, chat_latency=args.chat_latency) as server:
+        for provider in ("Groq", "LM Studio"):
+            llm_client.PROVIDERS[provider]["base_url"] = server.base_url
+        llm_client.FAILOVER_ORDER.clear()
+        try:
+            shutil.copytree(args.persist_dir, f"{tmp_dir}/chroma_db")
+            rag = SunbeamRAG(f"{tmp_dir}/chroma_db", f"{tmp_dir}/embed_cache.sqlite3")
+            rag.answer_cache.ttl = 0  # every question is answered, never served from cache
+            rag.query("warmup")
+
+            questions = make_questions(args.questions)
+            sequential = run_sequential(rag, questions)
+            rag.embed_cache.clear()
+            concurrent = asyncio.run(run_concurrent(rag, questions, args.concurrency))
+
+            print(f"\n{args.questions} questions | embed {args.embed_latency * 1000:.0f} ms | chat {args.chat_latency * 1000:.0f} ms (mock)")
+            print(f"  query  (sequential):         {sequential:6.2f} s | {args.questions / sequential:6.1f} q/s")
+            print(f"  aquery (concurrency {args.concurrency:>3}):   {concurrent:6.2f} s | {args.questions / concurrent:6.1f} q/s")
+            print(f"  Speedup: {sequential / concurrent:.1f}x")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
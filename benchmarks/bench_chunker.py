@@ -0,0 +1,146 @@
+"""
+Compare the token-aware chunker against the previous fixed-width character chunker.
+
+Run from the repo root:
+    python -m benchmarks.bench_chunker                 # embeds with LM Studio (nomic), like ingestion
+    python -m benchmarks.bench_chunker --lexical       # offline: TF-IDF retrieval instead of embeddings
+    python -m benchmarks.bench_chunker --max-tokens 128 --overlap 16 --k 3
+
+Both chunkers run over the same data/ files. For each one it reports the
+chunk count, total embedded tokens, the largest chunk, and how many split
+chunks start or end mid-word. Retrieval quality is hit@k and MRR over
+QUERIES: a hit is a retrieved chunk that contains the expected text.
+Queries whose expected text is not in the current data are skipped.
+"""
+import argparse
+import re
+import numpy as np
+import chunking
+from chunking import chunk_all_scraped_data, chunk_spans_if_large, count_tokens
+from embedding_pipeline import EmbeddingPipeline
+from llm_client import PROVIDERS
+from sunbeam_rag_simple import DATA_FILES, EMBED_MODEL
+
+QUERIES = [
+    ("Where is the Hinjawadi campus located?", "Rajiv Gandhi IT Park"),
+    ("Does the campus have a library?", "well equipped library"),
+    ("Is accommodation available for students near the campus?", "student accommodation"),
+    ("What is the structure of the 2 month internship?", "Execution of 2 mini projects"),
+    ("Is the 6 month internship project done online?", "enhanced features based on specific technology in online mode"),
+    ("What are the prerequisites for the cyber security internship?", "Networking & Linux Basics"),
+    ("Which internship teaches Cortex-M embedded programming?", "Cortex-M embedded programming"),
+    ("What will I learn in the .NET internship?", ".NET Web MVC"),
+    ("How does Sunbeam help with placements?", "Campus Placement Programme"),
+    ("Do I get a certificate after the internship?", "certificate upon successful completion"),
+    ("What subjects are covered in Pre-CAT?", "Computer Fundamentals & Concepts of Programming"),
+    ("Who is eligible for Pre-CAT courses?", "eligible for Full-time PG Courses"),
+    ("When does Pre-CAT batch PM-48 start?", "16-Feb-2026"),
+    ("What is the fee for Mastering MCQs?", "Rs. 3000"),
+    ("What is the Sunbeam email address?", "scc@sunbeaminfo.in"),
+    ("What is the address of the Market Yard centre?", "Sunbeam Chambers"),
+]
+
+
+def fixed_char_spans(title, content):
+    """The previous chunker: 800-character windows with 100 characters of overlap above 1000 characters."""
+    if len(f"{title}\n\n{content}") <= 1000:
+        return [(0, len(content))]
+    return [(start, min(start + 800, len(content))) for start in range(0, len(content), 700)]
+
+
+def build_chunks(span_fn):
+    """Chunk data/ with span_fn in place of chunking.chunk_spans_if_large; returns (docs, mid-word cuts)."""
+    cuts = []
+
+    def counted(title, content):
+        spans = span_fn(title, content)
+        cuts.extend(
+            cut for start, end in spans for cut in (start, end)
+            if 0 < cut < len(content) and content[cut - 1].isalnum() and content[cut].isalnum()
+        )
+        return spans
+
+    previous = chunking.chunk_spans_if_large
+    chunking.chunk_spans_if_large = counted
+    try:
+        return chunk_all_scraped_data(DATA_FILES), len(cuts)
+    finally:
+        chunking.chunk_spans_if_large = previous
+
+
+def tfidf(texts, vocabulary=None):
+    tokenized = [re.findall(r"\w+", text.lower()) for text in texts]
+    if vocabulary is None:
+        vocabulary = {w: i for i, w in enumerate(sorted({w for tokens in tokenized for w in tokens}))}
+    matrix = np.zeros((len(texts), len(vocabulary)), dtype=np.float32)
+    for row, tokens in enumerate(tokenized):
+        for w in tokens:
+            if w in vocabulary:
+                matrix[row, vocabulary[w]] += 1
+    return matrix, vocabulary
+
+
+def rank_lexical(docs, queries):
+    doc_matrix, vocabulary = tfidf(docs)
+    idf = np.log((1 + len(docs)) / (1 + (doc_matrix > 0).sum(axis=0))) + 1
+    doc_matrix *= idf
+    query_matrix = tfidf(queries, vocabulary)[0] * idf
+    return rank(doc_matrix, query_matrix)
+
+
+def rank_embedded(docs, queries, embedder):
+    return rank(np.array(embedder.embed(docs), dtype=np.float32), np.array(embedder.embed(queries), dtype=np.float32))
+
+
+def rank(doc_matrix, query_matrix):
+    doc_matrix /= np.linalg.norm(doc_matrix, axis=1, keepdims=True) + 1e-9
+    query_matrix /= np.linalg.norm(query_matrix, axis=1, keepdims=True) + 1e-9
+    return np.argsort(-(query_matrix @ doc_matrix.T), axis=1)
+
+
+def evaluate(docs, queries, ranker, k):
+    texts = [doc.page_content for doc in docs]
+    ranking = ranker(texts, [q for q, _ in queries])
+    hits, reciprocal = 0, 0.0
+    for (_, expected), order in zip(queries, ranking):
+        rank_of = next((i for i, idx in enumerate(order) if expected in texts[idx]), None)
+        if rank_of is not None and rank_of < k:
+            hits += 1
+            reciprocal += 1 / (rank_of + 1)
+    return hits / len(queries), reciprocal / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-tokens", type=int, default=chunking.CHUNK_MAX_TOKENS)
+    parser.add_argument("--overlap", type=int, default=chunking.CHUNK_OVERLAP_TOKENS)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--lexical", action="store_true", help="rank with TF-IDF instead of the embedding endpoint")
+    args = parser.parse_args()
+
+    chunkers = {
+        "fixed 800 chars": fixed_char_spans,
+        f"{args.max_tokens} tokens": lambda title, content: chunk_spans_if_large(title, content, args.max_tokens, args.overlap)
+    }
+    if args.lexical:
+        ranker = rank_lexical
+    else:
+        embedder = EmbeddingPipeline(PROVIDERS["LM Studio"]["base_url"], EMBED_MODEL)
+        ranker = lambda docs, queries: rank_embedded(docs, queries, embedder)
+
+    corpus = " ".join(doc.page_content for doc in build_chunks(fixed_char_spans)[0])
+    queries = [(q, expected) for q, expected in QUERIES if expected in corpus]
+    if len(queries) < len(QUERIES):
+        print(f"⚠ Skipping {len(QUERIES) - len(queries)} queries whose expected text is not in data/")
+
+    print(f"\n{len(queries)} queries, k={args.k}, {'TF-IDF' if args.lexical else EMBED_MODEL}")
+    for name, span_fn in chunkers.items():
+        docs, cuts = build_chunks(span_fn)
+        tokens = [count_tokens(doc.page_content) for doc in docs]
+        hit_rate, mrr = evaluate(docs, queries, ranker, args.k)
+        print(f"  {name:>16}: {len(docs):3d} chunks | {sum(tokens):6d} tokens embedded | max {max(tokens):4d} | "
+              f"{cuts:2d} mid-word cuts | hit@{args.k} {hit_rate:.2f} | MRR {mrr:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measure how much context_builder shrinks prompts and whether the answer survives.
+
+Run from the repo root (offline, no LLM or embedding calls):
+    python -m benchmarks.bench_context
+    python -m benchmarks.bench_context --k 15 --budgets 500 1000 2000
+
+Chunks come from the current data/ files. Each query in
+benchmarks.bench_chunker.QUERIES retrieves its top-k chunks with TF-IDF
+cosine (distance = 1 - similarity). The naive "\\n\\n".join of all k chunks
+is then compared with build_context() at each budget: context tokens, and
+answer recall (how often the expected answer text is still in the context).
+"""
+import argparse
+import statistics
+import numpy as np
+from benchmarks.bench_chunker import QUERIES, tfidf
+from chunking import chunk_all_scraped_data, chunk_id, count_tokens
+from context_builder import build_context, format_context
+from sunbeam_rag_simple import DATA_FILES
+
+
+def retrieve_all(docs, queries, k):
+    texts = [doc.page_content for doc in docs]
+    doc_matrix, vocabulary = tfidf(texts)
+    idf = np.log((1 + len(texts)) / (1 + (doc_matrix > 0).sum(axis=0))) + 1
+    doc_matrix *= idf
+    doc_matrix /= np.linalg.norm(doc_matrix, axis=1, keepdims=True) + 1e-9
+    query_matrix = tfidf(queries, vocabulary)[0] * idf
+    query_matrix /= np.linalg.norm(query_matrix, axis=1, keepdims=True) + 1e-9
+    scores = query_matrix @ doc_matrix.T
+    results = []
+    for row in scores:
+        top = np.argsort(-row)[:k]
+        results.append([
+            {"id": chunk_id(docs[i]), "document": texts[i], "metadata": docs[i].metadata, "distance": float(1 - row[i])}
+            for i in top
+        ])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--k", type=int, default=15, help="chunks retrieved per question (the dashboard's fee path uses 15)")
+    parser.add_argument("--budgets", type=int, nargs="+", default=[500, 1000, 2000])
+    args = parser.parse_args()
+
+    docs = chunk_all_scraped_data(DATA_FILES)
+    corpus = " ".join(doc.page_content for doc in docs)
+    queries = [(q, expected) for q, expected in QUERIES if expected in corpus]
+    retrieved = retrieve_all(docs, [q for q, _ in queries], args.k)
+
+    def report(name, contexts):
+        tokens = [count_tokens(context) for context in contexts]
+        recall = sum(expected in context for (_, expected), context in zip(queries, contexts)) / len(queries)
+        print(f"  {name:>14}: mean {statistics.mean(tokens):7.1f} tokens | max {max(tokens):5d} | answer recall {recall:.2f}")
+        return statistics.mean(tokens)
+
+    print(f"\n{len(queries)} queries, top {args.k} chunks each")
+    naive = report("naive join", [format_context(results) for results in retrieved])
+    for budget in args.budgets:
+        packed = report(f"budget {budget}", [format_context(build_context(results, budget)) for results in retrieved])
+        print(f"  {'':>14}  {1 - packed / naive:.0%} fewer context tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Compare vector, BM25 and hybrid (reciprocal rank fusion) retrieval, and the embedding-free shortcut.
+
+Run from the repo root:
+    python -m benchmarks.bench_hybrid_retrieval              # vector arm embeds with LM Studio (nomic)
+    python -m benchmarks.bench_hybrid_retrieval --tfidf      # offline: TF-IDF cosine stands in for embeddings
+    python -m benchmarks.bench_hybrid_retrieval --k 4 --confidence 0.8
+
+Chunks come from the current data/ files; BM25 is built over the same
+chunks in a temporary directory. Quality is hit@k and MRR over
+benchmarks.bench_chunker.QUERIES. "lexical-only" is the path
+SunbeamRAG.search takes: BM25 alone for questions whose keyword confidence
+reaches --confidence (no embedding call), hybrid for the rest.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import numpy as np
+from benchmarks.bench_chunker import QUERIES
+from benchmarks.bench_context import retrieve_all
+from bm25_index import BM25Index, rrf_fuse
+from chunking import chunk_all_scraped_data, chunk_id
+from embedding_pipeline import EmbeddingPipeline
+from llm_client import PROVIDERS
+from sunbeam_rag_simple import DATA_FILES, EMBED_MODEL, LEXICAL_CONFIDENCE, LEXICAL_MIN_TERMS
+
+
+def retrieve_embedded(docs, queries, k):
+    embedder = EmbeddingPipeline(PROVIDERS["LM Studio"]["base_url"], EMBED_MODEL)
+    texts = [doc.page_content for doc in docs]
+    doc_matrix = np.array(embedder.embed(texts), dtype=np.float32)
+    query_matrix = np.array(embedder.embed(queries), dtype=np.float32)
+    distances = (
+        (doc_matrix ** 2).sum(axis=1)[None, :] - 2 * query_matrix @ doc_matrix.T + (query_matrix ** 2).sum(axis=1)[:, None]
+    )
+    return [
+        [{"id": chunk_id(docs[i]), "document": texts[i], "metadata": docs[i].metadata, "distance": float(row[i])}
+         for i in np.argsort(row)[:k]]
+        for row in distances
+    ]
+
+
+def score(queries, results, k):
+    hits, reciprocal = 0, 0.0
+    for (_, expected), found in zip(queries, results):
+        rank_of = next((i for i, doc in enumerate(found[:k]) if expected in doc["document"]), None)
+        if rank_of is not None:
+            hits += 1
+            reciprocal += 1 / (rank_of + 1)
+    return hits / len(queries), reciprocal / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--k", type=int, default=4, help="chunks per question (SunbeamRAG's default for LLM questions)")
+    parser.add_argument("--confidence", type=float, default=LEXICAL_CONFIDENCE, help="keyword confidence for BM25-only answers")
+    parser.add_argument("--min-terms", type=int, default=LEXICAL_MIN_TERMS, help="content terms a question needs for a BM25-only answer")
+    parser.add_argument("--tfidf", action="store_true", help="TF-IDF cosine instead of the embedding endpoint for the vector arm")
+    args = parser.parse_args()
+
+    docs = chunk_all_scraped_data(DATA_FILES)
+    corpus = " ".join(doc.page_content for doc in docs)
+    queries = [(q, expected) for q, expected in QUERIES if expected in corpus]
+    if len(queries) < len(QUERIES):
+        print(f"⚠ Skipping {len(QUERIES) - len(queries)} queries whose expected text is not in data/")
+    questions = [q for q, _ in queries]
+
+    with tempfile.TemporaryDirectory(prefix="bench_bm25_") as tmp:
+        index = BM25Index(os.path.join(tmp, "bm25_index.json"))
+        start = time.perf_counter()
+        index.build([{"id": chunk_id(doc), "document": doc.page_content, "metadata": doc.metadata} for doc in docs])
+        build_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        index.load()
+        load_ms = (time.perf_counter() - start) * 1000
+
+    vector = (retrieve_all if args.tfidf else retrieve_embedded)(docs, questions, args.k * 2)
+    timings, lexical = [], []
+    for question in questions:
+        start = time.perf_counter()
+        lexical.append(index.search(question, args.k * 2))
+        timings.append((time.perf_counter() - start) * 1000)
+    hybrid = [rrf_fuse([v, l], args.k) for v, l in zip(vector, lexical)]
+    confident = [index.confidence(q, args.min_terms) >= args.confidence for q in questions]
+    shortcut = [l[:args.k] if c else h for l, h, c in zip(lexical, hybrid, confident)]
+
+    print(f"\n{len(docs)} chunks, {len(queries)} queries, k={args.k}, vector arm: {'TF-IDF' if args.tfidf else EMBED_MODEL}")
+    print(f"  BM25 build {build_ms:.1f} ms | load {load_ms:.1f} ms | search mean {statistics.mean(timings):.2f} ms")
+    for name, results in [("vector", vector), ("BM25", lexical), ("hybrid (RRF)", hybrid), ("lexical-only", shortcut)]:
+        hit_rate, mrr = score(queries, results, args.k)
+        print(f"  {name:>13}: hit@{args.k} {hit_rate:.2f} | MRR {mrr:.3f}")
+    print(f"  {sum(confident)}/{len(queries)} questions answered from BM25 alone (no embedding call)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Per-stage latency (p50/p95/p99) and throughput of chunking, ingestion, retrieval and answering.
+
+Run from the repo root (no LLM, LM Studio or network needed):
+    python -m benchmarks.bench_latency
+    python -m benchmarks.bench_latency --rounds 5 --embed-latency 0.05 --chat-latency 0.5 --jitter 0.1
+    python -m benchmarks.bench_latency --output before.json
+    python -m benchmarks.bench_latency --compare before.json    # after a change: p50/p95 deltas per stage
+
+Embeddings and chat completions come from benchmarks.mock_server with the
+given latency. Everything runs in a temp dir, so chroma_db, the embedding
+cache and the fact store in the repo are never touched. Stages:
+
+  chunk_all_scraped_data    one pass over data/ per sample
+  load_data_to_vectorstore  cold ingest into an empty store, every chunk embedded
+  sync_unchanged            load_data_to_vectorstore again with nothing changed
+  find_similar_documents    one question (embedding cache cleared every round)
+  search                    SunbeamRAG.search: hybrid or lexical-only, per RETRIEVAL_MODE
+  query                     SunbeamRAG.query end to end, answer cache off
+
+The question set is benchmarks.bench_chunker.QUERIES plus questions built
+from the chunk metadata in data/ (programs, courses, section titles); its
+hash is saved with the results, so only runs over the same set are compared.
+The JSON report also records the commit and every latency setting.
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import llm_client
+import sunbeam_rag_simple
+from benchmarks.bench_chunker import QUERIES
+from benchmarks.mock_server import MockServer
+from chunking import chunk_all_scraped_data
+from sunbeam_rag_simple import DATA_FILES, SunbeamRAG
+
+STAGES = ("chunk_all_scraped_data", "load_data_to_vectorstore", "sync_unchanged", "find_similar_documents", "search", "query")
+FIXED_QUESTIONS = ["What is the Sunbeam email address?", "Show me every internship", "List all modular courses", "Hi, how are you?"]
+
+
+def make_questions(docs):
+    """Fixed questions first, then one or two per program, course and section title in data/."""
+    questions = [q for q, _ in QUERIES] + FIXED_QUESTIONS
+    for doc in docs:
+        metadata = doc.metadata
+        if metadata.get("technology"):
+            questions.append(f"What will I learn in the {metadata['technology']} internship?")
+        if metadata.get("section_type") == "course_detail":
+            questions.append(f"What does the {metadata['course_name']} course cover?")
+            questions.append(f"What is the fee for {metadata['course_name']}?")
+        if metadata.get("section_title"):
+            questions.append(f"Tell me about {metadata['section_title'].rstrip(':')}")
+    return list(dict.fromkeys(questions))
+
+
+def percentile(ordered, p):
+    """Linear interpolation between the closest ranks of an already sorted sample."""
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * p / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def summarize(samples_ms, wall_s, items=None):
+    ordered = sorted(samples_ms)
+    stats = {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered), 3),
+        "p50_ms": round(percentile(ordered, 50), 3),
+        "p95_ms": round(percentile(ordered, 95), 3),
+        "p99_ms": round(percentile(ordered, 99), 3),
+        "max_ms": round(ordered[-1], 3),
+        "per_sec": round(len(ordered) / wall_s, 3)
+    }
+    if items is not None:
+        stats["items_per_sec"] = round(items / wall_s, 1)
+    return stats
+
+
+def timed(fn, *args):
+    """(milliseconds, result) of one call, with the function's progress prints swallowed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = fn(*args)
+        return (time.perf_counter() - start) * 1000, result
+
+
+def run_stage(fn, inputs):
+    """Time fn over every input in turn; returns (samples in ms, wall seconds, results)."""
+    samples, results = [], []
+    start = time.perf_counter()
+    for args in inputs:
+        ms, result = timed(fn, *args)
+        samples.append(ms)
+        results.append(result)
+    return samples, time.perf_counter() - start, results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old, new):
+    if old.get("question_set") != new.get("question_set"):
+        print("⚠ Different question sets, per-question stages are not comparable")
+    print(f"\nvs {old.get('commit') or '?'} ({old.get('timestamp')})")
+    for stage, stats in new["stages"].items():
+        before = old.get("stages", {}).get(stage)
+        if not before:
+            continue
+        deltas = " | ".join(
+            f"{key[:3]} {before[key]:9.2f} -> {stats[key]:9.2f} ms ({(stats[key] - before[key]) / before[key]:+.0%})"
+            for key in ("p50_ms", "p95_ms") if before[key]
+        )
+        print(f"  {stage:>24}: {deltas}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=3, help="passes over the question set for the per-question stages")
+    parser.add_argument("--repeat", type=int, default=3, help="samples of the chunking and ingestion stages")
+    parser.add_argument("--questions", type=int, help="use only the first N questions")
+    parser.add_argument("--embed-latency", type=float, default=0.02, help="seconds per mock embedding request")
+    parser.add_argument("--chat-latency", type=float, default=0.2, help="seconds per mock chat completion")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra uniform random 0..JITTER seconds per mock request")
+    parser.add_argument("--output", help="JSON report path (default: benchmarks/results/latency_<commit>.json)")
+    parser.add_argument("--compare", help="an earlier JSON report to print p50/p95 deltas against")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    output = args.output or os.path.join("benchmarks", "results", f"latency_{commit or 'unknown'}.json")
+    stages = {}
+
+    with MockServer(embed_latency=args.embed_latency, chat_latency=args.chat_latency, jitter=args.jitter) as server, \
+            tempfile.TemporaryDirectory(prefix="bench_latency_") as tmp:
+        for provider in ("Groq", "LM Studio"):
+            llm_client.PROVIDERS[provider]["base_url"] = server.base_url
+        llm_client.FAILOVER_ORDER.clear()
+
+        samples, wall, results = run_stage(chunk_all_scraped_data, [(DATA_FILES,)] * args.repeat)
+        docs = results[-1]
+        stages["chunk_all_scraped_data"] = summarize(samples, wall, items=len(docs) * args.repeat)
+        print(f"✓ chunk_all_scraped_data: {len(docs)} chunks")
+
+        # Every ingest sample starts from an empty store and an empty embedding cache
+        rags = []
+        for i in range(args.repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                rags.append(SunbeamRAG(f"{tmp}/chroma_{i}", f"{tmp}/embed_cache_{i}.sqlite3", f"{tmp}/facts_{i}.sqlite3"))
+        samples, wall, _ = run_stage(lambda rag: rag.load_data_to_vectorstore(), [(rag,) for rag in rags])
+        stages["load_data_to_vectorstore"] = summarize(samples, wall, items=len(docs) * args.repeat)
+        rag = rags[-1]
+        samples, wall, _ = run_stage(rag.load_data_to_vectorstore, [()] * args.repeat)
+        stages["sync_unchanged"] = summarize(samples, wall)
+        print(f"✓ load_data_to_vectorstore: {args.repeat} cold ingests, {args.repeat} unchanged syncs")
+
+        questions = make_questions(docs)[:args.questions]
+        rag.answer_cache.ttl = 0  # every question is answered, never served from cache
+        timed(rag.query, "warmup")
+        requests_before = dict(server.counts)
+        for stage, fn in (("find_similar_documents", rag.vs.find_similar_documents), ("search", rag.search), ("query", rag.query)):
+            samples, wall = [], 0.0
+            for _ in range(args.rounds):
+                rag.embed_cache.clear()
+                round_samples, round_wall, _ = run_stage(fn, [(q,) for q in questions])
+                samples += round_samples
+                wall += round_wall
+            stages[stage] = summarize(samples, wall)
+            print(f"✓ {stage}: {len(samples)} calls")
+        mock_requests = {name: server.counts[name] - requests_before[name] for name in server.counts}
+
+    report = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "settings": {
+            "rounds": args.rounds, "repeat": args.repeat, "embed_latency": args.embed_latency, "chat_latency": args.chat_latency,
+            "jitter": args.jitter, "retrieval_mode": sunbeam_rag_simple.RETRIEVAL_MODE,
+            "vector_backend": os.getenv("VECTOR_BACKEND", "chroma")
+        },
+        "question_set": {"count": len(questions), "sha256": hashlib.sha256("\n".join(questions).encode("utf-8")).hexdigest()[:16]},
+        "chunks": len(docs),
+        "mock_requests": mock_requests,
+        "stages": stages
+    }
+
+    print(f"\n{len(docs)} chunks, {len(questions)} questions x {args.rounds} rounds | embed {args.embed_latency * 1000:.0f} ms | "
+          f"chat {args.chat_latency * 1000:.0f} ms | jitter {args.jitter * 1000:.0f} ms (mock)")
+    print(f"  {'stage':>24} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'per sec':>9}")
+    for stage in STAGES:
+        stats = stages[stage]
+        print(f"  {stage:>24} {stats['p50_ms']:10.2f} {stats['p95_ms']:10.2f} {stats['p99_ms']:10.2f} {stats['per_sec']:9.2f}")
+    print(f"  mock requests during question stages: {mock_requests['embeddings']} embeddings, {mock_requests['chat']} chat")
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Report saved to {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
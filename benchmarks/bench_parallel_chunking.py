@@ -0,0 +1,78 @@
+"""
+Time chunking of a scaled-up data/ directory sequentially and across processes.
+
+Run from the repo root:
+    python -m benchmarks.bench_parallel_chunking
+    python -m benchmarks.bench_parallel_chunking --scale 400 --workers 6
+
+Every list of records in the real data/ files (accordion sections, programs,
+batches, courses) is repeated --scale times with numbered titles, so each
+source grows the way a larger site would. Only chunking is timed: no
+embedding or store writes. Speedup is capped by the number of sources (6)
+and by the largest one, since each source is chunked by one process.
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from chunking import chunk_id, iter_chunks
+from sunbeam_rag_simple import DATA_FILES
+
+LABEL_KEYS = ("title", "course_name", "Technology", "Batch")
+
+
+def scale_records(data, scale):
+    """Repeat every list of dicts `scale` times, suffixing each copy's title so chunks stay distinct."""
+    if isinstance(data, dict):
+        return {key: scale_records(value, scale) for key, value in data.items()}
+    if isinstance(data, list) and data and all(isinstance(item, dict) for item in data):
+        return [
+            {key: f"{value} ({copy})" if key in LABEL_KEYS and copy else value for key, value in item.items()}
+            for copy in range(scale) for item in data
+        ]
+    return data
+
+
+def build_data(directory, scale):
+    files = {}
+    for page_type, path in DATA_FILES.items():
+        with open(path, 'r', encoding='utf-8') as f:
+            data = scale_records(json.load(f), scale)
+        files[page_type] = os.path.join(directory, os.path.basename(path))
+        with open(files[page_type], 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    return files
+
+
+def time_chunking(files, workers):
+    start = time.perf_counter()
+    ids = {chunk_id(doc) for doc in iter_chunks(files, workers, min_parallel_bytes=0)}
+    return time.perf_counter() - start, ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="bench_chunking_")
+    try:
+        files = build_data(directory, args.scale)
+        size = sum(os.path.getsize(path) for path in files.values())
+        sequential, sequential_ids = time_chunking(files, 1)
+        parallel, parallel_ids = time_chunking(files, args.workers)
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"\n{len(files)} sources, {size / 1e6:.1f} MB, {len(sequential_ids)} chunks")
+    print(f"  1 process:   {sequential:6.2f} s")
+    print(f"  {args.workers} processes: {parallel:6.2f} s (including pool start-up)")
+    print(f"  Speedup: {sequential / parallel:.1f}x")
+    print(f"  Same chunks: {'yes' if sequential_ids == parallel_ids else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Measure cold (first call) versus warm latency for each LLM provider.
+
+Run from the repo root (needs the provider's API key / a running LM Studio):
+    python -m benchmarks.bench_provider_latency
+    python -m benchmarks.bench_provider_latency --providers Groq Gemini --calls 10
+
+The first call per provider/model pays for connection setup and, for
+Gemini, importing and constructing the SDK client; later calls reuse the
+pooled session / cached client from llm_client.
+"""
+import argparse
+import json
+import llm_client
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PROMPT = "Reply with the single word: ok"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--providers", nargs="+", default=list(llm_client.PROVIDERS))
+    parser.add_argument("--calls", type=int, default=5, help="calls per provider (the first one is cold)")
+    parser.add_argument("--output", help="write the latency report as JSON to this path")
+    args = parser.parse_args()
+
+    llm_client.FAILOVER_ORDER.clear()  # measure each provider on its own, no failover
+    for provider in args.providers:
+        model = llm_client.PROVIDERS[provider]["default_model"]
+        print(f"{provider} ({model}): ", end="", flush=True)
+        try:
+            for _ in range(args.calls):
+                llm_client.chat_completion(PROMPT, provider, model, max_tokens=5)
+                print(".", end="", flush=True)
+            print()
+        except llm_client.ProviderError as e:
+            print(f"\n  skipped: {e}")
+
+    report = llm_client.latency_report()
+    print(f"\n{'provider':<10} {'cold ms':>10} {'warm mean ms':>14} {'warm p95 ms':>12}")
+    for provider, stats in report.items():
+        print(f"{provider:<10} {stats['cold']['mean_ms'] or '-':>10} {stats['mean_ms'] or '-':>14} {stats['p95_ms'] or '-':>12}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
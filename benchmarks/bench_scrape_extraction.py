@@ -0,0 +1,164 @@
+"""
+Compare WebDriver round trips and wall time of per-element scraping against extract_page().
+
+Run from the repo root (needs Chrome + selenium, no network):
+    python -m benchmarks.bench_scrape_extraction
+    python -m benchmarks.bench_scrape_extraction --accordions 15 --rows 20 --cols 6 --repeat 5
+
+A local page with Bootstrap-style accordions and one table is generated. The
+per-element path is the old approach: find_elements for every table, row and
+cell, and a click per accordion panel. The single-pass path is one
+execute_script call. Every WebDriver command is counted as one RPC.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from scrapers.page_parsing import tables_to_records
+from utils.utils import create_driver, extract_page
+
+PAGE = """<html><head><title>bench</title><style>
+.collapse {{ display: none; }} .collapse.in {{ display: block; }}
+</style></head><body>
+{panels}
+<table><tr>{header}</tr>{rows}</table>
+<script>
+document.querySelectorAll('.panel-title a').forEach(a => a.addEventListener('click', e => {{
+    e.preventDefault();
+    document.querySelector(a.getAttribute('href')).classList.toggle('in');
+}}));
+</script>
+</body></html>"""
+
+
+def build_page(n_accordions, n_rows, n_cols):
+    panels = "\n".join(
+        f'<div class="panel"><h4 class="panel-title"><a href="#p{i}">Section {i}</a></h4>'
+        f'<div id="p{i}" class="panel-collapse collapse"><div class="panel-body">Body of section {i}<br>line two</div></div></div>'
+        for i in range(n_accordions)
+    )
+    header = "".join(f"<th>Col {c}</th>" for c in range(n_cols))
+    rows = "".join("<tr>" + "".join(f"<td>r{r}c{c}</td>" for c in range(n_cols)) + "</tr>" for r in range(n_rows))
+    return PAGE.format(panels=panels, header=header, rows=rows)
+
+
+def _panel_for(driver, header):
+    """
+    The collapsible panel a .panel-title link controls (its #id href / data-target).
+    """
+    target = header.get_attribute("data-target") or header.get_attribute("href") or ""
+    if "#" in target:
+        panels = driver.find_elements(By.ID, target.split("#", 1)[1])
+        if panels:
+            return panels[0]
+    return None
+
+
+def expand_panel(driver, header, timeout=5):
+    """
+    The previous approach to one panel: opens it and waits until it has finished expanding.
+    Returns the opened .panel-body element.
+    """
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", header)
+    panel = _panel_for(driver, header)
+
+    def is_open(d):
+        classes = (panel.get_attribute("class") or "").split()
+        return "in" in classes and "collapsing" not in classes
+
+    if panel is not None and is_open(driver):
+        return panel.find_element(By.CSS_SELECTOR, ".panel-body")
+
+    try:
+        header.click()
+    except WebDriverException:
+        driver.execute_script("arguments[0].click();", header)
+
+    wait = WebDriverWait(driver, timeout)
+    if panel is None:
+        return wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ".panel-collapse.in .panel-body")))
+    wait.until(is_open)
+    return panel.find_element(By.CSS_SELECTOR, ".panel-body")
+
+
+def per_element_scrape(driver):
+    """The previous approach: one WebDriver call per table, row, cell and panel."""
+    tables = []
+    for table_idx, table in enumerate(driver.find_elements(By.TAG_NAME, "table")):
+        th = [h.text.strip() for h in table.find_elements(By.TAG_NAME, "th")]
+        rows = [[c.text.strip() for c in row.find_elements(By.TAG_NAME, "td")] for row in table.find_elements(By.TAG_NAME, "tr")]
+        tables.append({"th": th, "rows": rows})
+
+    accordions = []
+    for header in driver.find_elements(By.CSS_SELECTOR, ".panel-title a"):
+        title = header.text.strip()
+        accordions.append({"title": title, "content": expand_panel(driver, header).text.strip()})
+    return {"accordions": accordions, "tables": tables_to_records(tables)}
+
+
+def single_pass_scrape(driver):
+    page = extract_page(driver)
+    return {"accordions": page["accordions"], "tables": tables_to_records(page["tables"])}
+
+
+def count_rpcs(driver):
+    """Wrap driver.execute (every WebDriver command goes through it) with a counter."""
+    counter = {"rpcs": 0}
+    execute = driver.execute
+
+    def counted(*args, **kwargs):
+        counter["rpcs"] += 1
+        return execute(*args, **kwargs)
+
+    driver.execute = counted
+    return counter
+
+
+def run(driver, url, scrape, counter, repeat):
+    timings, rpcs = [], []
+    for _ in range(repeat):
+        driver.get(url)  # fresh page: every panel collapsed again
+        counter["rpcs"] = 0
+        start = time.perf_counter()
+        result = scrape(driver)
+        timings.append((time.perf_counter() - start) * 1000)
+        rpcs.append(counter["rpcs"])
+    return result, timings, rpcs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--accordions", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--cols", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".html", prefix="bench_scrape_")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(build_page(args.accordions, args.rows, args.cols))
+
+    driver = create_driver()
+    try:
+        counter = count_rpcs(driver)
+        url = f"file://{path}"
+        old, old_ms, old_rpcs = run(driver, url, per_element_scrape, counter, args.repeat)
+        new, new_ms, new_rpcs = run(driver, url, single_pass_scrape, counter, args.repeat)
+    finally:
+        driver.quit()
+        os.remove(path)
+
+    print(f"\n{args.accordions} accordions, {args.rows}x{args.cols} table, {args.repeat} runs")
+    print(f"  per-element:  {statistics.mean(old_rpcs):6.0f} RPCs | {statistics.mean(old_ms):8.1f} ms")
+    print(f"  extract_page: {statistics.mean(new_rpcs):6.0f} RPCs | {statistics.mean(new_ms):8.1f} ms")
+    print(f"  Speedup: {statistics.mean(old_ms) / statistics.mean(new_ms):.1f}x")
+    print(f"  Same output: {'yes' if old == new else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Compare top-k search latency of the Chroma and NumPy vector store backends.
+
+Run from the repo root:
+    python -m benchmarks.bench_vector_backends
+    python -m benchmarks.bench_vector_backends --docs 2000 --queries 500 --k 8
+
+Query embeddings are precomputed so only the search itself is timed.
+By default a throwaway collection of random vectors is built; pass
+--persist-dir chroma_db to benchmark against the real collection instead.
+"""
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+import numpy as np
+from sunbeam_vectorstore import SunbeamVectorStore
+
+
+def build_random_store(path, n_docs, dim, seed):
+    rng = np.random.default_rng(seed)
+    vs = SunbeamVectorStore(path)
+    embeddings = rng.standard_normal((n_docs, dim), dtype=np.float32)
+    for start in range(0, n_docs, 1000):
+        end = min(start + 1000, n_docs)
+        vs.add_documents(
+            [f"document {i}" for i in range(start, end)],
+            [{"page": "bench", "n": i} for i in range(start, end)],
+            [f"doc_{i}" for i in range(start, end)],
+            embeddings[start:end].tolist()
+        )
+
+
+def time_backend(path, backend, queries, k):
+    current = {}
+    vs = SunbeamVectorStore(path, lambda text: current["q"], backend=backend)
+    current["q"] = queries[0]
+    vs.find_similar_documents("warmup", k)  # loads the numpy matrix / warms the HNSW segment
+
+    timings, results = [], []
+    for q in queries:
+        current["q"] = q
+        start = time.perf_counter()
+        found = vs.find_similar_documents("bench", k)
+        timings.append((time.perf_counter() - start) * 1000)
+        results.append([doc["id"] for doc in found])
+    return timings, results
+
+
+def summarize(name, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{name:>7}: mean {statistics.mean(timings):.3f} ms | p50 {statistics.median(timings):.3f} ms | p95 {p95:.3f} ms | {1000 / statistics.mean(timings):.0f} q/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--persist-dir", help="existing Chroma directory to benchmark (read-only)")
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tmp_dir = None
+    if args.persist_dir:
+        path = args.persist_dir
+        dim = len(SunbeamVectorStore(path).col.get(limit=1, include=["embeddings"])["embeddings"][0])
+    else:
+        tmp_dir = tempfile.mkdtemp(prefix="bench_vs_")
+        path = tmp_dir
+        dim = args.dim
+        print(f"Building random collection: {args.docs} docs x {dim} dims")
+        build_random_store(path, args.docs, dim, args.seed)
+
+    try:
+        queries = np.random.default_rng(args.seed + 1).standard_normal((args.queries, dim), dtype=np.float32).tolist()
+        chroma_timings, chroma_results = time_backend(path, "chroma", queries, args.k)
+        numpy_timings, numpy_results = time_backend(path, "numpy", queries, args.k)
+
+        print(f"\n{args.queries} queries, top-{args.k}")
+        summarize("chroma", chroma_timings)
+        summarize("numpy", numpy_timings)
+        overlap = statistics.mean(len(set(a) & set(b)) / len(a) for a, b in zip(chroma_results, numpy_results) if a)
+        print(f"\nTop-{args.k} overlap (HNSW vs exact): {overlap:.1%}")
+        print(f"Speedup: {statistics.mean(chroma_timings) / statistics.mean(numpy_timings):.1f}x")
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Local OpenAI-compatible mock for benchmarks: /v1/embeddings and /v1/chat/completions.
+
+Embeddings are deterministic pseudo-random unit vectors derived from a hash
+of each input, so the same text always maps to the same vector. Each request
+sleeps for a configurable latency to stand in for network + model time, plus
+a uniform random 0..jitter seconds when jitter is set (a tail to measure).
+Chat completions stream as chunked SSE when the request sets "stream": true.
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+
+def fake_embedding(text, dim=768):
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+    vector = np.random.default_rng(seed).standard_normal(dim)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class MockServer:
+    def __init__(self, host="127.0.0.1", port=0, embed_latency=0.02, chat_latency=0.2, dim=768, reply="This is a mock answer.", jitter=0.0):
+        self.embed_latency = embed_latency
+        self.chat_latency = chat_latency
+        self.jitter = jitter
+        self.dim = dim
+        self.reply = reply
+        self.requests = 0
+        self.counts = {"embeddings": 0, "chat": 0}
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _sleep(self, latency):
+        time.sleep(latency + (random.uniform(0, self.jitter) if self.jitter else 0))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body are separate writes: avoid a ~40 ms delayed-ACK stall per keep-alive request
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, body):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_chunk(self, text):
+                data = text.encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                server.requests += 1
+                if self.path.endswith("/embeddings"):
+                    server.counts["embeddings"] += 1
+                    server._sleep(server.embed_latency)
+                    texts = payload.get("input", [])
+                    texts = [texts] if isinstance(texts, str) else texts
+                    self._send_json({
+                        "data": [{"index": i, "embedding": fake_embedding(t, server.dim)} for i, t in enumerate(texts)]
+                    })
+                elif self.path.endswith("/chat/completions"):
+                    server.counts["chat"] += 1
+                    server._sleep(server.chat_latency)
+                    if not payload.get("stream"):
+                        self._send_json({"choices": [{"message": {"role": "assistant", "content": server.reply}}]})
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    for word in server.reply.split(" "):
+                        chunk = {"choices": [{"delta": {"content": word + " "}}]}
+                        self._send_chunk(f"data: {json.dumps(chunk)}\n\n")
+                    self._send_chunk("data: [DONE]\n\n")
+                    self.wfile.write(b"0\r\n\r\n")
+                else:
+                    self.send_error(404)
+
+        return Handler
@@ -0,0 +1,193 @@
+"""
+BM25 inverted index over the stored chunks, for hybrid and embedding-free retrieval.
+
+The index is built from the vector store's documents (the chunks
+chunking.chunk_all_scraped_data produces) and saved as JSON next to the
+Chroma files. On load it is checked against the store's chunk IDs, which are
+content hashes, so a stale file is rebuilt instead of trusted.
+
+Exact names ("MERN", "GenAI", "Pre-CAT", batch codes) are where BM25 beats
+nomic embeddings; rrf_fuse combines both rankings by reciprocal rank.
+"""
+import hashlib
+import json
+import math
+import os
+import threading
+from collections import Counter
+from fact_store import ALIASES
+from text_terms import word_terms
+
+K1 = 1.5
+B = 0.75
+RRF_K = 60
+INDEX_VERSION = 2  # saved indexes of another version were tokenized differently and are rebuilt
+
+# Function words only: unlike fact_store.STOPWORDS, "fee", "batch" or "program" are real search terms here
+STOPWORDS = {
+    "a", "an", "the", "of", "for", "and", "or", "to", "in", "at", "on", "by", "with", "from", "as", "is", "are", "was",
+    "be", "been", "it", "its", "this", "that", "these", "those", "what", "which", "who", "when", "where", "how", "why",
+    "does", "do", "did", "can", "could", "will", "would", "should", "i", "me", "my", "we", "our", "you", "your",
+    "there", "any", "some", "tell", "about", "give", "please", "much", "many", "sunbeam"
+}
+
+
+def tokenize(text):
+    """Lowercase terms in order (keeping .net, c++, pm-48 plus their hyphen parts), singular, no stopwords."""
+    return word_terms(text, STOPWORDS)
+
+
+def query_groups(question):
+    """One group per question term: the term itself plus the terms of its alias ("genai" -> generative, ai)."""
+    groups = []
+    for term in dict.fromkeys(tokenize(question)):
+        groups.append([term] + [t for alias in ALIASES.get(term, []) for t in tokenize(alias)])
+    return groups
+
+
+def ids_digest(ids):
+    return hashlib.sha256("\n".join(sorted(ids)).encode("utf-8")).hexdigest()
+
+
+def rrf_fuse(rankings, max_results=5, k=RRF_K):
+    """Reciprocal rank fusion: sum of 1 / (k + rank) over the rankings each document appears in."""
+    scores, docs = {}, {}
+    for ranking in rankings:
+        for rank, doc in enumerate(ranking, 1):
+            scores[doc["id"]] = scores.get(doc["id"], 0.0) + 1.0 / (k + rank)
+            if doc.get("distance") is not None or doc["id"] not in docs:
+                docs[doc["id"]] = doc
+    order = sorted(scores, key=scores.get, reverse=True)[:max_results]
+    return [dict(docs[id], rrf_score=scores[id]) for id in order]
+
+
+class BM25Index:
+    """In-memory BM25 (k1=1.5, b=0.75) over every stored chunk, persisted to a JSON file.
+
+    Postings map term -> [(row, term frequency)]; documents and metadata are
+    kept in parallel lists so a lexical search needs neither Chroma nor an
+    embedding. Like NumpyIndex, everything is swapped in as one tuple.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._data = ([], [], [], [], {}, 0.0, "")
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()  # one rebuild at a time when several sessions notice a re-ingest
+
+    @property
+    def loaded(self):
+        return bool(self._data[0])
+
+    @property
+    def digest(self):
+        return self._data[6]
+
+    def build(self, records):
+        """(Re)build from get_all_documents()-style records and save it."""
+        ids, documents, metadatas, lengths, postings = [], [], [], [], {}
+        for row, record in enumerate(records):
+            terms = tokenize(record["document"])
+            ids.append(record["id"])
+            documents.append(record["document"])
+            metadatas.append(record.get("metadata") or {})
+            lengths.append(len(terms))
+            for term, tf in Counter(terms).items():
+                postings.setdefault(term, []).append((row, tf))
+        average = sum(lengths) / len(lengths) if lengths else 0.0
+        self._data = (ids, documents, metadatas, lengths, postings, average, ids_digest(ids))
+        self.save()
+        return len(ids)
+
+    def save(self):
+        ids, documents, metadatas, lengths, postings, _, digest = self._data
+        tmp = f"{self.path}.tmp"
+        with self._lock:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "digest": digest, "ids": ids, "documents": documents, "metadatas": metadatas,
+                           "lengths": lengths, "postings": postings}, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+
+    def load(self):
+        """Read the saved index; False if there is none, it cannot be read or it was built by another INDEX_VERSION."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+        if saved.get("version") != INDEX_VERSION:
+            return False
+        lengths = saved["lengths"]
+        postings = {term: [tuple(p) for p in rows] for term, rows in saved["postings"].items()}
+        average = sum(lengths) / len(lengths) if lengths else 0.0
+        self._data = (saved["ids"], saved["documents"], saved["metadatas"], lengths, postings, average, saved["digest"])
+        return True
+
+    def sync(self, vs, digest=None):
+        """
+        Load the saved index if it matches the store's chunk IDs, otherwise rebuild it from the store.
+        Pass the store's current ids_digest (vs.generation()) when it is already known.
+        """
+        digest = digest or ids_digest(vs.get_ids())
+        with self._sync_lock:
+            if self.loaded and self.digest == digest:
+                return False
+            # Another process (setup_vectorstore.py) may already have saved the index for the new chunks
+            if self.load() and self.digest == digest:
+                return False
+            count = self.build(vs.get_all_documents())
+        print(f"✓ BM25 index: {count} chunks, {len(self._data[4])} terms")
+        return True
+
+    def _idf(self, term, postings, n):
+        df = len(postings.get(term, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def _scores(self, groups):
+        ids, _, _, lengths, postings, average, _ = self._data
+        n = len(ids)
+        scores = {}
+        for term in {t for group in groups for t in group}:
+            idf = self._idf(term, postings, n)
+            for row, tf in postings.get(term, ()):
+                norm = tf + K1 * (1 - B + B * lengths[row] / average)
+                scores[row] = scores.get(row, 0.0) + idf * tf * (K1 + 1) / norm
+        return scores
+
+    def search(self, query_text, max_results=5):
+        """Top-k chunks by BM25 score, same record shape as find_similar_documents (distance None, plus "score")."""
+        ids, documents, metadatas, _, _, _, _ = self._data
+        scores = self._scores(query_groups(query_text))
+        top = sorted(scores, key=lambda row: (-scores[row], row))[:max_results]
+        return [
+            {"id": ids[row], "document": documents[row], "metadata": metadatas[row], "distance": None, "score": scores[row]}
+            for row in top
+        ]
+
+    def confidence(self, query_text, min_terms):
+        """
+        Share of the question's idf weight that the best chunk covers, in [0, 1].
+        A group (term or its alias) counts if the chunk has the term or every alias term;
+        words the corpus never uses weigh as much as the rarest word, so they pull confidence down.
+        Questions with fewer than min_terms content terms get 0.0: one matched word says nothing about intent.
+        """
+        ids, _, _, _, postings, _, _ = self._data
+        groups = query_groups(query_text)
+        if not ids or len(groups) < max(min_terms, 1):
+            return 0.0
+        scores = self._scores(groups)
+        if not scores:
+            return 0.0
+        best = max(scores, key=lambda row: (scores[row], -row))
+        n = len(ids)
+        max_idf = math.log(1 + (n - 0.5) / 1.5)
+        total = covered = 0.0
+        for term, *alias in groups:
+            rows = {row for row, _ in postings.get(term, ())}
+            known = [t for t in [term, *alias] if t in postings]
+            weight = max((self._idf(t, postings, n) for t in known), default=max_idf)
+            total += weight
+            alias_rows = set.intersection(*({row for row, _ in postings.get(t, ())} for t in alias)) if alias else set()
+            if best in rows or best in alias_rows:
+                covered += weight
+        return covered / total
@@ -1,4 +1,4 @@
-from sunbeam_rag_simple import SunbeamRAG
+from sunbeam_rag_simple import get_engine
 
 def main():
     print("=" * 60)
@@ -7,7 +7,7 @@ def main():
     print("Initializing RAG system...")
     
     # Initialize RAG
-    rag = SunbeamRAG()
+    rag = get_engine()
     
     print("✓ Ready! Ask me anything about Sunbeam Institute.")
     print("(Type 'exit' or 'quit' to stop)\n")
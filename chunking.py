@@ -1,16 +1,52 @@
 from langchain_core.documents import Document
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+import hashlib
 import json
+import multiprocessing
+import os
 import re
 
-def simple_chunk_text(text, chunk_size=800, overlap=100):
-    if len(text) <= chunk_size:
-        return [text]
-    chunks = []
-    start = 0
-    while start < len(text):
-        chunks.append(text[start:start + chunk_size])
-        start += chunk_size - overlap
-    return chunks
+CHUNK_MAX_TOKENS = int(os.getenv("CHUNK_MAX_TOKENS", 256))
+CHUNK_OVERLAP_TOKENS = int(os.getenv("CHUNK_OVERLAP_TOKENS", 32))
+CHUNK_WORKERS = int(os.getenv("CHUNK_WORKERS", os.cpu_count() or 1))
+CHUNK_PARALLEL_MIN_BYTES = int(os.getenv("CHUNK_PARALLEL_MIN_BYTES", 64 * 1024 * 1024))
+
+# One scan classifies every token and every gap between tokens. Word-level tokens approximate the
+# nomic (BERT WordPiece) tokenizer from below, so CHUNK_MAX_TOKENS should leave some headroom.
+TOKEN_RE = re.compile(r"(?P<paragraph>\n[ \t]*\n\s*)|(?P<line>\n\s*)|(?P<sentence>(?<=[.!?])\s+)|(?P<word>\s+)|(?P<token>\w+|[^\w\s])")
+BREAK_LEVELS = {"word": 0, "sentence": 1, "line": 2, "paragraph": 3}
+
+def count_tokens(text):
+    return sum(1 for m in TOKEN_RE.finditer(text) if m.lastgroup == "token")
+
+def token_spans(text, max_tokens=CHUNK_MAX_TOKENS, overlap=CHUNK_OVERLAP_TOKENS):
+    """
+    Split text into (start, end) character offsets of at most max_tokens tokens each, in a single pass.
+    Chunks end at the strongest break (paragraph > line > sentence > word) in the second half of the
+    window, and the next chunk starts about overlap tokens earlier, at a sentence or line start when possible.
+    """
+    starts = []      # character offset of every token seen
+    breaks = []      # (level, token index, character offset) of the gaps inside the current window
+    spans = []
+    first = 0        # token index the current chunk starts at
+    end = 0
+    for m in TOKEN_RE.finditer(text):
+        if m.lastgroup != "token":
+            breaks.append((BREAK_LEVELS[m.lastgroup], len(starts), m.start()))
+            continue
+        if len(starts) - first == max_tokens:
+            candidates = [b for b in breaks if b[1] > first + max_tokens // 2]
+            _, cut, cut_at = max(candidates, key=lambda b: (b[0], b[1])) if candidates else (0, len(starts), m.start())
+            spans.append((starts[first], cut_at))
+            restart = max(cut - overlap, first + 1)
+            first = next((b[1] for b in breaks if restart <= b[1] < cut and b[0] >= BREAK_LEVELS["sentence"]), restart)
+            breaks = [b for b in breaks if b[1] > first]
+        starts.append(m.start())
+        end = m.end()
+    if first < len(starts):
+        spans.append((starts[first], end))
+    return spans
 
 def create_doc(content, page, type, url, source, **extra):
     return Document(
@@ -18,20 +54,27 @@ def create_doc(content, page, type, url, source, **extra):
         metadata={"page": page, "section_type": type, "url": url, "source": source, **extra}
     )
 
+def chunk_id(doc):
+    """Stable content-hash ID for a chunk: identical text and metadata always map to the same ID."""
+    payload = json.dumps({"content": doc.page_content, "metadata": doc.metadata}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
 def chunk_sections(sections, page, url, source):
     docs = []
     for s in sections:
         title, content = s.get('title', ''), s.get('content', '').strip()
         if not content:
             continue
-        chunks = chunk_text_if_large(title, content)
-        for i, chunk in enumerate(chunks):
-            extra = {"chunk_index": i, "total_chunks": len(chunks)} if len(chunks) > 1 else {}
-            docs.append(create_doc(f"{title}\n\n{chunk}", page, "accordion", url, source, section_title=title, **extra))
+        spans = chunk_spans_if_large(title, content)
+        for i, (start, end) in enumerate(spans):
+            extra = {"chunk_index": i, "total_chunks": len(spans), "char_start": start, "char_end": end} if len(spans) > 1 else {}
+            docs.append(create_doc(f"{title}\n\n{content[start:end]}", page, "accordion", url, source, section_title=title, **extra))
     return docs
 
-def chunk_text_if_large(title, content, max_size=1000):
-    return [content] if len(f"{title}\n\n{content}") <= max_size else simple_chunk_text(content)
+def chunk_spans_if_large(title, content, max_tokens=CHUNK_MAX_TOKENS, overlap=CHUNK_OVERLAP_TOKENS):
+    """Character offsets into content of each chunk; the title header is counted against every chunk's budget."""
+    budget = max(max_tokens - count_tokens(title), max_tokens // 2)
+    return token_spans(content, budget, overlap) if count_tokens(content) > budget else [(0, len(content))]
 
 def chunk_about_us_data(data):
     docs = []
@@ -91,10 +134,10 @@ def chunk_mcq_course_data(data):
         if not (content := s.get('content', '').strip()):
             continue
         title = s.get('title', '')
-        chunks = chunk_text_if_large(f"{name} - {title}", content)
-        for i, chunk in enumerate(chunks):
-            extra = {"chunk_index": i, "total_chunks": len(chunks)} if len(chunks) > 1 else {}
-            docs.append(create_doc(f"{name} - {title}\n\n{chunk}", "modular_courses", "course_section", url, "sunbeam_mcq_course", course_name=name, section_title=title, **extra))
+        spans = chunk_spans_if_large(f"{name} - {title}", content)
+        for i, (start, end) in enumerate(spans):
+            extra = {"chunk_index": i, "total_chunks": len(spans), "char_start": start, "char_end": end} if len(spans) > 1 else {}
+            docs.append(create_doc(f"{name} - {title}\n\n{content[start:end]}", "modular_courses", "course_section", url, "sunbeam_mcq_course", course_name=name, section_title=title, **extra))
     return docs
 
 def chunk_contact_data(data):
@@ -108,23 +151,85 @@ def chunk_contact_data(data):
         docs.append(create_doc("Sunbeam Institute Phone Numbers:\n\n" + "\n".join(phones), "contact", "phones", url, "sunbeam_contact"))
     return docs
 
+# page type -> "source" metadata of the chunks it produces
+CHUNK_SOURCES = {'about_us': 'sunbeam_about_us', 'internship': 'sunbeam_internship', 'precat': 'sunbeam_precat', 'modular_courses': 'sunbeam_modular_courses', 'mcq_course': 'sunbeam_mcq_course', 'contact': 'sunbeam_contact'}
+
+CHUNKERS = {'about_us': chunk_about_us_data, 'internship': chunk_internship_data, 'precat': chunk_precat_data, 'modular_courses': chunk_modular_courses_list, 'mcq_course': chunk_mcq_course_data, 'contact': chunk_contact_data}
+
+def chunk_file(page_type, file_path):
+    """
+    Load and chunk one source file -> (page_type, docs, log line); docs is None when the file is missing or cannot be chunked.
+    Runs in a worker process, so it returns its log line instead of printing.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            docs = CHUNKERS[page_type](json.load(f))
+    except FileNotFoundError:
+        return page_type, None, f"⚠ {file_path} not found"
+    except Exception as e:
+        return page_type, None, f"❌ {page_type}: {e}"
+    return page_type, docs, f"✓ {page_type}: {len(docs)} chunks"
+
+def _mp_context():
+    """forkserver with this module preloaded (workers fork from a single-threaded, already-imported server), spawn on Windows."""
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
+def _chunk_in_processes(jobs, workers):
+    """Run chunk_file over jobs in a process pool, at most 2 * workers files in flight, yielding results as they finish."""
+    jobs = iter(jobs)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context()) as pool:
+        pending = {pool.submit(chunk_file, *job) for job in islice(jobs, 2 * workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            pending |= {pool.submit(chunk_file, *job) for job in islice(jobs, len(done))}
+            for future in done:
+                yield future.result()
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def iter_chunks(file_paths, workers=CHUNK_WORKERS, min_parallel_bytes=CHUNK_PARALLEL_MIN_BYTES, failed=None):
+    """
+    Yield chunks source file by source file. Once the sources add up to min_parallel_bytes, the
+    per-source chunkers run in up to `workers` processes and files are yielded in completion order.
+    Below that, starting the pool costs more than it saves.
+
+    Page types whose file could not be read or chunked are added to the `failed` set, if one is given.
+    """
+    jobs = [(page_type, file_path) for page_type, file_path in file_paths.items() if page_type in CHUNKERS]
+    workers = min(workers, len(jobs))
+    if workers > 1 and sum(_file_size(file_path) for _, file_path in jobs) >= min_parallel_bytes:
+        results = _chunk_in_processes(jobs, workers)
+    else:
+        results = (chunk_file(*job) for job in jobs)
+    for page_type, docs, message in results:
+        print(message)
+        if docs is None:
+            if failed is not None:
+                failed.add(page_type)
+            continue
+        yield from docs
+
+def batched(iterable, size):
+    """Group an iterable into lists of at most size items, lazily."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 def chunk_all_scraped_data(file_paths):
-    all_docs = []
-    chunkers = {'about_us': chunk_about_us_data, 'internship': chunk_internship_data, 'precat': chunk_precat_data, 'modular_courses': chunk_modular_courses_list, 'mcq_course': chunk_mcq_course_data, 'contact': chunk_contact_data}
-    
-    for page_type, file_path in file_paths.items():
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            if chunker := chunkers.get(page_type):
-                docs = chunker(data)
-                all_docs.extend(docs)
-                print(f"✓ {page_type}: {len(docs)} chunks")
-        except FileNotFoundError:
-            print(f"⚠ {file_path} not found")
-        except Exception as e:
-            print(f"❌ {page_type}: {e}")
-    
+    all_docs = list(iter_chunks(file_paths))
     print(f"\n✓ Total: {len(all_docs)} chunks\n")
     return all_docs
 
@@ -0,0 +1,133 @@
+"""
+Assemble retrieved chunks into the prompt context under a token budget.
+
+Between find_similar_documents and the LLM call: adjacent / overlapping
+chunks of the same section are merged back into one passage (using the
+char_start / char_end offsets the chunker records), near-duplicates are
+dropped, the rest is ordered by maximal marginal relevance, and chunks
+are packed until the provider/model budget is used up.
+"""
+import math
+import os
+import re
+from collections import Counter
+from chunking import count_tokens, token_spans
+
+# Context tokens (chunker tokens, see chunking.count_tokens) per provider; models listed in MODEL_BUDGETS override it
+PROVIDER_BUDGETS = {"Groq": 1000, "Gemini": 1000, "LM Studio": 800}
+MODEL_BUDGETS = {"llama-3.2-1b-instruct": 600}
+DEFAULT_BUDGET = 1000
+MMR_LAMBDA = float(os.getenv("CONTEXT_MMR_LAMBDA", 0.7))
+DUPLICATE_THRESHOLD = 0.8
+
+
+def context_budget(provider, model=None):
+    """CONTEXT_TOKEN_BUDGET overrides everything; otherwise the model's, then the provider's budget."""
+    if budget := os.getenv("CONTEXT_TOKEN_BUDGET"):
+        return int(budget)
+    return MODEL_BUDGETS.get(model, PROVIDER_BUDGETS.get(provider, DEFAULT_BUDGET))
+
+
+def _words(text):
+    return re.findall(r"\w+", text.lower())
+
+
+def _shingles(words, n=5):
+    return {tuple(words[i:i + n]) for i in range(max(len(words) - n + 1, 1))}
+
+
+def _span(doc):
+    metadata = doc.get("metadata") or {}
+    if "char_start" not in metadata:
+        return None
+    return (metadata.get("source"), metadata.get("url"), metadata.get("section_title")), metadata["char_start"], metadata["char_end"]
+
+
+def _merge(a, b):
+    """One passage from two chunks of the same section whose spans overlap or touch, else None."""
+    span_a, span_b = _span(a), _span(b)
+    if not span_a or not span_b or span_a[0] != span_b[0]:
+        return None
+    (first, (_, start, end)), (second, (_, next_start, next_end)) = sorted([(a, span_a), (b, span_b)], key=lambda pair: pair[1][1])
+    if next_start > end:
+        return None
+    # Chunk text is "<header>\n\n" + section[start:end], so the body is the last (end - start) characters
+    text = first["document"]
+    if next_end > end:
+        text += second["document"][len(second["document"]) - (next_end - end):]
+    distances = [d["distance"] for d in (a, b) if d.get("distance") is not None]
+    return dict(
+        first,
+        document=text,
+        metadata=dict(first["metadata"], char_end=max(end, next_end)),
+        distance=min(distances) if distances else None
+    )
+
+
+def dedupe(docs, threshold=DUPLICATE_THRESHOLD):
+    """Merge overlapping chunks of a section; drop chunks whose 5-word shingles are mostly contained in a better-ranked one."""
+    kept = []
+    for doc in docs:
+        shingles = _shingles(_words(doc["document"]))
+        for i, (other, other_shingles) in enumerate(kept):
+            if merged := _merge(other, doc):
+                kept[i] = (merged, _shingles(_words(merged["document"])))
+                break
+            if len(shingles & other_shingles) >= threshold * min(len(shingles), len(other_shingles)):
+                break
+        else:
+            kept.append((doc, shingles))
+    return [doc for doc, _ in kept]
+
+
+def _cosine(a, b):
+    dot = sum(count * b.get(word, 0) for word, count in a.items())
+    norm = math.sqrt(sum(c * c for c in a.values())) * math.sqrt(sum(c * c for c in b.values()))
+    return dot / norm if norm else 0.0
+
+
+def mmr(docs, mmr_lambda=MMR_LAMBDA):
+    """
+    Greedy maximal-marginal-relevance order. Relevance is the retrieval distance rescaled to [0, 1]
+    (rank when there is none); redundancy is word-count cosine to the chunks already picked.
+    """
+    if len(docs) < 2 or mmr_lambda >= 1:
+        return list(docs)
+    distances = [doc.get("distance") for doc in docs]
+    if None in distances or max(distances) == min(distances):
+        relevance = [1 - i / len(docs) for i in range(len(docs))]
+    else:
+        low, high = min(distances), max(distances)
+        relevance = [1 - (d - low) / (high - low) for d in distances]
+    vectors = [Counter(_words(doc["document"])) for doc in docs]
+
+    order, remaining = [], list(range(len(docs)))
+    while remaining:
+        best = max(remaining, key=lambda i: mmr_lambda * relevance[i] - (1 - mmr_lambda) * max((_cosine(vectors[i], vectors[j]) for j in order), default=0.0))
+        order.append(best)
+        remaining.remove(best)
+    return [docs[i] for i in order]
+
+
+def pack(docs, budget):
+    """Take chunks in order while they fit; if even the first does not fit, keep its head up to a line/sentence break."""
+    packed, used = [], 0
+    for doc in docs:
+        tokens = count_tokens(doc["document"])
+        if used + tokens <= budget:
+            packed.append(doc)
+            used += tokens
+        elif not packed and budget > 0:
+            start, end = token_spans(doc["document"], budget, 0)[0]
+            packed.append(dict(doc, document=doc["document"][start:end]))
+            used = budget
+    return packed
+
+
+def build_context(docs, budget, mmr_lambda=MMR_LAMBDA):
+    """Retrieved docs (find_similar_documents results) -> the docs to put in the prompt, most relevant first."""
+    return pack(mmr(dedupe(docs), mmr_lambda), budget)
+
+
+def format_context(docs):
+    return "\n\n".join(doc["document"] for doc in docs)
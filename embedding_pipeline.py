@@ -0,0 +1,69 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class EmbeddingPipeline:
+    """Batched, concurrent client for an OpenAI-compatible /embeddings endpoint.
+
+    Texts are split into `batch_size` batches that are sent by at most
+    `max_workers` threads over one pooled keep-alive session (pass `session`
+    to share an existing pool). A batch that keeps failing after
+    `max_retries` attempts is split in half and retried, so one bad input
+    only costs its own batch instead of the whole run.
+    Connection failures are not split: if the server is down, `embed` raises.
+    """
+
+    def __init__(self, base_url, model, batch_size=32, max_workers=4, max_retries=3, backoff=0.5, timeout=(5, 120), session=None):
+        self.url = f"{base_url}/embeddings"
+        self.model = model
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def embed(self, texts):
+        """Embed texts, preserving input order."""
+        texts = list(texts)
+        if not texts:
+            return []
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        if len(batches) == 1:
+            return self._embed_batch(batches[0])
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            results = pool.map(self._embed_batch, batches)
+            return [embedding for batch in results for embedding in batch]
+
+    def _post(self, texts):
+        response = self.session.post(self.url, json={"input": texts, "model": self.model}, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()["data"]
+        if len(data) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, got {len(data)}")
+        data = sorted(enumerate(data), key=lambda pair: pair[1].get("index", pair[0]))
+        return [item["embedding"] for _, item in data]
+
+    def _embed_batch(self, texts):
+        for attempt in range(self.max_retries):
+            try:
+                return self._post(texts)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries - 1:
+                    raise
+            except (requests.RequestException, KeyError, ValueError) as e:
+                if attempt == self.max_retries - 1:
+                    if len(texts) == 1:
+                        raise
+                    print(f"⚠ Embedding batch of {len(texts)} failed ({e}), splitting")
+                    mid = len(texts) // 2
+                    return self._embed_batch(texts[:mid]) + self._embed_batch(texts[mid:])
+            time.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5))
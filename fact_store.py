@@ -0,0 +1,256 @@
+import json
+import re
+import sqlite3
+import threading
+from text_terms import WORD, word_terms
+
+# One row of a "Batch schedule" block: Sr.No, batch code, [duration], start, end, time, [fees]
+BATCH_LINE = re.compile(
+    r"^\d+\s+(?P<batch>.+?)\s+(?:(?P<duration>\d+\s*Hrs?)\s+)?"
+    r"(?P<start_date>\d{1,2}-[A-Za-z]{3}-\d{4})\s+(?P<end_date>\d{1,2}-[A-Za-z]{3}-\d{4})\s+"
+    r"(?P<time>\d{1,2}:\d{2}\s*[AP]M\s+To\s+\d{1,2}:\d{2}\s*[AP]M)(?:\s+(?P<fees>[\d,]+/-))?",
+    re.IGNORECASE
+)
+SCHEDULE_LINE = re.compile(r"^Schedule\s*:\s*(?P<schedule>.+)$", re.IGNORECASE)
+
+# Words that say which fact is wanted rather than which offering
+FACETS = {
+    "fees": re.compile(r"(?<!\w)(?:fees?|costs?|price|pricing|charges?|how much)(?!\w)"),
+    "schedule": re.compile(r"(?<!\w)(?:batch(?:es)?|schedules?|dates?|start\w*|begin\w*|when|timings?|time|end\w*)(?!\w)"),
+    "duration": re.compile(r"(?<!\w)(?:duration|how long|hours|hrs|months?|weeks?)(?!\w)"),
+}
+STOPWORDS = {
+    "a", "an", "the", "of", "for", "and", "to", "in", "at", "on", "with", "using", "is", "it", "what", "which", "when",
+    "how", "much", "long", "does", "do", "i", "me", "my", "are", "there", "sunbeam", "fee", "cost", "price", "charge",
+    "batch", "start", "end", "date", "schedule", "time", "timing", "duration", "program", "programming",
+    "development", "training", "o", "next", "upcoming", "tell", "about", "give", "please", "per", "each", "structure",
+    "can", "could", "will", "would", "be", "have", "pay", "all", "any", "show", "list", "know", "want", "need", "we",
+    "you", "your", "this", "that", "these", "those", "many", "detail", "info", "information", "hi", "hello"
+}
+# Question spellings -> the terms the scraped names use
+ALIASES = {
+    "genai": ["generative", "ai"], "ml": ["machine", "learning"], "dsa": ["data", "structures", "algorithms"],
+    "cpp": ["c++"], "dotnet": [".net"], "precat": ["pre-cat"], "mcq": ["mcqs"], "iot": ["internet", "things"]
+}
+KIND_TERMS = {"internship": ["internship"], "precat": ["pre-cat"], "course": ["course", "modular"]}
+# page type -> kind of the batches it holds; a kind whose files do not all load keeps its previous rows
+SOURCE_KINDS = {"internship": "internship", "precat": "precat", "modular_courses": "course", "mcq_course": "course"}
+
+
+def terms_of(text):
+    """Lowercase words (keeping .net, c++, pm-48), their hyphen parts and joined form, singular, no stopwords."""
+    return set(word_terms(text, STOPWORDS, joined=True))
+
+
+def name_terms(question):
+    """Terms of the words written like an offering or batch name: capitalized, or with a digit, '-', '+', '#' or '.'"""
+    words = [word for word in WORD.findall(question) if word[0].isupper() or re.search(r"[\d+#.-]", word)]
+    return terms_of(" ".join(words))
+
+
+def query_terms(question):
+    terms = terms_of(question)
+    for term in list(terms):
+        for alias in ALIASES.get(term, []):
+            terms |= terms_of(alias)
+    return terms
+
+
+KIND_WORDS = {kind: set().union(*(terms_of(word) for word in words)) for kind, words in KIND_TERMS.items()}
+
+
+def normalize_fees(fees):
+    amount = re.search(r"\d[\d,]*", fees or "")
+    return f"Rs. {amount.group()}/-" if amount else ""
+
+
+def parse_batch_schedule(text):
+    """Rows of a scraped "Batch schedule" text block, with the block's "Schedule :" line applied to each."""
+    rows, schedule = [], ""
+    for line in text.splitlines():
+        line = line.strip()
+        if m := BATCH_LINE.match(line):
+            rows.append({k: " ".join((v or "").split()) for k, v in m.groupdict().items()})
+        elif m := SCHEDULE_LINE.match(line):
+            schedule = m.group("schedule").strip()
+    for row in rows:
+        row["schedule"] = schedule
+        row["fees"] = normalize_fees(row["fees"])
+    return rows
+
+
+def _schedule_sections(sections):
+    return [s.get("content", "") for s in sections if "batch" in s.get("title", "").lower() and "schedule" in s.get("title", "").lower()]
+
+
+def extract_facts(file_paths):
+    """
+    (batches, programs, failed) from the scraped JSON files; batches carry kind, offering, fees, dates and duration.
+    failed is the set of page types in SOURCE_KINDS whose file is missing or not valid JSON.
+    """
+    data = {}
+    for page_type, path in file_paths.items():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data[page_type] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"⚠ Fact store: cannot read {path}: {e}")
+
+    batches, programs = [], []
+    internship = data.get("internship", {})
+    url = "https://sunbeaminfo.in/internship"
+    for b in internship.get("batches", []):
+        code = b.get("Batch", "")
+        batches.append({
+            "kind": "internship", "offering": re.sub(r"^IIT-[\w-]*?-A-", "", code), "batch": code,
+            "duration": b.get("Batch Duration", ""), "start_date": b.get("Start Date", ""), "end_date": b.get("End Date", ""),
+            "time": " ".join(b.get("Time", "").split()), "schedule": "", "fees": normalize_fees(b.get("Fees (Rs.)")), "url": url
+        })
+    for p in internship.get("programs", []):
+        programs.append({"technology": p.get("Technology", "N/A"), "aim": p.get("Aim", ""), "prerequisite": p.get("Prerequisite", ""),
+                         "learning": p.get("Learning", ""), "location": p.get("Location", "N/A")})
+
+    for text in _schedule_sections(data.get("precat", {}).get("accordion_sections", [])):
+        for row in parse_batch_schedule(text):
+            batches.append(dict(row, kind="precat", offering="Pre-CAT", url="https://www.sunbeaminfo.in/pre-cat"))
+
+    mcq = data.get("mcq_course", {})
+    courses = list((data.get("modular_courses") or {}).get("courses", []))
+    if mcq:
+        courses = [c for c in courses if c.get("course_name") != mcq.get("course_name")] + [mcq]
+    for course in courses:
+        info = course.get("basic_info", {})
+        for text in _schedule_sections(course.get("sections", [])):
+            for row in parse_batch_schedule(text):
+                batches.append(dict(
+                    row, kind="course", offering=course.get("course_name", ""), url=course.get("url", ""),
+                    duration=row["duration"] or info.get("duration", ""), fees=row["fees"] or normalize_fees(info.get("fees")),
+                    schedule=row["schedule"] or info.get("schedule", "")
+                ))
+    return batches, programs, {page_type for page_type in SOURCE_KINDS if page_type not in data}
+
+
+class FactStore:
+    """Batches (fees, dates, timings, durations) and internship programs in SQLite, rebuilt at ingestion.
+
+    Every batch is indexed by the terms of its offering name and batch code,
+    so a fee / schedule / duration question is answered with one indexed
+    lookup instead of retrieval and an LLM call. Kind words in the question
+    ("internship", "course", "pre-cat") only narrow the kind.
+    """
+
+    SCHEMA_VERSION = 2  # 1: kind words are no longer indexed as name terms; 2: "-es" plurals stemmed
+    COLUMNS = ("kind", "offering", "batch", "duration", "start_date", "end_date", "time", "schedule", "fees", "url")
+    INSERT_BATCH = f"INSERT INTO batches ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+    def __init__(self, path="facts.sqlite3", max_rows=12):
+        self.path = path
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(
+            "CREATE TABLE IF NOT EXISTS batches (id INTEGER PRIMARY KEY, kind TEXT, offering TEXT, batch TEXT, duration TEXT,"
+            " start_date TEXT, end_date TEXT, time TEXT, schedule TEXT, fees TEXT, url TEXT);"
+            "CREATE TABLE IF NOT EXISTS terms (term TEXT NOT NULL, batch_id INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_terms_term ON terms(term);"
+            "CREATE TABLE IF NOT EXISTS programs (technology TEXT, aim TEXT, prerequisite TEXT, learning TEXT, location TEXT);"
+        )
+        if self.db.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+            # Rows indexed by an older version are dropped; the store is empty, so SunbeamRAG rebuilds it
+            self.db.executescript("DELETE FROM terms; DELETE FROM batches; DELETE FROM programs;")
+            self.db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.db.commit()
+
+    def is_empty(self):
+        with self._lock:
+            return self.db.execute("SELECT COUNT(*) FROM batches").fetchone()[0] == 0
+
+    def rebuild(self, file_paths):
+        """Replace the facts with what the scraped files contain now; kinds whose files cannot be read keep their previous rows."""
+        batches, programs, failed = extract_facts(file_paths)
+        kept = {SOURCE_KINDS[page_type] for page_type in failed}
+        kinds = [kind for kind in KIND_TERMS if kind not in kept]
+        batches = [batch for batch in batches if batch["kind"] in kinds]
+        placeholders = ",".join("?" * len(kinds))
+        with self._lock, self.db:
+            self.db.execute(f"DELETE FROM terms WHERE batch_id IN (SELECT id FROM batches WHERE kind IN ({placeholders}))", kinds)
+            self.db.execute(f"DELETE FROM batches WHERE kind IN ({placeholders})", kinds)
+            for batch in batches:
+                cursor = self.db.execute(self.INSERT_BATCH, [batch.get(c, "") for c in self.COLUMNS])
+                terms = terms_of(f"{batch['offering']} {batch['batch']}")
+                self.db.executemany("INSERT INTO terms (term, batch_id) VALUES (?, ?)", [(t, cursor.lastrowid) for t in terms])
+            if "internship" not in kept:
+                self.db.execute("DELETE FROM programs")
+                self.db.executemany(
+                    "INSERT INTO programs VALUES (?, ?, ?, ?, ?)",
+                    [(p["technology"], p["aim"], p["prerequisite"], p["learning"], p["location"]) for p in programs]
+                )
+        print(f"✓ Fact store: {len(batches)} batches, {len(programs)} programs" + (f" (kept previous {', '.join(sorted(kept))} rows)" if kept else ""))
+        return len(batches), len(programs)
+
+    def lookup(self, question):
+        """
+        Best-matching batches: each term of an offering name or batch code found in the question scores
+        1 / (number of batches carrying it), ties kept. Kind words only narrow the kind.
+
+        A question that names something the index does not know ("Kubernetes course") gets [];
+        one that names nothing but a kind ("internship fees") gets every batch of that kind.
+        Only words written like a name (see name_terms) can be unknown names, so plain English
+        ("What is the fees structure of internship?") does not cause a miss.
+        """
+        terms = query_terms(question)
+        kinds = [kind for kind, words in KIND_WORDS.items() if terms & words]
+        placeholders = ",".join("?" * len(terms))
+        with self._lock:
+            known = {row[0] for row in self.db.execute(f"SELECT DISTINCT term FROM terms WHERE term IN ({placeholders})", list(terms))}
+            kind_words = set().union(*KIND_WORDS.values())
+            # an alias ("GenAI") is known when the terms it stands for are
+            unknown = {term for term in name_terms(question) - known - kind_words if not query_terms(term) & known}
+            if not known and (unknown or not kinds):
+                return []
+            kind_filter = f" AND b.kind IN ({','.join('?' * len(kinds))})" if kinds else ""
+            if known:
+                rows = self.db.execute(
+                    "SELECT b.*, SUM(1.0 / d.df) AS score FROM terms t"
+                    " JOIN (SELECT term, COUNT(*) AS df FROM terms GROUP BY term) d ON d.term = t.term"
+                    f" JOIN batches b ON b.id = t.batch_id WHERE t.term IN ({','.join('?' * len(known))}){kind_filter}"
+                    " GROUP BY b.id ORDER BY score DESC, b.id",
+                    list(known) + kinds
+                ).fetchall()
+            else:
+                rows = self.db.execute(f"SELECT b.*, 0 AS score FROM batches b WHERE 1{kind_filter} ORDER BY b.id", kinds).fetchall()
+        if not rows:
+            return []
+        best = rows[0]["score"]
+        return [dict(row) for row in rows if row["score"] >= best - 1e-9]
+
+    def answer(self, question):
+        """Fee / schedule / duration answer from the best-matching batches, or None to fall back to retrieval + LLM."""
+        question_lower = question.lower()
+        facets = [name for name, pattern in FACETS.items() if pattern.search(question_lower)] or list(FACETS)
+        lines = []
+        for row in self.lookup(question):
+            parts = []
+            if "fees" in facets and row["fees"]:
+                parts.append(f"Fees: {row['fees']}")
+            if "duration" in facets and row["duration"]:
+                parts.append(f"Duration: {row['duration']}")
+            if "schedule" in facets and row["start_date"]:
+                schedule = f"{row['start_date']} to {row['end_date']}, {row['time']}" + (f" ({row['schedule']})" if row["schedule"] else "")
+                parts.append(f"Schedule: {schedule}")
+            if parts:
+                lines.append(f"• {row['offering']} ({row['kind']}, batch {row['batch']}) - " + " | ".join(parts))
+        if not lines:
+            return None
+        more = f"\n…and {len(lines) - self.max_rows} more batches" if len(lines) > self.max_rows else ""
+        return "From Sunbeam's batch schedule:\n\n" + "\n".join(lines[:self.max_rows]) + more
+
+    def programs(self):
+        with self._lock:
+            rows = self.db.execute("SELECT technology, location FROM programs WHERE technology != 'N/A' GROUP BY technology, location ORDER BY MIN(rowid)").fetchall()
+        return [{'technology': row["technology"], 'location': row["location"]} for row in rows]
+
+    def close(self):
+        with self._lock:
+            self.db.close()
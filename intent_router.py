@@ -0,0 +1,168 @@
+"""
+Question -> intent routing shared by the CLI (SunbeamRAG.query) and the dashboard.
+
+Every keyword is compiled into one regex, so a question is routed in a single
+pass over its text. Questions the keywords leave for the LLM can also be
+compared against embedding centroids of example phrasings, so rephrased
+listing / contact / fee questions still reach the structured handlers.
+"""
+import re
+import threading
+from collections import namedtuple
+import numpy as np
+
+Route = namedtuple("Route", ["intent", "is_list"])
+
+INTENTS = ("contact", "fees", "schedule", "internship_programs", "course_list", "llm")
+
+# keyword (regex fragment, matched as whole words) -> features it sets
+KEYWORDS = {
+    # contact details
+    r"e-?mails?": {"contact"}, r"contact": {"contact"}, r"phones?": {"contact"}, r"mobile": {"contact"},
+    r"numbers?": {"contact"}, r"address(?:es)?": {"contact"}, r"reach": {"contact"}, r"whatsapp": {"contact"},
+    # what the question is about; plurals count towards a listing request
+    r"internship": {"internship", "topic"}, r"internships": {"internship", "topic", "plural"},
+    r"program|programme": {"program", "topic"}, r"programs|programmes": {"program", "topic", "plural"},
+    r"course": {"course", "topic"}, r"courses": {"course", "topic", "plural"}, r"modular": {"course", "topic"},
+    r"pre-?cat": {"topic", "specific"},
+    # money
+    r"fees?|costs?|price|pricing|charges?|how much": {"fee"},
+    # asking for a listing: outright, or a question that is only a listing with a plural noun
+    r"list|all|every|show|enumerate|give me": {"list"},
+    r"what are|which|available|offered|do you have": {"ask"},
+    # details that a plain listing cannot answer
+    r"batch(?:es)?|schedules?|dates?|start|starts|begin|timings?|when|duration|how long": {"detail", "schedule"},
+    r"where|how": {"detail"},
+    r"eligib\w*|prerequisites?|syllabus|contents?|learn\w*|teach\w*|aim|compare|difference": {"detail"},
+    r"benefits?|features?|placements?|certificates?|structure|mode|why": {"detail"},
+    r"details?|about|related|regarding": {"detail"},
+    r"hinjawadi|karad|market ?yard|online|offline": {"detail"},
+    # specific technologies: a question about one of them is not a request for the whole list
+    r"java|python|mern|genai|generative ai|android|web|\.net|dotnet|c\+\+|c programming|data science": {"specific"},
+    r"machine learning|ml|cyber security|cyber|arm|embedded|devops|dev ops|spark|llm|mlops|aptitude|mcqs?|dsa": {"specific"},
+    r"ai|artificial intelligence|c-?dac|dac|dbda|desd|ditiss|dmc|dvlsi|pg-?dac|pg-?dbda": {"specific"},
+}
+
+# Example phrasings per intent for the embedding classifier; "llm" is the catch-all to beat
+PROTOTYPES = {
+    "contact": [
+        "How can I get in touch with Sunbeam?",
+        "What is Sunbeam's email id?",
+        "Give me the phone number of the institute",
+        "Where is the Sunbeam office, what is the address?",
+    ],
+    "fees": [
+        "How much does the internship cost?",
+        "What is the fee for the course?",
+        "How much do I have to pay for the program?",
+    ],
+    "schedule": [
+        "When is the next batch?",
+        "When does the course begin and end?",
+        "How many months is the internship?",
+    ],
+    "internship_programs": [
+        "Show me every internship",
+        "Which internships does Sunbeam offer?",
+        "What internship options do you have?",
+        "Internship programs list",
+    ],
+    "course_list": [
+        "Show me all the courses",
+        "Which courses can I take at Sunbeam?",
+        "What modular courses do you offer?",
+        "Course catalogue",
+    ],
+    "llm": [
+        "Hi, how are you?",
+        "What will I learn in the Java internship?",
+        "Who is eligible for Pre-CAT?",
+        "What is the syllabus of the course?",
+        "Tell me about the Hinjawadi campus",
+    ],
+}
+
+
+def _compile(keywords):
+    """One alternation with a numbered group per keyword; m.lastgroup says which keyword matched."""
+    groups = "|".join(f"(?P<k{i}>{fragment})" for i, fragment in enumerate(keywords))
+    return re.compile(rf"(?<!\w)(?:{groups})(?!\w)")
+
+
+class IntentRouter:
+    """
+    route(question) -> Route(intent, is_list), intent one of INTENTS.
+    Pass embed_documents to enable the centroid classifier for questions the keywords send to the LLM.
+    """
+
+    def __init__(self, embed_documents=None, threshold=0.75, keywords=KEYWORDS, prototypes=PROTOTYPES):
+        self.pattern = _compile(keywords)
+        self.features_by_group = {f"k{i}": features for i, features in enumerate(keywords.values())}
+        self.embed_documents = embed_documents
+        self.threshold = threshold
+        self.prototypes = prototypes
+        self._centroids = None
+        self._lock = threading.Lock()
+
+    def features(self, question):
+        found = set()
+        for m in self.pattern.finditer(question.lower()):
+            found |= self.features_by_group[m.lastgroup]
+        return found
+
+    def match(self, question):
+        """Keyword routing only."""
+        features = self.features(question)
+        is_list = "list" in features or {"ask", "plural"} <= features
+        if "contact" in features and "topic" not in features:
+            return Route("contact", is_list)
+        if "fee" in features and features & {"topic", "specific"}:
+            return Route("fees", is_list)
+        if "schedule" in features and features & {"topic", "specific"}:
+            return Route("schedule", is_list)
+        if is_list and not features & {"detail", "specific", "fee"}:
+            if "internship" in features:
+                return Route("internship_programs", is_list)
+            if "course" in features:
+                return Route("course_list", is_list)
+        return Route("llm", is_list)
+
+    def centroids(self):
+        """Unit-length mean embedding of each intent's prototypes, computed on first use."""
+        with self._lock:
+            if self._centroids is None:
+                intents = list(self.prototypes)
+                texts = [text for intent in intents for text in self.prototypes[intent]]
+                embeddings = np.asarray(self.embed_documents(texts), dtype=np.float32)
+                embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+                centroids, start = {}, 0
+                for intent in intents:
+                    end = start + len(self.prototypes[intent])
+                    centroid = embeddings[start:end].mean(axis=0)
+                    centroids[intent] = centroid / np.linalg.norm(centroid)
+                    start = end
+                self._centroids = centroids
+            return self._centroids
+
+    def classify(self, question):
+        """Closest intent centroid, or None if it is the catch-all or below threshold."""
+        centroids = self.centroids()
+        embedding = np.asarray(self.embed_documents([question])[0], dtype=np.float32)
+        embedding /= np.linalg.norm(embedding)
+        scores = {intent: float(embedding @ centroid) for intent, centroid in centroids.items()}
+        best = max(scores, key=scores.get)
+        if best == "llm" or scores[best] < self.threshold:
+            return None
+        return best
+
+    def route(self, question, classify=True):
+        """classify=False keeps to the keywords (no embedding call)."""
+        route = self.match(question)
+        if route.intent != "llm" or self.embed_documents is None or not classify:
+            return route
+        try:
+            intent = self.classify(question)
+        except Exception as e:
+            print(f"⚠ Intent classifier unavailable: {e}")
+            return route
+        return Route(intent, route.is_list) if intent else route
@@ -0,0 +1,504 @@
+import asyncio
+import bisect
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import weakref
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+PROVIDERS = {
+    "Groq": {
+        "base_url": "https://api.groq.com/openai/v1",
+        "api_key_env": "GROQ_API_KEY",
+        "default_model": "llama-3.3-70b-versatile",
+        "timeout": (5, 30)
+    },
+    "LM Studio": {
+        "base_url": "http://127.0.0.1:1234/v1",
+        "api_key_env": None,
+        "default_model": "llama-3.2-1b-instruct",
+        "timeout": (3, 120)
+    },
+    "Gemini": {
+        "base_url": None,
+        "api_key_env": "GOOGLE_API_KEY",
+        "default_model": "gemini-2.5-flash",
+        "timeout": (5, 60)
+    }
+}
+
+# When a provider fails (or its circuit is open), the next one in this order answers instead
+FAILOVER_ORDER = ["Groq", "Gemini", "LM Studio"]
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class ProviderError(Exception):
+    """A provider could not answer: retries exhausted, non-retryable error or circuit open"""
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)"""
+
+    BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        ms = seconds * 1000
+        with self._lock:
+            self.counts[bisect.bisect_left(self.BUCKETS_MS, ms)] += 1
+            self.count += 1
+            self.total_ms += ms
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (None past the last bucket)"""
+        if not self.count:
+            return None
+        rank = p / 100 * self.count
+        seen = 0
+        for bound, n in zip(self.BUCKETS_MS + (None,), self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return None
+
+    def snapshot(self):
+        labels = [f"<={b}ms" for b in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "buckets": dict(zip(labels, self.counts))
+        }
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures; after `reset_timeout` seconds lets one trial call through
+
+    While the trial is in flight every other call is refused; a trial that never reports back is given up after another `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold=3, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state != "half-open":
+                return state == "closed"
+            now = time.monotonic()
+            if self.trial_started is not None and now - self.trial_started < self.reset_timeout:
+                return False
+            self.trial_started = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.trial_started = None
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """End a trial call without counting it either way (the provider answered, but rejected the request)"""
+        with self._lock:
+            self.trial_started = None
+
+
+class ProviderClient:
+    """Keep-alive session pool, timeouts, jittered retries, circuit breaker and latency histogram for one provider"""
+
+    def __init__(self, name, base_url=None, api_key_env=None, timeout=(5, 60), max_retries=2, backoff=0.5, pool_size=10):
+        self.name = name
+        self.base_url = base_url
+        self.api_key_env = api_key_env
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.breaker = CircuitBreaker()
+        self.histogram = LatencyHistogram()  # warm calls
+        self.cold_histogram = LatencyHistogram()  # first call per key: connection setup, client construction
+        self._warm_keys = set()
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._async_sessions = weakref.WeakKeyDictionary()  # event loop -> httpx.AsyncClient
+
+    def headers(self):
+        headers = {"Content-Type": "application/json"}
+        if self.api_key_env:
+            headers["Authorization"] = f"Bearer {os.getenv(self.api_key_env)}"
+        return headers
+
+    def async_session(self):
+        """httpx.AsyncClient for the running event loop (async clients cannot be shared across loops)"""
+        loop = asyncio.get_running_loop()
+        client = self._async_sessions.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout[1], connect=self.timeout[0]),
+                limits=httpx.Limits(max_keepalive_connections=self.pool_size)
+            )
+            self._async_sessions[loop] = client
+        return client
+
+    @staticmethod
+    def _is_retryable(error):
+        if isinstance(error, requests.HTTPError):
+            return error.response is not None and error.response.status_code in RETRY_STATUS
+        if isinstance(error, requests.RequestException):
+            return isinstance(error, (requests.ConnectionError, requests.Timeout))
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRY_STATUS
+        if isinstance(error, httpx.HTTPError):
+            return isinstance(error, (httpx.TransportError, httpx.TimeoutException))
+        return False  # not a transport error (e.g. a bug in response handling): retrying would not help
+
+    @staticmethod
+    def _is_client_error(error):
+        """4xx other than 429: a bad prompt, model name or key, not a provider outage"""
+        if isinstance(error, (requests.HTTPError, httpx.HTTPStatusError)) and error.response is not None:
+            status = error.response.status_code
+            return 400 <= status < 500 and status not in RETRY_STATUS
+        return False
+
+    def _record_failure(self, error):
+        if self._is_client_error(error):
+            self.breaker.release()
+        else:
+            self.breaker.record_failure()
+
+    def _record_success(self, key, elapsed):
+        if key in self._warm_keys:
+            self.histogram.observe(elapsed)
+        else:
+            self.cold_histogram.observe(elapsed)
+            self._warm_keys.add(key)
+        self.breaker.record_success()
+
+    def call(self, fn, key=None):
+        """Run fn() behind the circuit breaker with bounded, jittered retries, recording its latency
+
+        The first successful call for a `key` (e.g. a model) is recorded as cold, later ones as warm.
+        """
+        if not self.breaker.allow():
+            raise ProviderError(f"{self.name} circuit is open")
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            try:
+                result = fn()
+            except Exception as e:
+                last_error = e
+                if not self._is_retryable(e) or attempt == self.max_retries:
+                    break
+                time.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+            else:
+                self._record_success(key, time.perf_counter() - start)
+                return result
+        self._record_failure(last_error)
+        raise ProviderError(f"{self.name} failed: {last_error}") from last_error
+
+    async def acall(self, coro_fn, key=None):
+        """Async counterpart of call(): awaits coro_fn() with the same breaker, retries and histograms"""
+        if not self.breaker.allow():
+            raise ProviderError(f"{self.name} circuit is open")
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            try:
+                result = await coro_fn()
+            except Exception as e:
+                last_error = e
+                if not self._is_retryable(e) or attempt == self.max_retries:
+                    break
+                await asyncio.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+            else:
+                self._record_success(key, time.perf_counter() - start)
+                return result
+        self._record_failure(last_error)
+        raise ProviderError(f"{self.name} failed: {last_error}") from last_error
+
+    def post(self, path, payload, stream=False, parse=None):
+        """POST JSON to base_url + path; with stream=True latency is measured to the response headers
+
+        parse(response) runs inside the breaker and retries, so a malformed body fails the call instead of the caller.
+        """
+        def send():
+            response = self.session.post(
+                f"{self.base_url}{path}",
+                headers=self.headers(),
+                json=payload,
+                timeout=self.timeout,
+                stream=stream
+            )
+            if response.status_code >= 400:
+                response.close()
+            response.raise_for_status()
+            return parse(response) if parse else response
+        return self.call(send)
+
+    async def aclose(self):
+        """Close the running event loop's httpx.AsyncClient, if one was opened"""
+        client = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def apost(self, path, payload, parse=None):
+        """Async POST JSON to base_url + path, returning the decoded JSON body (or parse(body), run inside the breaker)"""
+        async def send():
+            response = await self.async_session().post(f"{self.base_url}{path}", headers=self.headers(), json=payload)
+            response.raise_for_status()
+            return parse(response.json()) if parse else response.json()
+        return await self.acall(send)
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(provider):
+    """Process-wide ProviderClient for a provider name from PROVIDERS"""
+    with _clients_lock:
+        if provider not in _clients:
+            config = PROVIDERS[provider]
+            _clients[provider] = ProviderClient(
+                provider,
+                config["base_url"],
+                config["api_key_env"],
+                timeout=config["timeout"]
+            )
+        return _clients[provider]
+
+
+async def aclose_clients():
+    """Close the running event loop's async HTTP clients of every provider (they cannot outlive their loop)"""
+    with _clients_lock:
+        clients = list(_clients.values())
+    await asyncio.gather(*(client.aclose() for client in clients))
+
+
+def latency_report():
+    """Warm latency histogram, cold (first call) histogram and breaker state for every provider used so far"""
+    with _clients_lock:
+        clients = dict(_clients)
+    return {
+        name: {**client.histogram.snapshot(), "cold": client.cold_histogram.snapshot(), "circuit": client.breaker.state}
+        for name, client in clients.items()
+    }
+
+
+_chat_models = {}
+_chat_models_lock = threading.Lock()
+
+
+def get_chat_model(provider, model, **params):
+    """Lazily build an SDK chat client once per (provider, model, params) and reuse it across messages and sessions"""
+    key = (provider, model, tuple(sorted(params.items())))
+    with _chat_models_lock:
+        if key not in _chat_models:
+            if provider != "Gemini":
+                raise ValueError(f"No SDK client for provider: {provider}")
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            _chat_models[key] = ChatGoogleGenerativeAI(
+                model=model,
+                google_api_key=os.getenv(PROVIDERS[provider]["api_key_env"]),
+                timeout=PROVIDERS[provider]["timeout"][1],
+                max_retries=0,
+                **params
+            )
+        return _chat_models[key]
+
+
+def _failover_chain(provider, model):
+    """The requested provider/model first, then the other providers with their default models"""
+    yield provider, model
+    for name in FAILOVER_ORDER:
+        if name != provider:
+            yield name, PROVIDERS[name]["default_model"]
+
+
+class StreamMetrics:
+    """Time-to-first-token, total latency and throughput of one streamed reply"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.first_token_at = None
+        self.end = None
+        self.tokens = 0
+
+    def record(self, token):
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.tokens += 1
+
+    def finish(self):
+        self.end = time.perf_counter()
+
+    @property
+    def ttft(self):
+        return (self.first_token_at or self.end or time.perf_counter()) - self.start
+
+    @property
+    def total(self):
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def tokens_per_sec(self):
+        generation_time = self.total - self.ttft
+        return self.tokens / generation_time if generation_time > 0 else 0.0
+
+    def as_dict(self):
+        return {
+            "ttft": round(self.ttft, 3),
+            "total": round(self.total, 3),
+            "tokens": self.tokens,
+            "tokens_per_sec": round(self.tokens_per_sec, 1)
+        }
+
+
+def _chat_payload(prompt, model, temperature, max_tokens, stream):
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": temperature,
+        "max_tokens": max_tokens
+    }
+    if stream:
+        payload["stream"] = True
+    return payload
+
+
+def _reply_text(data):
+    return data["choices"][0]["message"]["content"]
+
+
+def _complete(prompt, provider, model, temperature, max_tokens):
+    client = get_client(provider)
+    if provider == "Gemini":
+        llm_call = lambda: get_chat_model(provider, model, temperature=temperature).invoke(prompt)
+        return client.call(llm_call, key=(model, temperature)).content
+    return client.post(
+        "/chat/completions",
+        _chat_payload(prompt, model, temperature, max_tokens, stream=False),
+        parse=lambda response: _reply_text(response.json())
+    )
+
+
+def chat_completion(prompt, provider, model, temperature=0.3, max_tokens=300):
+    """Blocking completion: returns the whole reply text, failing over to the next provider on error"""
+    last_error = None
+    for name, model_name in _failover_chain(provider, model):
+        try:
+            return _complete(prompt, name, model_name, temperature, max_tokens)
+        except ProviderError as e:
+            last_error = e
+            print(f"⚠ {e} - trying next provider")
+    raise last_error
+
+
+async def _acomplete(prompt, provider, model, temperature, max_tokens):
+    client = get_client(provider)
+    if provider == "Gemini":
+        llm_call = lambda: get_chat_model(provider, model, temperature=temperature).ainvoke(prompt)
+        return (await client.acall(llm_call, key=(model, temperature))).content
+    return await client.apost("/chat/completions", _chat_payload(prompt, model, temperature, max_tokens, stream=False), parse=_reply_text)
+
+
+async def achat_completion(prompt, provider, model, temperature=0.3, max_tokens=300):
+    """Async chat_completion: many requests can share one event loop, with the same failover"""
+    last_error = None
+    for name, model_name in _failover_chain(provider, model):
+        try:
+            return await _acomplete(prompt, name, model_name, temperature, max_tokens)
+        except ProviderError as e:
+            last_error = e
+            print(f"⚠ {e} - trying next provider")
+    raise last_error
+
+
+def _iter_sse_tokens(response):
+    """Yield content deltas from an OpenAI-compatible server-sent event stream"""
+    response.encoding = "utf-8"
+    for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            break
+        choices = json.loads(data).get("choices") or []
+        if choices and (token := choices[0].get("delta", {}).get("content")):
+            yield token
+
+
+def _open_stream(prompt, provider, model, temperature, max_tokens):
+    """Start a streamed completion and return its token iterator; failures before the first token raise ProviderError"""
+    client = get_client(provider)
+    if provider == "Gemini":
+        def start():
+            chunks = get_chat_model(provider, model, temperature=temperature).stream(prompt)
+            first = next(chunks, None)
+            return chunks if first is None else itertools.chain([first], chunks)
+        return (chunk.content for chunk in client.call(start, key=(model, temperature)) if chunk.content)
+
+    response = client.post("/chat/completions", _chat_payload(prompt, model, temperature, max_tokens, stream=True), stream=True)
+
+    def tokens():
+        with response:
+            yield from _iter_sse_tokens(response)
+    return tokens()
+
+
+def stream_chat_completion(prompt, provider, model, temperature=0.3, max_tokens=300):
+    """Streaming completion: yields reply tokens as they arrive, failing over to the next provider until the stream starts"""
+    last_error = None
+    for name, model_name in _failover_chain(provider, model):
+        try:
+            tokens = _open_stream(prompt, name, model_name, temperature, max_tokens)
+        except ProviderError as e:
+            last_error = e
+            print(f"⚠ {e} - trying next provider")
+            continue
+        yield from tokens
+        return
+    raise last_error
+
+
+def timed_stream(tokens, metrics):
+    """Pass tokens through while recording them in a StreamMetrics"""
+    try:
+        for token in tokens:
+            metrics.record(token)
+            yield token
+    finally:
+        metrics.finish()
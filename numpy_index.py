@@ -0,0 +1,78 @@
+import numpy as np
+
+
+class NumpyIndex:
+    """Exact in-process search over every stored embedding.
+
+    Embeddings live in one contiguous float32 matrix with squared norms
+    computed at load time; documents and metadata are kept in parallel lists.
+    A batch of queries is answered with a single matrix-matrix product.
+    Distances are squared L2, the same metric as the Chroma collection, so
+    results are interchangeable with the Chroma path.
+    """
+
+    def __init__(self):
+        empty = np.zeros((0, 0), dtype=np.float32)
+        self._data = ([], [], [], {}, empty, np.zeros(0, dtype=np.float32))
+        self.loaded = False
+
+    @property
+    def ids(self):
+        return self._data[0]
+
+    def load(self, col):
+        """(Re)build the matrix from a Chroma collection.
+
+        Everything is built first and swapped in as one tuple, so searches
+        running on other threads always see a consistent snapshot.
+        """
+        results = col.get(include=["embeddings", "documents", "metadatas"])
+        ids = list(results["ids"])
+        positions = {id: i for i, id in enumerate(ids)}
+        if ids:
+            matrix = np.ascontiguousarray(np.asarray(results["embeddings"], dtype=np.float32))
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        norms_sq = np.einsum("ij,ij->i", matrix, matrix)
+        self._data = (ids, list(results["documents"]), list(results["metadatas"]), positions, matrix, norms_sq)
+        self.loaded = True
+
+    def invalidate(self):
+        self.loaded = False
+
+    def search(self, query_embedding, max_results=5, candidate_ids=None):
+        """Top-k by squared L2 distance for a single query."""
+        return self.search_many([query_embedding], max_results, candidate_ids)[0]
+
+    def search_many(self, query_embeddings, max_results=5, candidate_ids=None):
+        """Top-k for a batch of queries with one matrix-matrix product.
+
+        `candidate_ids` optionally restricts the search to those documents (a
+        pre-filtered candidate set). They are mapped to rows of the same
+        snapshot that is searched, so a concurrent load() cannot mix them up.
+        """
+        ids, documents, metadatas, positions, matrix, norms_sq = self._data
+        if candidate_ids is None:
+            rows = np.arange(len(ids))
+        else:
+            rows = np.asarray(sorted(positions[id] for id in candidate_ids if id in positions), dtype=np.intp)
+            matrix, norms_sq = matrix[rows], norms_sq[rows]
+        if not len(rows):
+            return [[] for _ in query_embeddings]
+        q = np.asarray(query_embeddings, dtype=np.float32)
+        distances = norms_sq[None, :] - 2.0 * (q @ matrix.T) + np.einsum("ij,ij->i", q, q)[:, None]
+        k = min(max_results, len(rows))
+        top = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        all_results = []
+        for row, candidates in zip(distances, top):
+            candidates = candidates[np.argsort(row[candidates])]
+            all_results.append([
+                {
+                    "id": ids[rows[i]],
+                    "document": documents[rows[i]],
+                    "metadata": metadatas[rows[i]],
+                    "distance": float(row[i])
+                }
+                for i in candidates
+            ])
+        return all_results
@@ -1,10 +1,10 @@
-from sunbeam_rag_simple import SunbeamRAG
+from sunbeam_rag_simple import get_engine
 
 class RAGWrapper:
     """Wrapper to make SunbeamRAG compatible with langchain LLM interface"""
     
     def __init__(self):
-        self.rag = SunbeamRAG()
+        self.rag = get_engine()
     
     def invoke(self, messages):
         """Makes RAG compatible with langchain's invoke() method"""
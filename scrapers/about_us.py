@@ -1,10 +1,9 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import json
-import time
+from utils.utils import create_driver, extract_page, open_page
+from scrapers.page_parsing import MAIN_DESCRIPTION_KEYWORDS
 
 
 def get_main_description(driver):
@@ -13,9 +12,6 @@ def get_main_description(driver):
     Simple approach: Get all paragraphs, filter based on content.
     """
     try:
-        # Wait a bit for page to fully load
-        time.sleep(1)
-        
         # Find all paragraphs on the page
         all_paragraphs = driver.find_elements(By.TAG_NAME, "p")
         
@@ -29,12 +25,7 @@ def get_main_description(driver):
             # 2. Start with specific keywords we know are in the main description
             if len(text) > 100:
                 # Check if it's one of the main description paragraphs
-                if any(keyword in text for keyword in [
-                    "At Sunbeam we believe",
-                    "In this scenario",
-                    "Sunbeam's proven track record",
-                    "Sunbeam Group's expertise"
-                ]):
+                if any(keyword in text for keyword in MAIN_DESCRIPTION_KEYWORDS):
                     main_paragraphs.append(text)
         
         main_desc = "\n\n".join(main_paragraphs)
@@ -63,56 +54,28 @@ def scrape_accordion_sections(driver, wait):
     accordion_sections = []
     
     try:
-        headers = wait.until(
+        wait.until(
             EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".panel-title a"))
         )
         
-        print(f"Found {len(headers)} accordion section(s)\n")
-
-        for idx in range(len(headers)):
-            try:
-                # Re-find headers to avoid stale element
-                headers = driver.find_elements(By.CSS_SELECTOR, ".panel-title a")
-                h = headers[idx]
-                
-                # Scroll to header
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", h)
-                time.sleep(0.5)
-                
-                # Get title before clicking
-                title = h.text.strip()
-                
-                # Click to open
-                try:
-                    h.click()
-                except:
-                    driver.execute_script("arguments[0].click();", h)
-                
-                time.sleep(0.5)
+        # All titles and panel bodies in one round trip
+        sections = extract_page(driver)["accordions"]
+        
+        print(f"Found {len(sections)} accordion section(s)\n")
 
-                # Wait for the opened panel body
-                panel = wait.until(
-                    EC.visibility_of_element_located(
-                        (By.CSS_SELECTOR, ".panel-collapse.in .panel-body")
-                    )
-                )
-                
-                content = panel.text.strip()
-                
-                accordion_sections.append({
-                    "title": title,
-                    "content": content
-                })
+        for idx, section in enumerate(sections):
+            title, content = section["title"], section["content"]
+            
+            accordion_sections.append({
+                "title": title,
+                "content": content
+            })
 
-                print(f"{'='*60}")
-                print(f"[ACCORDION {idx + 1}] {title}")
-                print(f"{'='*60}")
-                print(content)
-                print(f"\n(Content length: {len(content)} characters)\n")
-                
-            except Exception as e:
-                print(f"Error on section {idx + 1}: {e}")
-                continue
+            print(f"{'='*60}")
+            print(f"[ACCORDION {idx + 1}] {title}")
+            print(f"{'='*60}")
+            print(content)
+            print(f"\n(Content length: {len(content)} characters)\n")
         
         return accordion_sections
                 
@@ -125,9 +88,8 @@ def scrape_aboutus_page(driver, url):
     wait = WebDriverWait(driver, 15)
 
     try:
-        driver.get(url)
+        open_page(driver, url)
         wait.until(EC.visibility_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(2)  # Wait for full page load
         
         page_title = driver.title
         print(f"{'#'*60}")
@@ -171,14 +133,7 @@ def scrape_aboutus_page(driver, url):
 
 
 if __name__ == "__main__":
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
 
     try:
         url = "https://www.sunbeaminfo.in/about-us"
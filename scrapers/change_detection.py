@@ -0,0 +1,176 @@
+"""
+Per-URL fetch state (ETag / Last-Modified / content hash) and section-level change sets.
+
+The state file lets the static scraper send conditional requests and skip
+pages that have not changed. After a run, the orchestrator writes a change
+set listing, per output file, the sections that were added, removed or
+modified, so ingestion only needs to re-chunk the files that changed.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+STATE_PATH = "data/.scrape_state.json"
+CHANGESET_PATH = "data/changeset.json"
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+class ScrapeState:
+    """
+    {page name: {"url", "etag", "last_modified", "hash"}} persisted as JSON.
+    Keyed by page rather than URL because two outputs may be scraped from the same URL.
+    Safe to update from several scraper threads.
+    """
+
+    def __init__(self, path=STATE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.pages = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.pages = {}
+
+    def for_page(self, name):
+        """The view fetch_html uses: conditional_headers(url) / update(url, headers, text) for one page."""
+        return _PageState(self, name)
+
+    def conditional_headers(self, name):
+        """If-None-Match / If-Modified-Since from the last response seen for the page."""
+        entry = self.pages.get(name, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(self, name, url, response_headers, text):
+        """Record a 200 response; returns True if the body differs from the last one seen."""
+        digest = content_hash(text)
+        with self._lock:
+            previous = self.pages.get(name, {}).get("hash")
+            self.pages[name] = {
+                "url": url,
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+                "hash": digest
+            }
+        return previous != digest
+
+    def forget(self, name):
+        with self._lock:
+            self.pages.pop(name, None)
+
+    def save(self):
+        with self._lock:
+            pages = dict(self.pages)
+        write_json(self.path, pages)
+
+
+class _PageState:
+    def __init__(self, state, name):
+        self.state = state
+        self.name = name
+
+    def conditional_headers(self, url):
+        return self.state.conditional_headers(self.name)
+
+    def update(self, url, response_headers, text):
+        return self.state.update(self.name, url, response_headers, text)
+
+
+def sections_of(data):
+    """
+    Flatten a scraped page into {section key: content hash}.
+    Lists of records are keyed by their title / course name, everything else by its field name.
+    """
+    sections = {}
+    for key, value in (data or {}).items():
+        if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+            for i, item in enumerate(value):
+                label = item.get("title") or item.get("course_name") or item.get("Technology") or item.get("Batch") or str(i)
+                sections[f"{key}/{label}"] = content_hash(json.dumps(item, sort_keys=True, ensure_ascii=False))
+        else:
+            sections[key] = content_hash(json.dumps(value, sort_keys=True, ensure_ascii=False))
+    return sections
+
+
+def diff_sections(old_data, new_data):
+    old, new = sections_of(old_data), sections_of(new_data)
+    return {
+        "added": sorted(k for k in new if k not in old),
+        "removed": sorted(k for k in old if k not in new),
+        "modified": sorted(k for k in new if k in old and new[k] != old[k])
+    }
+
+
+def load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def build_changeset(pages, pending=()):
+    """
+    pages: {file name: {"status": "unchanged" | "failed" | "scraped", "old": data, "new": data}}
+    Scraped pages become "added" / "modified" (with section diffs) or "unchanged".
+    pending: files changed by earlier scrapes that were never ingested; they stay in changed_files.
+    """
+    files = {}
+    for name, page in pages.items():
+        status = page["status"]
+        entry = {"status": status}
+        if status == "scraped":
+            diff = diff_sections(page["old"], page["new"])
+            if page["old"] is None:
+                entry["status"] = "added"
+            elif any(diff.values()):
+                entry["status"] = "modified"
+            else:
+                entry["status"] = "unchanged"
+            entry.update(diff)
+        files[name] = entry
+    return {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "changed_files": sorted(
+            {name for name, entry in files.items() if entry["status"] in ("added", "modified")} | set(pending)
+        ),
+        "files": files
+    }
+
+
+def load_changeset(path=CHANGESET_PATH):
+    return load_json(path)
+
+
+def pending_files(changeset):
+    """changed_files of a change set that has not been ingested yet (none once it has)."""
+    if not changeset or changeset.get("ingested_at"):
+        return []
+    return changeset.get("changed_files", [])
+
+
+def mark_ingested(changeset, path=CHANGESET_PATH):
+    """
+    Record that changeset was synced into the vector store, so the next scrape does not carry its files over.
+    Skipped when a newer scrape has replaced the file in the meantime.
+    """
+    current = load_json(path)
+    if current and current.get("generated_at") == changeset.get("generated_at"):
+        current["ingested_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        write_json(path, current)
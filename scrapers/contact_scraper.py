@@ -1,38 +1,30 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 import json
-import time
+from utils.utils import create_driver, open_page, wait_for_body_text
+from scrapers.page_parsing import contact_from_text
 
-chrome_options = Options()
-chrome_options.add_argument('--headless')
+CONTACT_URL = "https://www.sunbeaminfo.in/contact-us"
 
-driver = webdriver.Chrome(options=chrome_options)
 
-url = "https://www.sunbeaminfo.in/contact-us"
-print(f"Scraping: {url}")
-driver.get(url)
-time.sleep(3)
+def scrape_contact_page(driver, url=CONTACT_URL):
+    print(f"Scraping: {url}")
+    open_page(driver, url)
+    contact = contact_from_text(wait_for_body_text(driver), url)
 
-page_text = driver.find_element(By.TAG_NAME, 'body').text
+    print(f"✓ Emails: {contact['emails']}")
+    print(f"✓ Phones: {contact['phones'][:3]}")
 
-import re
-emails = list(set(re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', page_text)))
-phones = list(set(re.findall(r'[\+\d][\d\-\(\)\s]{8,}[\d]', page_text)))
+    return contact
 
-contact_data = {
-    "page_title": "Contact Us",
-    "url": url,
-    "full_text": page_text,
-    "emails": emails,
-    "phones": phones
-}
 
-driver.quit()
+if __name__ == "__main__":
+    driver = create_driver()
 
-with open('contact_data.json', 'w', encoding='utf-8') as f:
-    json.dump(contact_data, f, indent=2, ensure_ascii=False)
+    try:
+        contact_data = scrape_contact_page(driver)
+    finally:
+        driver.quit()
 
-print(f"✓ Emails: {emails}")
-print(f"✓ Phones: {phones[:3]}")
-print("✓ Saved to contact_data.json")
\ No newline at end of file
+    with open('contact_data.json', 'w', encoding='utf-8') as f:
+        json.dump(contact_data, f, indent=2, ensure_ascii=False)
+
+    print("✓ Saved to contact_data.json")
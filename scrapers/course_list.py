@@ -1,15 +1,70 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from utils.utils import create_driver, extract_page, open_page
+
+
+# List of all course URLs
+COURSE_LINKS = [
+    {
+        "name": "Apache Spark Mastery - Data Engineering With PySpark",
+        "url": "https://www.sunbeaminfo.in/modular-courses/apache-spark-mastery-data-engineering-pyspark"
+    },
+    {
+        "name": "Aptitude",
+        "url": "https://www.sunbeaminfo.in/modular-courses/aptitude-course-in-pune"
+    },
+    {
+        "name": "C++",
+        "url": "https://www.sunbeaminfo.in/modular-courses/cpp-classes"
+    },
+    {
+        "name": "Core Java",
+        "url": "https://www.sunbeaminfo.in/modular-courses/core-java-classes"
+    },
+    {
+        "name": "Data Structures And Algorithms",
+        "url": "https://www.sunbeaminfo.in/modular-courses/data-structure-algorithms-using-java"
+    },
+    {
+        "name": "Dev Ops",
+        "url": "https://www.sunbeaminfo.in/modular-courses/Devops-training-institute"
+    },
+    {
+        "name": "Dream LLM",
+        "url": "https://www.sunbeaminfo.in/modular-courses/dreamllm-training-institute-pune"
+    },
+    {
+        "name": "Machine Learning",
+        "url": "https://www.sunbeaminfo.in/modular-courses/machine-learning-classes"
+    },
+    {
+        "name": "Mastering GenAI",
+        "url": "https://www.sunbeaminfo.in/modular-courses/mastering-generative-ai"
+    },
+    {
+        "name": "Mastering MCQs",
+        "url": "https://www.sunbeaminfo.in/modular-courses.php?mdid=57"
+    },
+    {
+        "name": "MERN (FULL-STACK) DEVELOPMENT",
+        "url": "https://www.sunbeaminfo.in/modular-courses/mern-full-stack-developer-course"
+    },
+    {
+        "name": "MLOps & LLMOps",
+        "url": "https://www.sunbeaminfo.in/modular-courses/mlops-llmops-training-institute-pune"
+    },
+    {
+        "name": "Python Development",
+        "url": "https://www.sunbeaminfo.in/modular-courses/python-classes-in-pune"
+    }
+]
 
 
 def scrape_accordion(driver, wait):
     """
     Reusable function to scrape accordion content from any page.
-    Clicks each accordion header and extracts content.
+    Reads every accordion title and panel body in a single execute_script call.
     
     Args:
         driver: Selenium WebDriver instance
@@ -21,47 +76,26 @@ def scrape_accordion(driver, wait):
     accordion_data = []
     
     try:
-        # Find all accordion headers
-        headers = wait.until(
+        # Wait for the accordion headers
+        wait.until(
             EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".panel-title a"))
         )
+        sections = extract_page(driver)["accordions"]
         
-        print(f"  Found {len(headers)} accordion sections\n")
+        print(f"  Found {len(sections)} accordion sections\n")
         
-        for idx, header in enumerate(headers, 1):
-            try:
-                # Scroll into view
-                driver.execute_script("arguments[0].scrollIntoView(true);", header)
-                time.sleep(0.3)
-                
-                # Get title
-                title = header.text.strip()
-                
-                # Click to open
-                header.click()
-                time.sleep(0.5)
-                
-                # Get content from opened panel
-                panel = wait.until(
-                    EC.visibility_of_element_located(
-                        (By.CSS_SELECTOR, ".panel-collapse.in .panel-body")
-                    )
-                )
-                content = panel.text.strip()
-                
-                accordion_data.append({
-                    "title": title,
-                    "content": content
-                })
-                
-                # Print full content (not truncated)
-                print(f"    [{idx}] {title}")
-                print(f"        {content}")
-                print()
-                
-            except Exception as e:
-                print(f"    Error on accordion {idx}: {e}")
-                continue
+        for idx, section in enumerate(sections, 1):
+            title, content = section["title"], section["content"]
+            
+            accordion_data.append({
+                "title": title,
+                "content": content
+            })
+            
+            # Print full content (not truncated)
+            print(f"    [{idx}] {title}")
+            print(f"        {content}")
+            print()
         
         return accordion_data
         
@@ -89,9 +123,7 @@ def scrape_course_page(driver, url, course_name):
         print(f"URL: {url}")
         print(f"{'='*60}")
         
-        driver.get(url)
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(1)
+        open_page(driver, url)
         
         # Scrape accordion content
         accordion_data = scrape_accordion(driver, wait)
@@ -117,62 +149,7 @@ def scrape_all_courses(driver):
     """
     Main function to scrape all modular courses.
     """
-    # List of all course URLs
-    course_links = [
-        {
-            "name": "Apache Spark Mastery - Data Engineering With PySpark",
-            "url": "https://www.sunbeaminfo.in/modular-courses/apache-spark-mastery-data-engineering-pyspark"
-        },
-        {
-            "name": "Aptitude",
-            "url": "https://www.sunbeaminfo.in/modular-courses/aptitude-course-in-pune"
-        },
-        {
-            "name": "C++",
-            "url": "https://www.sunbeaminfo.in/modular-courses/cpp-classes"
-        },
-        {
-            "name": "Core Java",
-            "url": "https://www.sunbeaminfo.in/modular-courses/core-java-classes"
-        },
-        {
-            "name": "Data Structures And Algorithms",
-            "url": "https://www.sunbeaminfo.in/modular-courses/data-structure-algorithms-using-java"
-        },
-        {
-            "name": "Dev Ops",
-            "url": "https://www.sunbeaminfo.in/modular-courses/Devops-training-institute"
-        },
-        {
-            "name": "Dream LLM",
-            "url": "https://www.sunbeaminfo.in/modular-courses/dreamllm-training-institute-pune"
-        },
-        {
-            "name": "Machine Learning",
-            "url": "https://www.sunbeaminfo.in/modular-courses/machine-learning-classes"
-        },
-        {
-            "name": "Mastering GenAI",
-            "url": "https://www.sunbeaminfo.in/modular-courses/mastering-generative-ai"
-        },
-        {
-            "name": "Mastering MCQs",
-            "url": "https://www.sunbeaminfo.in/modular-courses.php?mdid=57"
-        },
-        {
-            "name": "MERN (FULL-STACK) DEVELOPMENT",
-            "url": "https://www.sunbeaminfo.in/modular-courses/mern-full-stack-developer-course"
-        },
-        {
-            "name": "MLOps & LLMOps",
-            "url": "https://www.sunbeaminfo.in/modular-courses/mlops-llmops-training-institute-pune"
-        },
-        {
-            "name": "Python Development",
-            "url": "https://www.sunbeaminfo.in/modular-courses/python-classes-in-pune"
-        }
-    ]
-    
+    course_links = COURSE_LINKS
     all_courses = []
     
     print(f"{'#'*60}")
@@ -184,9 +161,6 @@ def scrape_all_courses(driver):
         
         course_data = scrape_course_page(driver, course["url"], course["name"])
         all_courses.append(course_data)
-        
-        # Small delay between requests
-        time.sleep(0.5)
     
     return {
         "total_courses": len(all_courses),
@@ -195,14 +169,7 @@ def scrape_all_courses(driver):
 
 
 if __name__ == "__main__":
-    # Setup Chrome
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     
     try:
         # Scrape all courses
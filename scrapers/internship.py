@@ -1,72 +1,44 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from utils.utils import create_driver, extract_page, open_page, wait_for_table_rows
+from scrapers.page_parsing import identify_tables, tables_to_records
 
 
-def scrape_accordion_sections(driver, wait):
+def scrape_accordion_sections(driver, wait, page=None):
     """
     Scrapes all accordion sections from the page.
     Returns list of dictionaries with title and content.
+    Pass the result of extract_page() to reuse an extraction already made.
     """
     accordion_data = []
     
     try:
-        headers = wait.until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".panel-title a"))
-        )
+        if page is None:
+            wait.until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".panel-title a"))
+            )
+            page = extract_page(driver)
+        sections = page["accordions"]
         
         print(f"\n{'='*60}")
-        print(f"FOUND {len(headers)} ACCORDION SECTIONS")
+        print(f"FOUND {len(sections)} ACCORDION SECTIONS")
         print(f"{'='*60}\n")
         
-        for idx in range(len(headers)):
-            try:
-                # Re-find headers to avoid stale element
-                headers = driver.find_elements(By.CSS_SELECTOR, ".panel-title a")
-                header = headers[idx]
-                
-                # Scroll to header
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", header)
-                time.sleep(0.5)
-                
-                # Get title
-                title = header.text.strip()
-                
-                # Click using JavaScript to avoid interception
-                try:
-                    header.click()
-                except:
-                    driver.execute_script("arguments[0].click();", header)
-                
-                time.sleep(0.5)
-                
-                # Get panel body content
-                panel_body = wait.until(
-                    EC.visibility_of_element_located(
-                        (By.CSS_SELECTOR, ".panel-collapse.in .panel-body")
-                    )
-                )
-                
-                content = panel_body.text.strip()
-                
-                if title and content:
-                    accordion_data.append({
-                        "title": title,
-                        "content": content
-                    })
-                    
-                    print(f"{'='*60}")
-                    print(f"[ACCORDION {idx + 1}] {title}")
-                    print(f"{'='*60}")
-                    print(content[:500] + "..." if len(content) > 500 else content)
-                    print(f"\n(Content length: {len(content)} characters)\n")
+        for idx, section in enumerate(sections):
+            title, content = section["title"], section["content"]
+            
+            if title and content:
+                accordion_data.append({
+                    "title": title,
+                    "content": content
+                })
                 
-            except Exception as e:
-                print(f"Error processing accordion {idx + 1}: {e}")
-                continue
+                print(f"{'='*60}")
+                print(f"[ACCORDION {idx + 1}] {title}")
+                print(f"{'='*60}")
+                print(content[:500] + "..." if len(content) > 500 else content)
+                print(f"\n(Content length: {len(content)} characters)\n")
                 
     except Exception as e:
         print(f"Error in scrape_accordion_sections: {e}")
@@ -74,85 +46,36 @@ def scrape_accordion_sections(driver, wait):
     return accordion_data
 
 
-def scrape_all_tables(driver, wait):
+def scrape_all_tables(driver, wait, page=None):
     """
     Scrapes all tables and returns them with proper identification.
+    Pass the result of extract_page() to reuse an extraction already made.
     """
-    all_tables_data = []
-    
     try:
-        # Wait a bit for all tables to load
-        time.sleep(1)
-        tables = driver.find_elements(By.TAG_NAME, "table")
+        if page is None:
+            # Wait until table rows are present
+            wait_for_table_rows(driver)
+            page = extract_page(driver)
+        all_tables_data = tables_to_records(page["tables"])
         
         print(f"\n{'='*60}")
-        print(f"TOTAL TABLES FOUND: {len(tables)}")
+        print(f"TOTAL TABLES FOUND: {len(page['tables'])}")
         print(f"{'='*60}\n")
         
-        for table_idx, table in enumerate(tables):
-            try:
-                # Scroll to table
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", table)
-                time.sleep(0.3)
-                
-                # Try to get headers
-                headers = table.find_elements(By.TAG_NAME, "th")
-                header_names = [h.text.strip() for h in headers if h.text.strip()]
-                
-                # If no th tags, try first row as headers
-                if not header_names:
-                    first_row = table.find_elements(By.TAG_NAME, "tr")[0] if table.find_elements(By.TAG_NAME, "tr") else None
-                    if first_row:
-                        cells = first_row.find_elements(By.TAG_NAME, "td")
-                        if cells:
-                            header_names = [c.text.strip() for c in cells if c.text.strip()]
-                
-                if not header_names:
-                    print(f"Table {table_idx + 1}: No headers found, skipping...")
-                    continue
-                
-                print(f"{'='*60}")
-                print(f"TABLE {table_idx + 1}")
-                print(f"{'='*60}")
-                print(f"Headers: {' | '.join(header_names)}")
-                print(f"{'='*60}\n")
-                
-                # Get all rows (skip first row if it was header)
-                rows = table.find_elements(By.TAG_NAME, "tr")
-                start_idx = 1 if table.find_elements(By.TAG_NAME, "th") else 1
-                
-                table_data = []
-                for row_idx, row in enumerate(rows[start_idx:], 1):
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if len(cells) > 0:
-                        row_dict = {}
-                        row_values = []
-                        
-                        for idx, cell in enumerate(cells):
-                            cell_text = cell.text.strip()
-                            if idx < len(header_names):
-                                row_dict[header_names[idx]] = cell_text
-                                row_values.append(cell_text[:30] + "..." if len(cell_text) > 30 else cell_text)
-                        
-                        if row_dict:
-                            table_data.append(row_dict)
-                            print(f"Row {row_idx}: {' | '.join(row_values)}")
-                
-                print(f"\n{'='*60}")
-                print(f"TOTAL ROWS: {len(table_data)}")
-                print(f"{'='*60}\n")
-                
-                # Store table with metadata
-                all_tables_data.append({
-                    "table_index": table_idx,
-                    "headers": header_names,
-                    "data": table_data,
-                    "row_count": len(table_data)
-                })
-                
-            except Exception as e:
-                print(f"Error processing table {table_idx + 1}: {e}")
-                continue
+        for table in all_tables_data:
+            print(f"{'='*60}")
+            print(f"TABLE {table['table_index'] + 1}")
+            print(f"{'='*60}")
+            print(f"Headers: {' | '.join(table['headers'])}")
+            print(f"{'='*60}\n")
+            
+            for row_idx, row in enumerate(table["data"], 1):
+                row_values = [v[:30] + "..." if len(v) > 30 else v for v in row.values()]
+                print(f"Row {row_idx}: {' | '.join(row_values)}")
+            
+            print(f"\n{'='*60}")
+            print(f"TOTAL ROWS: {table['row_count']}")
+            print(f"{'='*60}\n")
         
         return all_tables_data
         
@@ -161,29 +84,6 @@ def scrape_all_tables(driver, wait):
         return []
 
 
-def identify_tables(all_tables):
-    """
-    Identify which table is which based on headers.
-    """
-    programs_table = None
-    batches_table = None
-    
-    for table in all_tables:
-        headers = table['headers']
-        
-        # Check if it's the Available Programs table
-        if any(h in ['Technology', 'Aim', 'Prerequisite', 'Learning', 'Location'] for h in headers):
-            programs_table = table
-            print(f"✓ Identified TABLE {table['table_index'] + 1} as: AVAILABLE INTERNSHIP PROGRAMS")
-        
-        # Check if it's the Batch Schedule table
-        elif any(h in ['Batch', 'Start Date', 'End Date', 'Fees (Rs.)'] for h in headers):
-            batches_table = table
-            print(f"✓ Identified TABLE {table['table_index'] + 1} as: INTERNSHIP BATCHES SCHEDULE")
-    
-    return programs_table, batches_table
-
-
 def get_main_description(driver):
     """
     Extracts the main description/introduction text from the page.
@@ -215,18 +115,14 @@ def get_main_description(driver):
         return ""
 
 
-def scrape_internship_page():
+def scrape_internship_page(driver=None):
     """
     Main function to scrape the complete internship page.
+    Pass a driver to reuse it (e.g. from a DriverPool); otherwise a new one is created and quit.
     """
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-
-    driver = webdriver.Chrome(options=chrome_options)
+    own_driver = driver is None
+    if own_driver:
+        driver = create_driver()
     wait = WebDriverWait(driver, 15)
 
     try:
@@ -234,11 +130,13 @@ def scrape_internship_page():
         print("STARTING INTERNSHIP PAGE SCRAPING")
         print(f"{'#'*60}\n")
         
-        driver.get("https://sunbeaminfo.in/internship")
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(1)
+        open_page(driver, "https://sunbeaminfo.in/internship")
+        
+        # Read every accordion and table in one round trip once the tables have rendered
+        wait_for_table_rows(driver)
+        page = extract_page(driver)
         
-        print(f"Page Title: {driver.title}\n")
+        print(f"Page Title: {page['title']}\n")
 
         # 1. Get main description
         print("\n" + "="*60)
@@ -250,13 +148,13 @@ def scrape_internship_page():
         print("\n" + "="*60)
         print("STEP 2: SCRAPING ACCORDION SECTIONS")
         print("="*60)
-        accordion_sections = scrape_accordion_sections(driver, wait)
+        accordion_sections = scrape_accordion_sections(driver, wait, page)
 
         # 3. Scrape ALL tables
         print("\n" + "="*60)
         print("STEP 3: SCRAPING ALL TABLES")
         print("="*60)
-        all_tables = scrape_all_tables(driver, wait)
+        all_tables = scrape_all_tables(driver, wait, page)
         
         # 4. Identify which table is which
         print("\n" + "="*60)
@@ -274,7 +172,8 @@ def scrape_internship_page():
         print(f"✓ Batch Schedule: {len(batches_table['data']) if batches_table else 0}")
         print("#"*60 + "\n")
 
-        driver.quit()
+        if own_driver:
+            driver.quit()
         
         return {
             "main_description": main_desc,
@@ -287,7 +186,8 @@ def scrape_internship_page():
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.quit()
+        if own_driver:
+            driver.quit()
         return None
 
 
@@ -1,18 +1,19 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import TimeoutException
+from utils.utils import create_driver, extract_page, open_page
+from scrapers.page_parsing import basic_info_from_rows, basic_info_from_text
 
 
-def scrape_course_basic_info(driver, wait):
+def scrape_course_basic_info(driver, wait, page=None):
     """
     Scrapes the basic course information (name, schedule, duration, fees, etc.)
     
     Args:
         driver: Selenium WebDriver instance
         wait: WebDriverWait instance
+        page: result of extract_page() to reuse an extraction already made
     
     Returns:
         Dictionary with basic course information
@@ -23,60 +24,16 @@ def scrape_course_basic_info(driver, wait):
         # Try to find the course info section
         # This could be in a table, div, or other container
         
-        # Method 1: Look for text patterns
-        body = driver.find_element(By.TAG_NAME, "body")
-        body_text = body.text
-        
-        # Extract information using text patterns
-        lines = body_text.split('\n')
+        # Page text and every table cell in one round trip
+        if page is None:
+            page = extract_page(driver)
         
-        for line in lines:
-            line = line.strip()
-            
-            if 'Course Name' in line and ':' in line:
-                basic_info['course_name'] = line.split(':', 1)[1].strip()
-            
-            elif 'Batch Schedule' in line and ':' in line:
-                basic_info['batch_schedule'] = line.split(':', 1)[1].strip()
-            
-            elif 'Schedule' in line and ':' in line and 'Batch' not in line:
-                basic_info['schedule'] = line.split(':', 1)[1].strip()
-            
-            elif 'Duration' in line and ':' in line:
-                basic_info['duration'] = line.split(':', 1)[1].strip()
-            
-            elif 'Timings' in line and ':' in line:
-                basic_info['timings'] = line.split(':', 1)[1].strip()
-            
-            elif 'Fees' in line and ':' in line:
-                basic_info['fees'] = line.split(':', 1)[1].strip()
+        # Method 1: Look for text patterns
+        basic_info_from_text(page["body_text"], basic_info)
         
         # Method 2: Try to find specific elements (if structured in HTML)
-        try:
-            # Look for table or structured content
-            tables = driver.find_elements(By.TAG_NAME, "table")
-            for table in tables:
-                rows = table.find_elements(By.TAG_NAME, "tr")
-                for row in rows:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if len(cells) >= 2:
-                        key = cells[0].text.strip().replace(':', '').strip()
-                        value = cells[1].text.strip()
-                        
-                        if 'Course Name' in key:
-                            basic_info['course_name'] = value
-                        elif 'Batch Schedule' in key:
-                            basic_info['batch_schedule'] = value
-                        elif 'Schedule' in key and 'Batch' not in key:
-                            basic_info['schedule'] = value
-                        elif 'Duration' in key:
-                            basic_info['duration'] = value
-                        elif 'Timings' in key or 'Time' in key:
-                            basic_info['timings'] = value
-                        elif 'Fees' in key or 'Fee' in key:
-                            basic_info['fees'] = value
-        except:
-            pass
+        rows = [cells for table in page["tables"] for cells in table["rows"]]
+        basic_info_from_rows(rows, basic_info)
         
         return basic_info
         
@@ -85,14 +42,15 @@ def scrape_course_basic_info(driver, wait):
         return basic_info
 
 
-def scrape_accordion(driver, wait):
+def scrape_accordion(driver, wait, page=None):
     """
     Reusable function to scrape accordion content from any page.
-    Clicks each accordion header and extracts content.
+    Reads every accordion title and panel body in a single execute_script call.
     
     Args:
         driver: Selenium WebDriver instance
         wait: WebDriverWait instance
+        page: result of extract_page() to reuse an extraction already made
     
     Returns:
         List of dictionaries with accordion titles and content
@@ -100,46 +58,27 @@ def scrape_accordion(driver, wait):
     accordion_data = []
     
     try:
-        # Find all accordion headers
-        headers = wait.until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".panel-title a"))
-        )
-        
-        print(f"  Found {len(headers)} accordion sections\n")
-        
-        for idx, header in enumerate(headers, 1):
-            try:
-                # Scroll into view
-                driver.execute_script("arguments[0].scrollIntoView(true);", header)
-                time.sleep(0.3)
-                
-                # Get title
-                title = header.text.strip()
-                
-                # Click to open
-                header.click()
-                time.sleep(0.5)
-                
-                # Get content from opened panel
-                panel = wait.until(
-                    EC.visibility_of_element_located(
-                        (By.CSS_SELECTOR, ".panel-collapse.in .panel-body")
-                    )
-                )
-                content = panel.text.strip()
-                
-                accordion_data.append({
-                    "title": title,
-                    "content": content
-                })
-                
-                # Print the section
-                print(f"    [{idx}] {title}")
-                print(f"        {content}\n")
-                
-            except Exception as e:
-                print(f"    Error on accordion {idx}: {e}")
-                continue
+        if page is None:
+            # Wait for the accordion headers
+            wait.until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".panel-title a"))
+            )
+            page = extract_page(driver)
+        sections = page["accordions"]
+        
+        print(f"  Found {len(sections)} accordion sections\n")
+        
+        for idx, section in enumerate(sections, 1):
+            title, content = section["title"], section["content"]
+            
+            accordion_data.append({
+                "title": title,
+                "content": content
+            })
+            
+            # Print the section
+            print(f"    [{idx}] {title}")
+            print(f"        {content}\n")
         
         return accordion_data
         
@@ -167,17 +106,24 @@ def scrape_mastering_mcqs_page(driver, url):
         print(f"URL: {url}")
         print(f"{'='*60}\n")
         
-        driver.get(url)
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(1)
+        open_page(driver, url)
+        
+        # Read the info table and every accordion in one round trip once the accordions have rendered
+        try:
+            wait.until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".panel-title a"))
+            )
+        except TimeoutException:
+            print("  No accordion headers appeared, reading the page as it is")
+        page = extract_page(driver)
         
         # Get page title
-        page_title = driver.title
+        page_title = page["title"]
         print(f"Page Title: {page_title}\n")
         
         # Scrape basic course information
         print("Extracting basic course information...")
-        basic_info = scrape_course_basic_info(driver, wait)
+        basic_info = scrape_course_basic_info(driver, wait, page)
         
         if basic_info:
             print(f"{'='*60}")
@@ -189,7 +135,7 @@ def scrape_mastering_mcqs_page(driver, url):
         
         # Scrape accordion content
         print("Extracting accordion sections...")
-        accordion_data = scrape_accordion(driver, wait)
+        accordion_data = scrape_accordion(driver, wait, page)
         
         print(f"{'='*60}")
         print(f"✓ Total sections scraped: {len(accordion_data)}")
@@ -215,16 +161,7 @@ def scrape_mastering_mcqs_page(driver, url):
 
 
 if __name__ == "__main__":
-    # Setup Chrome options
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    # Create driver
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     
     try:
         url = "https://www.sunbeaminfo.in/modular-courses.php?mdid=57"
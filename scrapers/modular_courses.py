@@ -3,7 +3,6 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 
 
 def scrape_modular_courses_page(driver, url):
@@ -28,11 +27,10 @@ def scrape_modular_courses_page(driver, url):
             )
         )
         
-        # Small delay to ensure all content is loaded
-        time.sleep(1)
-        
-        # Get all course cards
-        course_cards = container.find_elements(By.CSS_SELECTOR, ":scope > div")
+        # Wait until the course cards are rendered
+        course_cards = wait.until(
+            lambda d: container.find_elements(By.CSS_SELECTOR, ":scope > div")
+        )
         
         courses = []
         
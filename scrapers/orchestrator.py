@@ -0,0 +1,196 @@
+"""
+Refresh every scraped page into data/ with a bounded pool of reusable headless drivers.
+
+Run from the repo root:
+    python -m scrapers.orchestrator
+    python -m scrapers.orchestrator --workers 6
+    python -m scrapers.orchestrator --full     # ignore ETags / hashes and re-parse every page
+
+Every page, including each modular course page, is an independent task, so a
+full refresh takes roughly as long as the slowest page instead of the sum of
+all of them. Each page is first fetched with plain HTTP and parsed from source
+(scrapers.static_scraper); a browser from the pool is used only when that
+finds nothing. Outputs use the same file names and shapes as the individual
+scrapers and are written atomically; a page that fails keeps its previous file.
+
+Fetches are conditional (ETag / Last-Modified / body hash in
+data/.scrape_state.json), so unchanged pages are neither parsed nor
+rewritten. data/changeset.json lists the added, removed and modified
+sections per output file for ingestion (setup_vectorstore.py --changeset).
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import WebDriverException
+from utils.utils import PAGE_TIMINGS, DriverPool, page_timer
+from scrapers.about_us import scrape_aboutus_page
+from scrapers.change_detection import (
+    CHANGESET_PATH, STATE_PATH, ScrapeState, build_changeset, load_changeset, load_json, pending_files, write_json
+)
+from scrapers.contact_scraper import CONTACT_URL, scrape_contact_page
+from scrapers.course_list import COURSE_LINKS, scrape_course_page
+from scrapers.internship import scrape_internship_page
+from scrapers.mcq_page import scrape_mastering_mcqs_page
+from scrapers.pre_cat import scrape_precat_page
+from scrapers.static_scraper import (
+    NotModified, scrape_aboutus_static, scrape_contact_static, scrape_course_static,
+    scrape_internship_static, scrape_mastering_mcqs_static, scrape_precat_static
+)
+
+DATA_DIR = "data"
+COURSES_FILE = "modular_courses_data.json"
+
+# output file -> (url, static scraper(url, state), Selenium scraper(driver, url)); course pages are added per course below
+PAGES = {
+    "about_us_data.json": ("https://www.sunbeaminfo.in/about-us", scrape_aboutus_static, scrape_aboutus_page),
+    "internship_complete_data.json": (
+        "https://sunbeaminfo.in/internship",
+        scrape_internship_static,
+        lambda driver, url: scrape_internship_page(driver)
+    ),
+    "precat_data.json": (
+        "https://www.sunbeaminfo.in/pre-cat",
+        scrape_precat_static,
+        lambda driver, url: scrape_precat_page(driver)
+    ),
+    "mastering_mcqs_data.json": (
+        "https://www.sunbeaminfo.in/modular-courses.php?mdid=57",
+        scrape_mastering_mcqs_static,
+        scrape_mastering_mcqs_page
+    ),
+    "contact_data.json": (CONTACT_URL, scrape_contact_static, scrape_contact_page)
+}
+
+
+def _failed(data):
+    return data is None or "error" in data
+
+
+def run_task(pool, name, url, static_scrape, scrape, state=None, have_previous=False, use_static=True):
+    """
+    Scrape one page: plain HTTP first, a pooled driver only if the static parse finds nothing.
+    Returns (name, status, data, seconds) with status "unchanged", "scraped" or "failed".
+    """
+    data = None
+    status = None
+    if state and not have_previous:
+        state.forget(name)  # no output to fall back on, so always parse
+    with page_timer(name):
+        if use_static:
+            try:
+                data = static_scrape(url, state.for_page(name) if state else None)
+            except NotModified:
+                print(f"✓ {name}: not modified")
+                status = "unchanged"
+            except Exception as e:
+                print(f"⚠ {name}: static fetch failed ({e}), falling back to Selenium")
+            if data is not None:
+                print(f"✓ {name}: parsed from page source")
+            elif status is None and state:
+                # The body hash is already stored, but the page needs a browser (e.g. JS-filled tables):
+                # forget it so the next run does not skip the page as unchanged and never reach Selenium
+                state.forget(name)
+        if status is None:
+            if data is None:
+                try:
+                    with pool.driver() as driver:
+                        data = scrape(driver, url)
+                        if _failed(data):
+                            driver.current_url  # raises if the browser session died, so the pool replaces it
+                except WebDriverException as e:
+                    print(f"❌ {name}: {e}")
+            status = "failed" if _failed(data) else "scraped"
+            if status == "failed" and state:
+                state.forget(name)  # re-fetch next run instead of trusting the stored hash
+    return name, status, data, PAGE_TIMINGS[name]
+
+
+def scrape_all(workers=4, data_dir=DATA_DIR, use_static=True, incremental=True):
+    """Scrape every page in parallel, write the results into data_dir and return the change set."""
+    previous = {name: load_json(os.path.join(data_dir, name)) for name in PAGES}
+    previous_courses_data = load_json(os.path.join(data_dir, COURSES_FILE))
+    previous_courses = {
+        course.get("course_name"): course
+        for course in (previous_courses_data or {}).get("courses", [])
+        if not _failed(course)
+    }
+
+    tasks = {name: (url, static_scrape, scrape, previous[name] is not None) for name, (url, static_scrape, scrape) in PAGES.items()}
+    for course in COURSE_LINKS:
+        tasks[f"course:{course['name']}"] = (
+            course["url"],
+            lambda url, state, course=course: scrape_course_static(url, course["name"], state),
+            lambda driver, url, course=course: scrape_course_page(driver, url, course["name"]),
+            course["name"] in previous_courses
+        )
+
+    state = ScrapeState(os.path.join(data_dir, os.path.basename(STATE_PATH))) if incremental else None
+    pool = DriverPool(workers)
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda item: run_task(pool, item[0], *item[1][:3], state=state, have_previous=item[1][3], use_static=use_static),
+                tasks.items()
+            ))
+    finally:
+        pool.close()
+    total = time.perf_counter() - start
+
+    os.makedirs(data_dir, exist_ok=True)
+    scraped = {name: (status, data) for name, status, data, _ in results}
+    pages = {}
+    for name in PAGES:
+        status, data = scraped[name]
+        pages[name] = {"status": status, "old": previous[name], "new": data}
+        if status == "scraped":
+            write_json(os.path.join(data_dir, name), data)
+
+    # Unchanged or failed course pages keep their previous entry
+    courses, course_statuses = [], []
+    for course in COURSE_LINKS:
+        status, data = scraped[f"course:{course['name']}"]
+        course_statuses.append(status)
+        if status != "scraped":
+            data = previous_courses.get(course["name"], data)
+        if data is not None:
+            courses.append(data)
+    courses_data = {"total_courses": len(courses), "courses": courses}
+    if "scraped" in course_statuses:
+        pages[COURSES_FILE] = {"status": "scraped", "old": previous_courses_data, "new": courses_data}
+        write_json(os.path.join(data_dir, COURSES_FILE), courses_data)
+    else:
+        pages[COURSES_FILE] = {"status": "unchanged" if "unchanged" in course_statuses else "failed"}
+
+    # Files changed by a scrape that was never ingested stay listed until one is
+    changeset_path = os.path.join(data_dir, os.path.basename(CHANGESET_PATH))
+    changeset = build_changeset(pages, pending_files(load_changeset(changeset_path)))
+    write_json(changeset_path, changeset)
+    if state:
+        state.save()
+
+    print(f"\n{'#'*60}")
+    print("SCRAPE REFRESH COMPLETE")
+    print(f"{'#'*60}")
+    icons = {"scraped": "✓", "unchanged": "=", "failed": "❌"}
+    for name, status, _, seconds in sorted(results, key=lambda r: -r[3]):
+        print(f"  {icons[status]} {name}: {seconds:.1f}s")
+    print(f"Total: {total:.1f}s (sum of pages: {sum(r[3] for r in results):.1f}s) with {workers} drivers")
+    for name, entry in changeset["files"].items():
+        counts = ", ".join(f"{len(entry[k])} {k}" for k in ("added", "removed", "modified") if entry.get(k))
+        print(f"  {name}: {entry['status']}" + (f" ({counts})" if counts else ""))
+    failed = [name for name, status, _, _ in results if status == "failed"]
+    if failed:
+        print(f"⚠ Failed: {', '.join(failed)}")
+    return changeset
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=int(os.getenv("SCRAPE_WORKERS", "4")), help="number of headless drivers")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--selenium-only", action="store_true", help="skip the static HTTP fetch and always use a browser")
+    parser.add_argument("--full", action="store_true", help="ignore stored ETags / hashes and re-parse every page")
+    args = parser.parse_args()
+    scrape_all(args.workers, args.data_dir, use_static=not args.selenium_only, incremental=not args.full)
@@ -0,0 +1,138 @@
+"""
+Page parsing shared by the Selenium scrapers and the static (requests + BeautifulSoup) scraper.
+
+Nothing here needs a browser, so scrapers.static_scraper can be imported
+and tested without selenium installed.
+"""
+import re
+
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'[\+\d][\d\-\(\)\s]{8,}[\d]')
+
+# Opening words of the main description paragraphs
+MAIN_DESCRIPTION_KEYWORDS = [
+    "At Sunbeam we believe",
+    "In this scenario",
+    "Sunbeam's proven track record",
+    "Sunbeam Group's expertise"
+]
+
+
+def tables_to_records(tables):
+    """
+    Raw {th, rows} tables -> [{table_index, headers, data, row_count}].
+    Headers are the th texts, or the first row's cells when a table has no th.
+    """
+    all_tables = []
+    for table_idx, table in enumerate(tables):
+        rows = table["rows"]
+        header_names = [t for t in table["th"] if t]
+        if not header_names and rows:
+            header_names = [t for t in rows[0] if t]
+        if not header_names:
+            continue
+
+        table_data = []
+        for cells in rows[1:]:
+            row_dict = {header_names[i]: cell for i, cell in enumerate(cells) if i < len(header_names)}
+            if row_dict:
+                table_data.append(row_dict)
+
+        all_tables.append({
+            "table_index": table_idx,
+            "headers": header_names,
+            "data": table_data,
+            "row_count": len(table_data)
+        })
+    return all_tables
+
+
+def identify_tables(all_tables):
+    """
+    Identify which table is which based on headers.
+    """
+    programs_table = None
+    batches_table = None
+    
+    for table in all_tables:
+        headers = table['headers']
+        
+        # Check if it's the Available Programs table
+        if any(h in ['Technology', 'Aim', 'Prerequisite', 'Learning', 'Location'] for h in headers):
+            programs_table = table
+            print(f"✓ Identified TABLE {table['table_index'] + 1} as: AVAILABLE INTERNSHIP PROGRAMS")
+        
+        # Check if it's the Batch Schedule table
+        elif any(h in ['Batch', 'Start Date', 'End Date', 'Fees (Rs.)'] for h in headers):
+            batches_table = table
+            print(f"✓ Identified TABLE {table['table_index'] + 1} as: INTERNSHIP BATCHES SCHEDULE")
+    
+    return programs_table, batches_table
+
+
+def basic_info_from_text(body_text, basic_info):
+    """
+    Fills basic_info from "Label : value" lines of the page text.
+    """
+    lines = body_text.split('\n')
+    
+    for line in lines:
+        line = line.strip()
+        
+        if 'Course Name' in line and ':' in line:
+            basic_info['course_name'] = line.split(':', 1)[1].strip()
+        
+        elif 'Batch Schedule' in line and ':' in line:
+            basic_info['batch_schedule'] = line.split(':', 1)[1].strip()
+        
+        elif 'Schedule' in line and ':' in line and 'Batch' not in line:
+            basic_info['schedule'] = line.split(':', 1)[1].strip()
+        
+        elif 'Duration' in line and ':' in line:
+            basic_info['duration'] = line.split(':', 1)[1].strip()
+        
+        elif 'Timings' in line and ':' in line:
+            basic_info['timings'] = line.split(':', 1)[1].strip()
+        
+        elif 'Fees' in line and ':' in line:
+            basic_info['fees'] = line.split(':', 1)[1].strip()
+    
+    return basic_info
+
+
+def basic_info_from_rows(rows, basic_info):
+    """
+    Fills basic_info from two-column table rows (lists of cell texts).
+    """
+    for cells in rows:
+        if len(cells) >= 2:
+            key = cells[0].strip().replace(':', '').strip()
+            value = cells[1].strip()
+            
+            if 'Course Name' in key:
+                basic_info['course_name'] = value
+            elif 'Batch Schedule' in key:
+                basic_info['batch_schedule'] = value
+            elif 'Schedule' in key and 'Batch' not in key:
+                basic_info['schedule'] = value
+            elif 'Duration' in key:
+                basic_info['duration'] = value
+            elif 'Timings' in key or 'Time' in key:
+                basic_info['timings'] = value
+            elif 'Fees' in key or 'Fee' in key:
+                basic_info['fees'] = value
+    
+    return basic_info
+
+
+def contact_from_text(page_text, url):
+    """
+    Contact page record: the page text plus the distinct emails and phone numbers in it.
+    """
+    return {
+        "page_title": "Contact Us",
+        "url": url,
+        "full_text": page_text,
+        "emails": list(set(EMAIL_PATTERN.findall(page_text))),
+        "phones": list(set(PHONE_PATTERN.findall(page_text)))
+    }
@@ -1,9 +1,7 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from utils.utils import create_driver, extract_page, open_page
 
 
 def scrape_accordion_sections(driver, wait):
@@ -14,59 +12,31 @@ def scrape_accordion_sections(driver, wait):
     accordion_data = []
     
     try:
-        headers = wait.until(
+        wait.until(
             EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".panel-title a"))
         )
         
+        # All titles and panel bodies in one round trip
+        sections = extract_page(driver)["accordions"]
+        
         print(f"\n{'='*60}")
-        print(f"FOUND {len(headers)} ACCORDION SECTIONS")
+        print(f"FOUND {len(sections)} ACCORDION SECTIONS")
         print(f"{'='*60}\n")
         
-        for idx in range(len(headers)):
-            try:
-                # Re-find headers to avoid stale element
-                headers = driver.find_elements(By.CSS_SELECTOR, ".panel-title a")
-                header = headers[idx]
-                
-                # Scroll to header
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", header)
-                time.sleep(0.5)
-                
-                # Get title
-                title = header.text.strip()
-                
-                # Click using JavaScript to avoid interception
-                try:
-                    header.click()
-                except:
-                    driver.execute_script("arguments[0].click();", header)
-                
-                time.sleep(0.5)
+        for idx, section in enumerate(sections):
+            title, content = section["title"], section["content"]
+            
+            if title and content:
+                accordion_data.append({
+                    "title": title,
+                    "content": content
+                })
                 
-                # Get panel body content
-                panel_body = wait.until(
-                    EC.visibility_of_element_located(
-                        (By.CSS_SELECTOR, ".panel-collapse.in .panel-body")
-                    )
-                )
-                
-                content = panel_body.text.strip()
-                
-                if title and content:
-                    accordion_data.append({
-                        "title": title,
-                        "content": content
-                    })
-                    
-                    print(f"{'='*60}")
-                    print(f"[ACCORDION {idx + 1}] {title}")
-                    print(f"{'='*60}")
-                    print(content)
-                    print(f"\n(Content length: {len(content)} characters)\n")
-                
-            except Exception as e:
-                print(f"Error processing accordion {idx + 1}: {e}")
-                continue
+                print(f"{'='*60}")
+                print(f"[ACCORDION {idx + 1}] {title}")
+                print(f"{'='*60}")
+                print(content)
+                print(f"\n(Content length: {len(content)} characters)\n")
                 
     except Exception as e:
         print(f"Error in scrape_accordion_sections: {e}")
@@ -74,18 +44,14 @@ def scrape_accordion_sections(driver, wait):
     return accordion_data
 
 
-def scrape_precat_page():
+def scrape_precat_page(driver=None):
     """
     Main function to scrape the Pre-CAT course page.
+    Pass a driver to reuse it (e.g. from a DriverPool); otherwise a new one is created and quit.
     """
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-
-    driver = webdriver.Chrome(options=chrome_options)
+    own_driver = driver is None
+    if own_driver:
+        driver = create_driver()
     wait = WebDriverWait(driver, 15)
 
     try:
@@ -93,9 +59,7 @@ def scrape_precat_page():
         print("STARTING PRE-CAT PAGE SCRAPING")
         print(f"{'#'*60}\n")
         
-        driver.get("https://www.sunbeaminfo.in/pre-cat")
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(1)
+        open_page(driver, "https://www.sunbeaminfo.in/pre-cat")
         
         # Get page title BEFORE closing driver
         page_title = driver.title
@@ -108,7 +72,8 @@ def scrape_precat_page():
         accordion_sections = scrape_accordion_sections(driver, wait)
 
         # Close driver
-        driver.quit()
+        if own_driver:
+            driver.quit()
 
         # Final Summary
         print("\n" + "#"*60)
@@ -129,7 +94,8 @@ def scrape_precat_page():
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.quit()
+        if own_driver:
+            driver.quit()
         return None
 
 
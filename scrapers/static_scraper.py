@@ -0,0 +1,187 @@
+"""
+HTTP-first scraping: fetch the page source with requests and parse it with BeautifulSoup.
+
+Accordion bodies, tables and contact details are already in the HTML; the
+Selenium scrapers only click panels to make them visible. Every page
+function here returns the same shape as its Selenium counterpart, or None
+when the static parse finds nothing, so callers can fall back to a browser.
+
+Pass a ScrapeState (scrapers.change_detection) to make fetches conditional.
+The parse_* functions take page source (a string or parsed soup), so they
+can be run against saved HTML without any network access.
+"""
+import copy
+import requests
+from bs4 import BeautifulSoup
+from scrapers.page_parsing import (
+    MAIN_DESCRIPTION_KEYWORDS, basic_info_from_rows, basic_info_from_text, contact_from_text, identify_tables, tables_to_records
+)
+
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; SunbeamScraper/1.0)"}
+
+# Tags that start a new line in rendered text (what Selenium's .text would show)
+BLOCK_TAGS = ["p", "div", "li", "tr", "table", "ul", "ol", "section", "h1", "h2", "h3", "h4", "h5", "h6"]
+
+_session = requests.Session()
+
+
+class NotModified(Exception):
+    """The page is the same as on the last run (304, or an identical body)."""
+
+
+def fetch_html(url, timeout=(5, 20), state=None):
+    """
+    GET the page source. With a ScrapeState, sends If-None-Match / If-Modified-Since
+    and raises NotModified when the server (or the body hash) says nothing changed.
+    """
+    headers = dict(HEADERS, **state.conditional_headers(url)) if state else HEADERS
+    response = _session.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        raise NotModified(url)
+    response.raise_for_status()
+    if state and not state.update(url, response.headers, response.text):
+        raise NotModified(url)
+    return response.text
+
+
+def _soup(html):
+    return html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, "html.parser")
+
+
+def _text(element):
+    """Rendered-style text: one line per block element, whitespace collapsed, blank lines dropped.
+
+    Works on a copy: the line breaks it inserts must not leak into later parses of the same soup.
+    """
+    element = copy.copy(element)
+    for br in element.find_all("br"):
+        br.replace_with("\n")
+    for tag in element.find_all(BLOCK_TAGS):
+        tag.insert_after("\n")
+    for cell in element.find_all(["td", "th"]):
+        cell.insert_after(" ")
+    lines = (" ".join(line.split()) for line in element.get_text().split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def parse_accordion_sections(page):
+    """
+    Returns list of {title, content} for every .panel-title link and the panel body it controls.
+    """
+    soup = _soup(page)
+    sections = []
+    for link in soup.select(".panel-title a"):
+        title = _text(link)
+        target = link.get("data-target") or link.get("href") or ""
+        panel = soup.find(id=target.split("#", 1)[1]) if "#" in target else None
+        if panel is None:
+            parent = link.find_parent(class_="panel")
+            panel = parent.select_one(".panel-collapse") if parent else None
+        body = panel.select_one(".panel-body") if panel else None
+        content = _text(body) if body else ""
+        if title and content:
+            sections.append({"title": title, "content": content})
+    return sections
+
+
+def parse_tables(page):
+    """
+    Same shape as internship.scrape_all_tables: {table_index, headers, data, row_count}.
+    """
+    soup = _soup(page)
+    return tables_to_records([
+        {
+            "th": [_text(th) for th in table.find_all("th")],
+            "rows": [[_text(td) for td in tr.find_all("td")] for tr in table.find_all("tr")]
+        }
+        for table in soup.find_all("table")
+    ])
+
+
+def parse_contact(page, url):
+    soup = _soup(page)
+    contact = contact_from_text(_text(soup.body or soup), url)
+    if not contact["emails"] and not contact["phones"]:
+        return None
+    return contact
+
+
+def _page_title(soup):
+    return soup.title.get_text(strip=True) if soup.title else ""
+
+
+def scrape_internship_static(url, state=None):
+    soup = _soup(fetch_html(url, state=state))
+    accordion_sections = parse_accordion_sections(soup)
+    programs_table, batches_table = identify_tables(parse_tables(soup))
+    # Tables filled in by JavaScript are missing from the HTML: let the browser scrape the page
+    if not programs_table or not batches_table:
+        return None
+    paragraphs = [_text(p) for p in soup.select("h5 ~ p")[:4]]
+    return {
+        "main_description": "\n\n".join(p for p in paragraphs if p),
+        "accordion_sections": accordion_sections,
+        "programs": programs_table['data'] if programs_table else [],
+        "batches": batches_table['data'] if batches_table else []
+    }
+
+
+def scrape_precat_static(url, state=None):
+    soup = _soup(fetch_html(url, state=state))
+    accordion_sections = parse_accordion_sections(soup)
+    if not accordion_sections:
+        return None
+    return {
+        "page_title": _page_title(soup),
+        "accordion_sections": accordion_sections
+    }
+
+
+def scrape_aboutus_static(url, state=None):
+    soup = _soup(fetch_html(url, state=state))
+    accordion_sections = parse_accordion_sections(soup)
+    paragraphs = [_text(p) for p in soup.find_all("p")]
+    main_description = "\n\n".join(
+        text for text in paragraphs
+        if len(text) > 100 and any(keyword in text for keyword in MAIN_DESCRIPTION_KEYWORDS)
+    )
+    if not accordion_sections and not main_description:
+        return None
+    return {
+        "page_title": _page_title(soup),
+        "url": url,
+        "main_description": main_description,
+        "accordion_sections": accordion_sections
+    }
+
+
+def scrape_course_static(url, course_name, state=None):
+    sections = parse_accordion_sections(fetch_html(url, state=state))
+    if not sections:
+        return None
+    return {
+        "course_name": course_name,
+        "url": url,
+        "sections": sections
+    }
+
+
+def scrape_mastering_mcqs_static(url, state=None):
+    soup = _soup(fetch_html(url, state=state))
+    sections = parse_accordion_sections(soup)
+    if not sections:
+        return None
+    basic_info = basic_info_from_text(_text(soup.body or soup), {})
+    rows = [[_text(td) for td in tr.find_all("td")] for tr in soup.select("table tr")]
+    basic_info_from_rows(rows, basic_info)
+    return {
+        "course_name": basic_info.get('course_name', 'Mastering MCQs'),
+        "page_title": _page_title(soup),
+        "url": url,
+        "basic_info": basic_info,
+        "sections": sections
+    }
+
+
+def scrape_contact_static(url, state=None):
+    return parse_contact(fetch_html(url, state=state), url)
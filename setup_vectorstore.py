@@ -1,13 +1,25 @@
+import argparse
 from sunbeam_rag_simple import SunbeamRAG  # Changed import
+from scrapers.change_detection import CHANGESET_PATH, load_changeset, mark_ingested
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--changeset", nargs="?", const=CHANGESET_PATH, help="only sync the files listed as changed by the last scrape")
+    args = parser.parse_args()
+
     print("Setting up Sunbeam RAG system...")
-    
+
     rag = SunbeamRAG()
-    rag.load_data_to_vectorstore()
-    
+    changeset_path = args.changeset or CHANGESET_PATH
+    changeset = load_changeset(args.changeset) if args.changeset else None
+    if args.changeset and changeset is None:
+        print(f"⚠ {args.changeset} not found, syncing everything")
+    if rag.load_data_to_vectorstore(changeset):
+        # A full sync also covers whatever the last scrape changed
+        mark_ingested(changeset or load_changeset(changeset_path) or {}, changeset_path)
+
     print("\n✓ Setup complete! Vector store is ready.")
-    
+
     print("\nTesting with a sample query...")
     result = rag.query("What internship programs are available?", max_results=5)
-    print(f"\nAnswer: {result['answer']}")
\ No newline at end of file
+    print(f"\nAnswer: {result['answer']}")
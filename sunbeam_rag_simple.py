@@ -1,136 +1,280 @@
-import requests
-import json
+import asyncio
 import re
 import os
+import queue
+import threading
 from dotenv import load_dotenv
 from sunbeam_vectorstore import SunbeamVectorStore
-from chunking import chunk_all_scraped_data
+from embedding_cache import EmbeddingCache
+from embedding_pipeline import EmbeddingPipeline
+from answer_cache import AnswerCache
+from llm_client import PROVIDERS, aclose_clients, achat_completion, chat_completion, get_client, stream_chat_completion
+from intent_router import IntentRouter
+from fact_store import FactStore
+from bm25_index import BM25Index, rrf_fuse
+from context_builder import build_context, context_budget, format_context
+from chunking import CHUNK_SOURCES, batched, chunk_id, iter_chunks
 
 load_dotenv()
 
+EMBED_MODEL = "text-embedding-nomic-embed-text-v1.5"
+EMBED_CACHE_PATH = "embedding_cache.sqlite3"
+FACTS_PATH = "facts.sqlite3"
+BM25_FILE = "bm25_index.json"  # inside persist_dir, next to the Chroma files
+RETRIEVAL_MODE = os.getenv("RETRIEVAL_MODE", "hybrid")  # hybrid | vector | lexical
+LEXICAL_CONFIDENCE = float(os.getenv("LEXICAL_CONFIDENCE", 0.9))  # above 1 turns the embedding-free shortcut off
+LEXICAL_MIN_TERMS = int(os.getenv("LEXICAL_MIN_TERMS", 2))  # fewer content terms than this never skip the embedding
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", 256))
+INGEST_QUEUE_DEPTH = int(os.getenv("INGEST_QUEUE_DEPTH", 2))
+LLM_PROVIDER = "Groq"
+LLM_MODEL = "llama-3.3-70b-versatile"
+
+DATA_FILES = {
+    'about_us': 'data/about_us_data.json',
+    'internship': 'data/internship_complete_data.json',
+    'precat': 'data/precat_data.json',
+    'modular_courses': 'data/modular_courses_data.json',
+    'mcq_course': 'data/mastering_mcqs_data.json',
+    'contact': 'data/contact_data.json'
+}
+
 class SunbeamRAG:
-    def __init__(self):
-        self.base_url = "http://127.0.0.1:1234/v1"
-        self.vs = SunbeamVectorStore("chroma_db", self.embed_query, self.embed_documents)
+    def __init__(self, persist_dir="chroma_db", embed_cache_path=EMBED_CACHE_PATH, facts_path=FACTS_PATH):
+        self.base_url = PROVIDERS["LM Studio"]["base_url"]
+        self.embed_cache = EmbeddingCache(embed_cache_path)
+        self.embedder = EmbeddingPipeline(
+            self.base_url,
+            EMBED_MODEL,
+            batch_size=int(os.getenv("EMBED_BATCH_SIZE", 32)),
+            max_workers=int(os.getenv("EMBED_WORKERS", 4)),
+            session=get_client("LM Studio").session
+        )
+        self.vs = SunbeamVectorStore(
+            persist_dir,
+            self.embed_query,
+            self.embed_documents,
+            backend=os.getenv("VECTOR_BACKEND", "chroma")
+        )
+        self.facts = FactStore(facts_path)
+        if self.facts.is_empty():
+            self.facts.rebuild(DATA_FILES)
+        self.bm25 = BM25Index(os.path.join(persist_dir, BM25_FILE))
+        if RETRIEVAL_MODE != "vector":
+            self.bm25.sync(self.vs)
+        # Centroid classifier is opt-in until INTENT_CENTROID_THRESHOLD has been calibrated on real questions
+        self.router = IntentRouter(
+            self.embed_documents if os.getenv("INTENT_CLASSIFIER", "0") == "1" else None,
+            threshold=float(os.getenv("INTENT_CENTROID_THRESHOLD", 0.75))
+        )
+        self.answer_cache = AnswerCache(
+            self.embed_query,
+            similarity_threshold=float(os.getenv("ANSWER_CACHE_THRESHOLD", 0.95)),
+            ttl=int(os.getenv("ANSWER_CACHE_TTL", 3600))
+        )
     
     def embed_query(self, text):
-        """Uses Nomic Embed from LM Studio (LOCAL)"""
-        response = requests.post(
-            f"{self.base_url}/embeddings",
-            json={
-                "input": text,
-                "model": "text-embedding-nomic-embed-text-v1.5"
-            }
-        )
-        return response.json()["data"][0]["embedding"]
+        """Uses Nomic Embed from LM Studio (LOCAL), served from the embedding cache when possible"""
+        return self.embed_documents([text])[0]
     
     def embed_documents(self, texts):
-        """Uses Nomic Embed from LM Studio (LOCAL)"""
-        try:
-            response = requests.post(
-                f"{self.base_url}/embeddings",
-                json={
-                    "input": texts,
-                    "model": "text-embedding-nomic-embed-text-v1.5"
-                }
-            )
-            result = response.json()
-            if "data" not in result:
-                return [self.embed_query(text) for text in texts]
-            return [item["embedding"] for item in result["data"]]
-        except Exception as e:
-            return [self.embed_query(text) for text in texts]
+        """Uses Nomic Embed from LM Studio (LOCAL), only for texts missing from the embedding cache"""
+        embeddings = self.embed_cache.get_many(EMBED_MODEL, texts)
+        missing = list(dict.fromkeys(t for t, e in zip(texts, embeddings) if e is None))
+        if missing:
+            fetched = dict(zip(missing, self.embedder.embed(missing)))
+            self.embed_cache.put_many(EMBED_MODEL, missing, [fetched[t] for t in missing])
+            embeddings = [e if e is not None else fetched[t] for t, e in zip(texts, embeddings)]
+        return embeddings
     
     def call_llm(self, prompt):
         """Uses Groq LLaMA 70B (CLOUD - SMART & FAST)"""
-        response = requests.post(
-            "https://api.groq.com/openai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {os.getenv('GROQ_API_KEY')}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "model": "llama-3.3-70b-versatile",
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-                "max_tokens": 300
-            }
-        )
-        return response.json()["choices"][0]["message"]["content"]
-    
-    def load_data_to_vectorstore(self):
-        file_paths = {
-            'about_us': 'data/about_us_data.json',
-            'internship': 'data/internship_complete_data.json',
-            'precat': 'data/precat_data.json',
-            'modular_courses': 'data/modular_courses_data.json',
-            'mcq_course': 'data/mastering_mcqs_data.json',
-            'contact': 'data/contact_data.json'
-        }
-        docs = chunk_all_scraped_data(file_paths)
-        print(f"Loading {len(docs)} documents...")
-        
-        documents = [doc.page_content for doc in docs]
-        metadatas = [doc.metadata for doc in docs]
-        doc_ids = [f"doc_{i}" for i in range(len(docs))]
-        
-        success = self.vs.add_documents(documents, metadatas, doc_ids)
-        print(f"✓ Loaded {len(docs)} documents!" if success else "❌ Failed")
+        return chat_completion(prompt, LLM_PROVIDER, LLM_MODEL)
+    
+    def call_llm_stream(self, prompt):
+        """Same as call_llm, but yields tokens as they arrive"""
+        return stream_chat_completion(prompt, LLM_PROVIDER, LLM_MODEL)
+    
+    def load_data_to_vectorstore(self, changeset=None):
+        """Incrementally sync the vector store with data/: only new or changed chunks are embedded, removed chunks are deleted.
+        
+        With a scrape change set (scrapers/change_detection.py), only the files it lists as changed are re-chunked and synced.
+        """
+        files = DATA_FILES
+        stored_where = None
+        if changeset is not None:
+            changed = set(changeset.get("changed_files", []))
+            files = {page_type: path for page_type, path in DATA_FILES.items() if os.path.basename(path) in changed}
+            if not files:
+                print("✓ Change set has no changed files, vector store already in sync")
+                return True
+            stored_where = {"source": [CHUNK_SOURCES[page_type] for page_type in files]}
+        
+        self.facts.rebuild(DATA_FILES)  # every file, in full: a few ms, and no stale fee or date can survive
+        stored_ids = self.vs.get_ids(stored_where)
+        seen_ids = set()
+        new_count = 0
+        
+        # file -> chunks -> embedding batches -> store writes. Only IDs are kept for the whole corpus;
+        # the bounded queue blocks chunking/embedding whenever the writer falls behind.
+        writes = queue.Queue(maxsize=INGEST_QUEUE_DEPTH)
+        errors = []
+        failed_sources = set()
+        
+        def writer():
+            while (item := writes.get()) is not None:
+                if errors:
+                    continue
+                try:
+                    if not self.vs.upsert_documents(*item):
+                        errors.append("upsert returned no embeddings")
+                except Exception as e:
+                    errors.append(e)
+        
+        write_thread = threading.Thread(target=writer, daemon=True)
+        write_thread.start()
+        try:
+            for batch in batched(iter_chunks(files, failed=failed_sources), INGEST_BATCH_SIZE):
+                if errors:
+                    break
+                new_docs = []
+                for doc in batch:
+                    doc_id = chunk_id(doc)
+                    if doc_id not in seen_ids:
+                        seen_ids.add(doc_id)
+                        if doc_id not in stored_ids:
+                            new_docs.append((doc_id, doc))
+                if new_docs:
+                    documents = [doc.page_content for _, doc in new_docs]
+                    metadatas = [doc.metadata for _, doc in new_docs]
+                    writes.put((documents, metadatas, [doc_id for doc_id, _ in new_docs], self.embed_documents(documents)))
+                    new_count += len(new_docs)
+        finally:
+            writes.put(None)
+            write_thread.join()
+        
+        stale_ids = stored_ids - seen_ids
+        if failed_sources:
+            # A source file that could not be read says nothing about its chunks: keep what is stored for it
+            stale_ids -= self.vs.get_ids({"source": [CHUNK_SOURCES[page_type] for page_type in failed_sources]})
+            print(f"⚠ Kept the stored chunks of unreadable sources: {', '.join(sorted(failed_sources))}")
+        if not errors:
+            print(f"Synced {len(seen_ids)} documents: {new_count} new/changed, {len(stale_ids)} removed, {len(seen_ids) - new_count} unchanged")
+            self.vs.delete_documents(stale_ids)
+        else:
+            print(f"❌ Write failed after {new_count} new/changed documents: {errors[0]}")
+        success = not errors and not failed_sources
+        if new_count or stale_ids:
+            self.answer_cache.invalidate()
+            if RETRIEVAL_MODE != "vector":
+                self.bm25.sync(self.vs)
+        
+        print(f"✓ Vector store in sync ({len(seen_ids)} documents)" if success else "❌ Failed")
         return success
     
     def get_all_internship_programs(self):
-        all_docs = self.vs.get_all_documents()
+        if programs := self.facts.programs():
+            return programs
+        program_docs = self.vs.get_all_documents(where={'page': 'internship', 'section_type': 'program'})
         programs = []
         seen = set()
         
-        for doc in all_docs:
+        for doc in program_docs:
             metadata = doc.get('metadata', {})
-            if metadata.get('section_type') == 'program' and metadata.get('page') == 'internship':
-                tech = metadata.get('technology', 'Unknown')
-                loc = metadata.get('location', 'Unknown')
-                key = f"{tech}|{loc}"
-                if key not in seen and tech != 'N/A':
-                    seen.add(key)
-                    programs.append({'technology': tech, 'location': loc})
+            tech = metadata.get('technology', 'Unknown')
+            loc = metadata.get('location', 'Unknown')
+            key = f"{tech}|{loc}"
+            if key not in seen and tech != 'N/A':
+                seen.add(key)
+                programs.append({'technology': tech, 'location': loc})
         return programs
     
-    def query(self, question: str, max_results=None):
-        question_lower = question.lower().strip()
+    def get_all_courses(self):
+        course_docs = self.vs.get_all_documents(where={'page': 'modular_courses', 'section_type': 'course_detail'})
+        courses = []
+        seen = set()
         
-        list_keywords = ['what are', 'list', 'all', 'available', 'programs', 'courses', 'which']
-        is_list_question = any(kw in question_lower for kw in list_keywords)
+        for doc in course_docs:
+            metadata = doc.get('metadata', {})
+            course_name = metadata.get('course_name', '')
+            if course_name and course_name not in seen and course_name != 'Unknown':
+                seen.add(course_name)
+                courses.append({'name': course_name, 'duration': metadata.get('duration', 'N/A')})
+        return sorted(courses, key=lambda c: c['name'])
+    
+    def generation(self):
+        """
+        The vector store generation, for answer caching. When the store was re-ingested (possibly by another
+        process), the BM25 postings are brought up to date first, so the lexical path never answers from old chunks.
+        """
+        generation = self.vs.generation()
+        if RETRIEVAL_MODE != "vector" and self.bm25.digest != generation:
+            self.bm25.sync(self.vs, generation)
+        return generation
+    
+    def is_lexical(self, question):
+        """True when BM25 alone is trusted for this question: retrieval, routing and caching then make no embedding call"""
+        if RETRIEVAL_MODE == "vector" or not self.bm25.loaded:
+            return False
+        return RETRIEVAL_MODE == "lexical" or self.bm25.confidence(question, LEXICAL_MIN_TERMS) >= LEXICAL_CONFIDENCE
+    
+    def search(self, question, max_results=5, lexical=None):
+        """BM25 hits when the keywords are conclusive, else vector and BM25 hits fused by reciprocal rank"""
+        if lexical is None:
+            lexical = self.is_lexical(question)
+        if lexical:
+            return self.bm25.search(question, max_results)
+        if RETRIEVAL_MODE == "vector" or not self.bm25.loaded:
+            return self.vs.find_similar_documents(question, max_results)
+        vector_docs = self.vs.find_similar_documents(question, max_results * 2)
+        return rrf_fuse([vector_docs, self.bm25.search(question, max_results * 2)], max_results)
+    
+    def query(self, question: str, max_results=None):
+        scope = f"query:{max_results}"
+        generation = self.generation()
+        lexical = self.is_lexical(question)
+        cached = self.answer_cache.get(question, scope, generation, semantic=not lexical)
+        if cached is not None:
+            return cached
+        result = self._answer(question, max_results, lexical)
+        self.answer_cache.put(question, result, scope, generation, embed=not lexical)
+        return result
+    
+    def _route(self, question, max_results=None, lexical=False):
+        intent, is_list = self.router.route(question, classify=not lexical)
+        if intent == "contact":
+            return "contact", 5
+        if intent in ("internship_programs", "course_list"):
+            return intent, max_results or 8
+        if intent in ("fees", "schedule"):
+            return "facts", max_results or 8
+        return "llm", max_results or (8 if is_list else 4)
+    
+    def _contact_answer(self, docs):
+        context = "\n\n".join([doc["document"] for doc in docs])
         
-        # Contact queries (keep this - it's more accurate than LLM extraction)
-        contact_keywords = ['email', 'contact', 'phone', 'number', 'address', 'reach']
-        if any(kw in question_lower for kw in contact_keywords):
-            similar_docs = self.vs.find_similar_documents(question, 5)
-            context = "\n\n".join([doc["document"] for doc in similar_docs])
-            
-            emails = list(set(re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', context)))
-            phones = list(set(re.findall(r'[\+\d][\d\-\(\)\s]{8,}[\d]', context)))
-            
-            answer = "📧 Email: " + ", ".join(emails) if emails else ""
-            if phones:
-                answer += ("\n" if answer else "") + "📞 Phone: " + ", ".join(phones[:2])
-            if not emails and not phones:
-                answer = "Contact info not found. Visit: https://www.sunbeaminfo.in/contact-us"
-            
-            return {"answer": answer, "sources": similar_docs}
+        emails = list(set(re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', context)))
+        phones = list(set(re.findall(r'[\+\d][\d\-\(\)\s]{8,}[\d]', context)))
         
-        # Internship programs (keep this - more reliable than LLM)
-        if is_list_question and 'internship' in question_lower and 'program' in question_lower:
-            programs = self.get_all_internship_programs()
-            if programs:
-                answer = "Internship programs at Sunbeam:\n\n" + "\n".join([f"{i}. {p['technology']} - {p['location']}" for i, p in enumerate(programs, 1)])
-                return {"answer": answer, "sources": [], "total_programs": len(programs)}
-        
-        # For everything else (including greetings), use the LLM
-        max_results = max_results or (8 if is_list_question else 4)
-        similar_docs = self.vs.find_similar_documents(question, max_results)
-        context = "\n\n".join([doc["document"] for doc in similar_docs])
+        answer = "📧 Email: " + ", ".join(emails) if emails else ""
+        if phones:
+            answer += ("\n" if answer else "") + "📞 Phone: " + ", ".join(phones[:2])
+        if not emails and not phones:
+            answer = "Contact info not found. Visit: https://www.sunbeaminfo.in/contact-us"
+        return answer
+    
+    def _programs_answer(self, programs):
+        answer = "Internship programs at Sunbeam:\n\n" + "\n".join([f"{i}. {p['technology']} - {p['location']}" for i, p in enumerate(programs, 1)])
+        return {"answer": answer, "sources": [], "total_programs": len(programs)}
+    
+    def _courses_answer(self, courses):
+        answer = "Modular courses at Sunbeam:\n\n" + "\n".join([f"{i}. {c['name']} - Duration: {c['duration']}" for i, c in enumerate(courses, 1)])
+        return {"answer": answer, "sources": [], "total_courses": len(courses)}
+    
+    def _build_prompt(self, question, similar_docs):
+        context = format_context(build_context(similar_docs, context_budget(LLM_PROVIDER, LLM_MODEL)))
         
         # Smart prompt that handles both casual and technical questions
-        prompt = f"""You are a helpful assistant for Sunbeam Institute.
+        return f"""You are a helpful assistant for Sunbeam Institute.
 
 Question: {question}
 
@@ -143,9 +287,114 @@ Instructions:
 - Be conversational and helpful
 
 Answer:"""
+    
+    def _answer(self, question, max_results=None, lexical=False):
+        route, num_docs = self._route(question, max_results, lexical)
+        
+        # Contact queries (keep this - it's more accurate than LLM extraction)
+        if route == "contact":
+            similar_docs = self.search(question, num_docs, lexical)
+            contact_docs = self.vs.get_all_documents(where={'page': 'contact'})
+            return {"answer": self._contact_answer(similar_docs + contact_docs), "sources": similar_docs}
+        
+        # Internship programs (keep this - more reliable than LLM)
+        if route == "internship_programs":
+            programs = self.get_all_internship_programs()
+            if programs:
+                return self._programs_answer(programs)
+        
+        if route == "course_list":
+            courses = self.get_all_courses()
+            if courses:
+                return self._courses_answer(courses)
+        
+        # Fees, dates and durations straight from the fact store; the LLM only if no batch matches
+        if route == "facts":
+            answer = self.facts.answer(question)
+            if answer:
+                return {"answer": answer, "sources": []}
         
-        answer = self.call_llm(prompt)
+        # For everything else (including greetings), use the LLM
+        similar_docs = self.search(question, num_docs, lexical)
+        answer = self.call_llm(self._build_prompt(question, similar_docs))
         return {"answer": answer, "sources": similar_docs}
     
+    async def aembed_query(self, text):
+        """Async embed_query over the pooled async client, served from the embedding cache when possible"""
+        cached = self.embed_cache.get(EMBED_MODEL, text)
+        if cached is not None:
+            return cached
+        embedding = await get_client("LM Studio").apost(
+            "/embeddings", {"input": [text], "model": EMBED_MODEL}, parse=lambda data: data["data"][0]["embedding"]
+        )
+        self.embed_cache.put(EMBED_MODEL, text, embedding)
+        return embedding
+    
+    async def _asearch(self, question, max_results, lexical=False):
+        if lexical:
+            return await asyncio.to_thread(self.bm25.search, question, max_results)
+        embedding = await self.aembed_query(question)
+        if RETRIEVAL_MODE == "vector" or not self.bm25.loaded:
+            return await asyncio.to_thread(self.vs.find_similar_documents_by_embedding, embedding, max_results)
+        vector_docs = await asyncio.to_thread(self.vs.find_similar_documents_by_embedding, embedding, max_results * 2)
+        return rrf_fuse([vector_docs, self.bm25.search(question, max_results * 2)], max_results)
+    
+    async def aquery(self, question: str, max_results=None):
+        """Async query(): one event loop can serve many questions at once"""
+        scope = f"query:{max_results}"
+        generation = await asyncio.to_thread(self.generation)
+        lexical = await asyncio.to_thread(self.is_lexical, question)
+        cached = await asyncio.to_thread(self.answer_cache.get, question, scope, generation, not lexical)
+        if cached is not None:
+            return cached
+        result = await self._aanswer(question, max_results, lexical)
+        await asyncio.to_thread(self.answer_cache.put, question, result, scope, generation, not lexical)
+        return result
+    
+    async def _aanswer(self, question, max_results=None, lexical=False):
+        route, num_docs = await asyncio.to_thread(self._route, question, max_results, lexical)
+        
+        # The contact page fetch needs no embedding, so it runs while the question is embedded and searched
+        if route == "contact":
+            similar_docs, contact_docs = await asyncio.gather(
+                self._asearch(question, num_docs, lexical),
+                asyncio.to_thread(self.vs.get_all_documents, {'page': 'contact'})
+            )
+            return {"answer": self._contact_answer(similar_docs + contact_docs), "sources": similar_docs}
+        
+        # Listings and facts usually answer without retrieval: only search when they come back empty
+        if route == "internship_programs":
+            programs = await asyncio.to_thread(self.get_all_internship_programs)
+            if programs:
+                return self._programs_answer(programs)
+        elif route == "course_list":
+            courses = await asyncio.to_thread(self.get_all_courses)
+            if courses:
+                return self._courses_answer(courses)
+        elif route == "facts":
+            answer = await asyncio.to_thread(self.facts.answer, question)
+            if answer:
+                return {"answer": answer, "sources": []}
+        
+        similar_docs = await self._asearch(question, num_docs, lexical)
+        answer = await achat_completion(self._build_prompt(question, similar_docs), LLM_PROVIDER, LLM_MODEL)
+        return {"answer": answer, "sources": similar_docs}
+    
+    async def aclose(self):
+        """Close this event loop's pooled async HTTP clients; call it before the loop running aquery() ends"""
+        await aclose_clients()
+    
     def get_vector_store(self):
-        return self.vs
\ No newline at end of file
+        return self.vs
+
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine():
+    """Process-wide SunbeamRAG shared by every Streamlit session and thread"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = SunbeamRAG()
+    return _engine
@@ -1,12 +1,89 @@
+import threading
 import chromadb
+from bm25_index import ids_digest
+from numpy_index import NumpyIndex
+
+FACET_FIELDS = ("page", "section_type", "course_name", "technology", "location")
+
+def build_where(where):
+    """Turn {"page": "internship", "section_type": ["program", "batch_schedule"]} into a Chroma where clause."""
+    if not where:
+        return None
+    clauses = [{k: {"$in": list(v)} if isinstance(v, (list, tuple, set)) else v} for k, v in where.items()]
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
 
 class SunbeamVectorStore:
-    def __init__(self, persist_dir: str, query_embed_func=None, docs_embed_func=None):
+    def __init__(self, persist_dir: str, query_embed_func=None, docs_embed_func=None, backend="chroma"):
+        """backend: "chroma" queries the collection's HNSW index, "numpy" searches an in-memory copy of it."""
         self.persist_dir = persist_dir
         self.db = chromadb.PersistentClient(path=persist_dir)
         self.col = self.db.get_or_create_collection("sunbeam_courses")
         self.query_embed_func = query_embed_func
         self.docs_embed_func = docs_embed_func
+        if backend not in ("chroma", "numpy"):
+            raise ValueError(f"Unknown vector store backend: {backend}")
+        self.index = NumpyIndex() if backend == "numpy" else None
+        self._facet_state = None  # (records, positions, facets), replaced as a whole
+        self._lock = threading.Lock()
+        self._generation = None  # stored-ID digest the derived indexes were last checked against
+
+    def _invalidate(self):
+        """Drop derived indexes after a write."""
+        with self._lock:
+            self._facet_state = None
+            if self.index is not None:
+                self.index.invalidate()
+
+    def generation(self):
+        """
+        Digest of the stored chunk IDs. IDs are content hashes, so it changes on every re-ingest,
+        including one made by another process (setup_vectorstore.py); caches compare it to detect
+        stale answers, and derived indexes are dropped when it changes.
+        """
+        digest = ids_digest(self.get_ids())
+        if digest != self._generation:
+            self._invalidate()
+            self._generation = digest
+        return digest
+
+    def _ensure_index(self):
+        with self._lock:
+            if not self.index.loaded:
+                self.index.load(self.col)
+
+    def _facet_index(self):
+        """Record cache and value -> IDs index for every facet field, built once per write."""
+        with self._lock:
+            if self._facet_state is None:
+                self._facet_state = self._load_facets()
+            return self._facet_state
+
+    def _load_facets(self):
+        results = self.col.get(include=["documents", "metadatas"])
+        records, positions = {}, {}
+        facets = {field: {} for field in FACET_FIELDS}
+        for i, (id, doc, metadata) in enumerate(zip(results["ids"], results["documents"], results["metadatas"])):
+            metadata = metadata or {}
+            records[id] = {"id": id, "document": doc, "metadata": metadata}
+            positions[id] = i
+            for field in FACET_FIELDS:
+                if field in metadata:
+                    facets[field].setdefault(metadata[field], set()).add(id)
+        return records, positions, facets
+
+    def _filter_ids(self, where):
+        """IDs matching a where filter, from the facet index when every field is a facet."""
+        if not all(field in FACET_FIELDS for field in where):
+            return set(self.col.get(where=build_where(where), include=[])["ids"])
+        _, _, facets = self._facet_index()
+        matched = None
+        for field, value in where.items():
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            ids = set().union(*(facets[field].get(v, set()) for v in values))
+            matched = ids if matched is None else matched & ids
+            if not matched:
+                break
+        return matched
     
     def add_documents(self, docs, metadatas, doc_ids, embeddings=None) -> bool:
         """Add multiple documents to the vector store."""
@@ -15,37 +92,91 @@ class SunbeamVectorStore:
                 embeddings = self.docs_embed_func(docs)
         if embeddings:
             self.col.add(doc_ids, embeddings, metadatas, docs)
+            self._invalidate()
+            return True
+        return False
+
+    def upsert_documents(self, docs, metadatas, doc_ids, embeddings=None) -> bool:
+        """Insert or overwrite documents by ID."""
+        if not embeddings:
+            if self.docs_embed_func:
+                embeddings = self.docs_embed_func(docs)
+        if embeddings:
+            self.col.upsert(doc_ids, embeddings, metadatas, docs)
+            self._invalidate()
             return True
         return False
 
+    def delete_documents(self, doc_ids):
+        """Delete documents by ID."""
+        if doc_ids:
+            self.col.delete(ids=list(doc_ids))
+            self._invalidate()
+
+    def get_ids(self, where=None):
+        """Manifest of the IDs already stored (optionally only those matching where), without loading documents or embeddings."""
+        return set(self.col.get(where=build_where(where), include=[])["ids"])
+
     def add_document(self, doc, metadata: dict, doc_id: str, embedding=None) -> bool:
         """Add a single document to the vector store."""
         embeddings = [embedding] if embedding else None
         return self.add_documents([doc], [metadata], [doc_id], embeddings)
     
-    def find_similar_documents(self, query_text, max_results=5):
-        """Find documents similar to the query."""
+    def find_similar_documents(self, query_text, max_results=5, where=None):
+        """Find documents similar to the query, optionally restricted by a metadata filter."""
         query_embedding = self.query_embed_func(query_text)
-        results = self.col.query(query_embeddings=[query_embedding], n_results=max_results)
+        return self._search([query_embedding], max_results, where)[0]
+    
+    def find_similar_documents_by_embedding(self, query_embedding, max_results=5, where=None):
+        """Same as find_similar_documents, for a query that is already embedded."""
+        return self._search([query_embedding], max_results, where)[0]
+    
+    def find_similar_documents_many(self, queries, max_results=5, where=None):
+        """Find documents similar to each query: one embedding call and one search for the whole batch."""
+        queries = list(queries)
+        if not queries:
+            return []
+        if self.docs_embed_func:
+            query_embeddings = self.docs_embed_func(queries)
+        else:
+            query_embeddings = [self.query_embed_func(q) for q in queries]
+        return self._search(query_embeddings, max_results, where)
+    
+    def _search(self, query_embeddings, max_results, where=None):
+        """Returns one result list per query embedding."""
+        if self.index is not None:
+            self._ensure_index()
+            candidate_ids = self._filter_ids(where) if where else None
+            return self.index.search_many(query_embeddings, max_results, candidate_ids)
+        results = self.col.query(query_embeddings=query_embeddings, n_results=max_results, where=build_where(where))
         
-        found_results = []
-        for id, doc, metadata, distance in zip(
-            results["ids"][0], 
-            results["documents"][0], 
-            results["metadatas"][0], 
-            results["distances"][0]
+        all_results = []
+        for ids, docs, metadatas, distances in zip(
+            results["ids"], 
+            results["documents"], 
+            results["metadatas"], 
+            results["distances"]
         ):
-            found_results.append({
-                "id": id,
-                "document": doc,
-                "metadata": metadata,
-                "distance": distance
-            })
-        return found_results
+            found_results = []
+            for id, doc, metadata, distance in zip(ids, docs, metadatas, distances):
+                found_results.append({
+                    "id": id,
+                    "document": doc,
+                    "metadata": metadata,
+                    "distance": distance
+                })
+            all_results.append(found_results)
+        return all_results
     
-    def get_all_documents(self):
-        """Get all documents from the vector store."""
-        results = self.col.get()
+    def get_all_documents(self, where=None):
+        """Get all documents from the vector store, optionally only those matching a metadata filter."""
+        if not where or all(field in FACET_FIELDS for field in where):
+            records, positions, _ = self._facet_index()
+            if not where:
+                return list(records.values())
+            return [records[id] for id in sorted(self._filter_ids(where), key=positions.get) if id in records]
+        
+        results = self.col.get(where=build_where(where))
         found_results = []
         for id, doc, metadata in zip(results["ids"], results["documents"], results["metadatas"]):
             found_results.append({
@@ -53,4 +184,4 @@ class SunbeamVectorStore:
                 "document": doc,
                 "metadata": metadata
             })
-        return found_results
\ No newline at end of file
+        return found_results
@@ -0,0 +1,52 @@
+"""BM25 confidence: when a question may skip the embedding call."""
+import os
+import pytest
+from bm25_index import BM25Index, tokenize
+from sunbeam_rag_simple import LEXICAL_MIN_TERMS, SunbeamRAG
+from sunbeam_vectorstore import SunbeamVectorStore
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+
+DOCS = [
+    "MERN internship batch IIT-08-H-A-MERN fees Rs. 4000/-",
+    "Pre-CAT batch PM-48 starts 16-Feb-2026",
+    "Mastering MCQs course fees Rs. 3000/-",
+    "Hi, welcome to the course catalogue",
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = BM25Index(str(tmp_path / "bm25_index.json"))
+    index.build([{"id": str(i), "document": doc} for i, doc in enumerate(DOCS)])
+    return index
+
+
+@pytest.mark.parametrize("question", ["Hi", "course", "What is the course?", "Tell me about GenAI"])
+def test_one_term_question_is_not_conclusive(index, question):
+    assert index.confidence(question, LEXICAL_MIN_TERMS) == 0.0
+
+
+def test_named_batch_question_is_conclusive(index):
+    assert index.confidence("MERN internship fees", LEXICAL_MIN_TERMS) == 1.0
+    assert index.confidence("MERN internship fees", min_terms=4) == 0.0
+
+
+def test_unknown_term_pulls_confidence_down(index):
+    assert index.confidence("Kubernetes internship fees", LEXICAL_MIN_TERMS) < 0.9
+
+
+def test_tokenize_keeps_names_and_singularizes():
+    assert tokenize("Does the Pre-CAT batches fees cover .NET and C++?") == ["pre-cat", "pre", "cat", "batch", "fee", "cover", ".net", "c++"]
+
+
+def test_engine_picks_up_an_outside_reingest(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)  # DATA_FILES are relative to the repo root
+    store = str(tmp_path / "chroma")
+    rag = SunbeamRAG(store, str(tmp_path / "embed_cache.sqlite3"), str(tmp_path / "facts.sqlite3"))
+    assert rag.bm25.search("Kubernetes workshop") == []
+    # setup_vectorstore.py in another process: its own store instance on the same directory
+    SunbeamVectorStore(store).add_documents(["Kubernetes workshop batch K8S-01"], [{"page": "course"}], ["k8s"], [[1.0, 0.0]])
+    generation = rag.generation()
+    assert [doc["id"] for doc in rag.bm25.search("Kubernetes workshop")] == ["k8s"]
+    assert rag.bm25.digest == generation
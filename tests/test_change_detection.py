@@ -0,0 +1,37 @@
+"""Change sets: files changed by a scrape stay listed until they are ingested."""
+import json
+from scrapers.change_detection import build_changeset, load_changeset, mark_ingested, pending_files, write_json
+
+INTERNSHIP = {"batches": [{"Batch": "IIT-08-H-A-MERN", "Fees (Rs.)": "4000"}]}
+
+
+def scrape(path, pages):
+    """What the orchestrator does after a run: carry over pending files and write the change set."""
+    changeset = build_changeset(pages, pending_files(load_changeset(path)))
+    write_json(path, changeset)
+    return changeset
+
+
+def test_changes_survive_a_scrape_that_was_not_ingested(tmp_path):
+    path = str(tmp_path / "changeset.json")
+    changed = dict(INTERNSHIP, batches=[{"Batch": "IIT-08-H-A-MERN", "Fees (Rs.)": "5000"}])
+    first = scrape(path, {"internship_complete_data.json": {"status": "scraped", "old": INTERNSHIP, "new": changed}})
+    assert first["changed_files"] == ["internship_complete_data.json"]
+    second = scrape(path, {"internship_complete_data.json": {"status": "unchanged"}})
+    assert second["changed_files"] == ["internship_complete_data.json"]
+
+
+def test_ingested_changeset_is_not_carried_over(tmp_path):
+    path = str(tmp_path / "changeset.json")
+    first = scrape(path, {"internship_complete_data.json": {"status": "scraped", "old": None, "new": INTERNSHIP}})
+    mark_ingested(first, path)
+    assert scrape(path, {"internship_complete_data.json": {"status": "unchanged"}})["changed_files"] == []
+
+
+def test_mark_ingested_leaves_a_newer_changeset_alone(tmp_path):
+    path = str(tmp_path / "changeset.json")
+    newer = {"generated_at": "2026-10-18T10:00:00", "changed_files": ["precat_data.json"], "files": {}}
+    write_json(path, newer)
+    mark_ingested({"generated_at": "2026-10-18T09:00:00"}, path)
+    with open(path, encoding="utf-8") as f:
+        assert "ingested_at" not in json.load(f)
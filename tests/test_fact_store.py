@@ -0,0 +1,78 @@
+"""Fact store lookups against the scraped files in data/ (no network, no LLM)."""
+import os
+import shutil
+import pytest
+from fact_store import FactStore
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+DATA_FILES = {
+    'internship': 'data/internship_complete_data.json',
+    'precat': 'data/precat_data.json',
+    'modular_courses': 'data/modular_courses_data.json',
+    'mcq_course': 'data/mastering_mcqs_data.json',
+}
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Copies of the scraped files that a test may break."""
+    copies = {}
+    for page_type, path in DATA_FILES.items():
+        copies[page_type] = str(tmp_path / os.path.basename(path))
+        shutil.copy(os.path.join(ROOT, path), copies[page_type])
+    return copies
+
+
+@pytest.fixture
+def facts(tmp_path, files):
+    store = FactStore(str(tmp_path / "facts.sqlite3"))
+    store.rebuild(files)
+    yield store
+    store.close()
+
+
+def test_named_offering_is_answered(facts):
+    assert facts.answer("What are the fees for the MERN internship?").endswith("- Fees: Rs. 4000/-")
+    assert [row["batch"] for row in facts.lookup("When does Pre-CAT batch PM-48 start?")] == ["PM-48"]
+
+
+@pytest.mark.parametrize("question", [
+    "How much does the Kubernetes course cost?",
+    "How much does the Rust internship cost?",
+    "What is the fee?",
+])
+def test_unknown_or_missing_name_falls_back_to_retrieval(facts, question):
+    assert facts.lookup(question) == []
+    assert facts.answer(question) is None
+
+
+def test_kind_word_alone_lists_that_kind(facts):
+    rows = facts.lookup("What are the internship fees?")
+    assert rows and {row["kind"] for row in rows} == {"internship"}
+
+
+def test_unreadable_source_keeps_its_previous_rows(facts, files):
+    internships = len(facts.lookup("What are the internship fees?"))
+    with open(files["internship"], "w", encoding="utf-8") as f:
+        f.write('{"batches": [')
+    facts.rebuild(files)
+    assert len(facts.lookup("What are the internship fees?")) == internships
+    assert facts.programs()
+    assert facts.lookup("When does Pre-CAT batch PM-48 start?")
+
+
+@pytest.mark.parametrize("question, facet", [
+    ("How much does the internship cost?", "Fees"),
+    ("When does the internship start?", "Schedule"),
+    ("What are the internship batches fees?", "Fees"),
+    ("What is the fees structure of internship?", "Fees"),
+])
+def test_everyday_phrasing_lists_the_kind(facts, question, facet):
+    rows = facts.lookup(question)
+    assert rows and {row["kind"] for row in rows} == {"internship"}
+    assert f"- {facet}: " in facts.answer(question)
+
+
+def test_plurals_and_aliases_match_the_names(facts):
+    assert [row["batch"] for row in facts.lookup("What are the fees for GenAI internships?")] == ["IIT-08-H-A-Generative AI"]
+    assert facts.lookup("When do Mastering MCQs batches start?")
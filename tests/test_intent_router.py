@@ -0,0 +1,41 @@
+"""Keyword routing table for IntentRouter (no embedding classifier)."""
+import pytest
+from intent_router import IntentRouter, Route
+
+ROUTES = [
+    # listings
+    ("Show me every internship", Route("internship_programs", True)),
+    ("List all internship programs", Route("internship_programs", True)),
+    ("Which internships are available?", Route("internship_programs", True)),
+    ("List all modular courses", Route("course_list", True)),
+    ("What are the courses offered?", Route("course_list", True)),
+    # "all" / "give me" with details or a named course is a question, not a listing
+    ("Give me all the details about the DAC course", Route("llm", True)),
+    ("what are all courses related to AI", Route("llm", True)),
+    ("Show me the syllabus of all courses", Route("llm", True)),
+    ("Tell me about the internship programs", Route("llm", False)),
+    ("What are the internships in Java?", Route("llm", True)),
+    ("What are the benefits of the internship program", Route("llm", False)),
+    # contact
+    ("What is the Sunbeam email address?", Route("contact", False)),
+    ("How can I reach Sunbeam on WhatsApp?", Route("contact", False)),
+    # fees and schedules of a named offering
+    ("What are the fees for the MERN internship?", Route("fees", False)),
+    ("How much does the Mastering MCQs course cost?", Route("fees", False)),
+    ("When does Pre-CAT batch PM-48 start?", Route("schedule", False)),
+    ("What is the duration of the DBDA course?", Route("schedule", False)),
+    # everything else
+    ("Hi, how are you?", Route("llm", False)),
+    ("Who is eligible for Pre-CAT?", Route("llm", False)),
+]
+
+
+@pytest.mark.parametrize("question, expected", ROUTES)
+def test_keyword_route(question, expected):
+    assert IntentRouter().route(question) == expected
+
+
+def test_classifier_is_skipped_when_asked():
+    def embed(texts):
+        raise AssertionError("classify=False must not embed")
+    assert IntentRouter(embed).route("Hi, how are you?", classify=False) == Route("llm", False)
@@ -0,0 +1,65 @@
+"""Provider client failure handling, against canned HTTP responses (no network)."""
+import pytest
+import requests
+import llm_client
+from llm_client import ProviderClient, ProviderError, chat_completion
+
+
+def response(status, body):
+    r = requests.Response()
+    r.status_code = status
+    r._content = body.encode("utf-8")
+    r._content_consumed = True
+    r.url = "http://provider.test/v1/chat/completions"
+    r.reason = "canned"
+    return r
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    """Two providers, Groq then LM Studio; serve(name, status, body) sets what each one answers."""
+    monkeypatch.setattr(llm_client, "_clients", {})
+    monkeypatch.setattr(llm_client, "FAILOVER_ORDER", ["Groq", "LM Studio"])
+    replies = {}
+
+    def serve(name, status, body):
+        client = llm_client.get_client(name)
+        client.backoff = 0
+        replies[name] = (status, body)
+        monkeypatch.setattr(client.session, "post", lambda *args, **kwargs: response(*replies[name]))
+        return client
+    return serve
+
+
+def test_malformed_body_fails_over_and_counts_against_the_breaker(providers):
+    groq = providers("Groq", 200, '{"error": "overloaded"}')
+    providers("LM Studio", 200, '{"choices": [{"message": {"content": "Rs. 4000/-"}}]}')
+    assert chat_completion("fees?", "Groq", "llama") == "Rs. 4000/-"
+    assert groq.breaker.failures == 1
+    assert groq.histogram.count == groq.cold_histogram.count == 0
+
+
+def test_bad_request_does_not_open_the_circuit(providers):
+    groq = providers("Groq", 401, '{"error": "invalid api key"}')
+    groq.breaker.failure_threshold = 1
+    with pytest.raises(ProviderError):
+        groq.post("/chat/completions", {})
+    assert groq.breaker.failures == 0
+    assert groq.breaker.state == "closed"
+
+
+def test_server_error_opens_the_circuit(providers):
+    groq = providers("Groq", 503, "")
+    groq.breaker.failure_threshold = 1
+    with pytest.raises(ProviderError):
+        groq.post("/chat/completions", {})
+    assert groq.breaker.state == "open"
+
+
+def test_rejected_trial_call_frees_the_half_open_slot():
+    client = ProviderClient("x", max_retries=0)
+    client.breaker.reset_timeout = 0
+    client.breaker.record_failure(), client.breaker.record_failure(), client.breaker.record_failure()
+    with pytest.raises(ProviderError):
+        client.call(lambda: (_ for _ in ()).throw(requests.HTTPError(response=response(422, ""))))
+    assert client.breaker.allow()
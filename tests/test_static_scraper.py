@@ -0,0 +1,106 @@
+"""Static scraper parsers against saved pages in tests/fixtures (no network, no selenium)."""
+import os
+import pytest
+from bs4 import BeautifulSoup
+from scrapers import static_scraper
+from scrapers.static_scraper import parse_accordion_sections, parse_contact, parse_tables
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Make fetch_html return a fixture page instead of going to the network."""
+    def use(name):
+        monkeypatch.setattr(static_scraper, "fetch_html", lambda url, state=None: load(name))
+    return use
+
+
+def test_accordion_sections_follow_href_data_target_and_parent_panel():
+    sections = parse_accordion_sections(load("precat.html"))
+    assert [s["title"] for s in sections] == ["Eligibility Criteria", "Pre-CAT Batches schedule"]
+    assert sections[0]["content"] == "Students eligible for Full-time PG Courses"
+    assert sections[1]["content"] == "1 PM-48 16-Feb-2026 25-Mar-2026\nSchedule : Mon-Sat"
+
+
+def test_accordion_text_has_one_line_per_block():
+    sections = parse_accordion_sections(load("internship.html"))
+    assert sections[0]["content"] == "At Sunbeam, we recognize the importance of practical experience.\n2 month internship\n6 month internship"
+    assert sections[1]["content"] == "Campus Placement Programme\nfor every batch"
+
+
+def test_tables_become_records_keyed_by_header():
+    programs, batches = parse_tables(load("internship.html"))
+    assert programs["headers"] == ["Technology", "Aim", "Prerequisite", "Learning", "Location"]
+    assert programs["data"][1] == {
+        "Technology": ".NET", "Aim": "Build web applications.", "Prerequisite": "C#",
+        "Learning": ".NET Web MVC", "Location": "Karad / Hinjawadi"
+    }
+    assert batches["row_count"] == 1
+    assert batches["data"][0]["Time"] == "8:00 AM To 4:00 PM"
+
+
+def test_parsing_does_not_modify_the_soup():
+    soup = BeautifulSoup(load("internship.html"), "html.parser")
+    before = str(soup)
+    first = parse_accordion_sections(soup), parse_tables(soup)
+    second = parse_accordion_sections(soup), parse_tables(soup)
+    assert first == second
+    assert str(soup) == before
+
+
+def test_internship_page(serve):
+    serve("internship.html")
+    data = static_scraper.scrape_internship_static("https://sunbeaminfo.in/internship")
+    assert data["main_description"].startswith("It is really difficult")
+    assert "diversified change" in data["main_description"]
+    assert [p["Technology"] for p in data["programs"]] == ["Generative AI", ".NET"]
+    assert data["batches"][0]["Batch"] == "IIT-08-H-A-MERN"
+
+
+def test_internship_page_with_javascript_tables_falls_back_to_selenium(serve):
+    serve("internship_js_tables.html")
+    assert static_scraper.scrape_internship_static("https://sunbeaminfo.in/internship") is None
+
+
+def test_precat_page(serve):
+    serve("precat.html")
+    data = static_scraper.scrape_precat_static("https://www.sunbeaminfo.in/pre-cat")
+    assert data["page_title"] == "Preparatory Course for Entrance Exam | Pre-cat | Sunbeam"
+    assert len(data["accordion_sections"]) == 2
+
+
+def test_about_us_keeps_only_description_paragraphs(serve):
+    serve("about_us.html")
+    data = static_scraper.scrape_aboutus_static("https://www.sunbeaminfo.in/about-us")
+    assert data["main_description"].startswith("At Sunbeam we believe")
+    assert "does not start with" not in data["main_description"]
+    assert data["accordion_sections"][0]["content"] == "Rajiv Gandhi IT Park\nwell equipped library"
+
+
+def test_mastering_mcqs_basic_info_from_text_and_table(serve):
+    serve("mastering_mcqs.html")
+    data = static_scraper.scrape_mastering_mcqs_static("https://www.sunbeaminfo.in/mastering-mcqs")
+    assert data["course_name"] == "Mastering MCQs"
+    assert data["basic_info"] == {
+        "course_name": "Mastering MCQs", "duration": "1 Month", "batch_schedule": "11-Dec-2025 To 08-Jan-2026",
+        "schedule": "Mon-Fri", "timings": "11:00 AM To 12:30 PM", "fees": "Rs. 3000/-"
+    }
+    assert data["sections"] == [{"title": "Target Audience:", "content": "Students preparing for CCEE"}]
+
+
+def test_contact_page():
+    data = parse_contact(load("contact.html"), "https://www.sunbeaminfo.in/contact-us")
+    assert sorted(data["emails"]) == ["scc@sunbeaminfo.in", "siitkarad@sunbeaminfo.com"]
+    assert data["phones"] == ["+91 82 82 82 9806"]
+    assert "Sunbeam Chambers\nMarket Yard, Pune" in data["full_text"]
+
+
+def test_page_without_accordions_returns_none(serve):
+    serve("contact.html")
+    assert static_scraper.scrape_precat_static("https://www.sunbeaminfo.in/pre-cat") is None
@@ -0,0 +1,45 @@
+"""Vector store generation: caches see re-ingests made through another store instance."""
+import pytest
+from answer_cache import AnswerCache
+from sunbeam_vectorstore import SunbeamVectorStore
+
+
+def embed(texts):
+    return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+
+@pytest.fixture
+def stores(tmp_path):
+    """The serving store (numpy backend) and a second instance standing in for setup_vectorstore.py."""
+    serving = SunbeamVectorStore(str(tmp_path), lambda text: embed([text])[0], embed, backend="numpy")
+    ingest = SunbeamVectorStore(str(tmp_path), lambda text: embed([text])[0], embed)
+    ingest.add_documents(["MERN internship fees Rs. 4000/-"], [{"page": "internship"}], ["a"])
+    return serving, ingest
+
+
+def test_generation_follows_writes_from_another_instance(stores):
+    serving, ingest = stores
+    before = serving.generation()
+    assert serving.generation() == before
+    ingest.upsert_documents(["Pre-CAT batch PM-48"], [{"page": "precat"}], ["b"])
+    assert serving.generation() != before
+    ingest.delete_documents(["b"])
+    assert serving.generation() == before
+
+
+def test_cached_answer_is_dropped_after_outside_reingest(stores):
+    serving, ingest = stores
+    cache = AnswerCache()
+    cache.put("What are the MERN fees?", "Rs. 4000/-", generation=serving.generation(), embed=False)
+    assert cache.get("What are the MERN fees?", generation=serving.generation()) == "Rs. 4000/-"
+    ingest.upsert_documents(["MERN internship fees Rs. 5000/-"], [{"page": "internship"}], ["c"])
+    assert cache.get("What are the MERN fees?", generation=serving.generation()) is None
+
+
+def test_numpy_index_reloads_after_outside_reingest(stores):
+    serving, ingest = stores
+    serving.generation()
+    assert [doc["id"] for doc in serving.find_similar_documents("x", 5)] == ["a"]
+    ingest.upsert_documents(["Pre-CAT batch PM-48"], [{"page": "precat"}], ["b"])
+    serving.generation()
+    assert {doc["id"] for doc in serving.find_similar_documents("x", 5)} == {"a", "b"}
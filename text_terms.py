@@ -0,0 +1,40 @@
+"""
+Word splitting and plural stemming shared by the fact store and the BM25 index.
+
+Each caller passes its own stopword set: fact_store drops fact words
+("fee", "batch") that BM25 keeps as search terms.
+"""
+import re
+
+# .net, c++, c#, pm-48 and iit-08-h-a-mern stay whole words
+WORD = re.compile(r"\.?[a-z0-9][a-z0-9+#]*(?:-[a-z0-9+#]+)*", re.IGNORECASE)
+
+
+def stem(word):
+    """Plural to singular: batches -> batch, technologies -> technology, fees -> fee; class, campus, analysis stay."""
+    if len(word) <= 3 or not word.endswith("s") or word.endswith(("ss", "us", "is")):
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith(("ches", "shes", "sses", "xes", "zes")):
+        return word[:-2]
+    return word[:-1]
+
+
+def word_terms(text, stopwords, joined=False):
+    """
+    Lowercase singular terms in text order: each word, then its hyphen parts (and, with joined=True,
+    the parts run together: pre-cat -> precat). A stopword is dropped before and after stemming.
+    """
+    terms = []
+    for word in WORD.findall(text.lower()):
+        word = word.rstrip(".")
+        parts = word.split("-")
+        forms = [word, *parts, "".join(parts)] if joined else [word, *parts]
+        for term in dict.fromkeys(forms):
+            if term in stopwords:
+                continue
+            term = stem(term)
+            if term and term not in stopwords:
+                terms.append(term)
+    return terms
@@ -1,38 +1,226 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 
-def scrape_accordion(driver, accordion_selector):
+# page name -> seconds of the last scrape, filled by page_timer()
+PAGE_TIMINGS = {}
+
+
+def create_driver():
     """
-    Generic accordion scraper.
-    Returns list of {title, content}
+    Headless Chrome with the options every scraper uses.
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    return webdriver.Chrome(options=chrome_options)
+
+
+class DriverPool:
+    """
+    Bounded pool of reusable headless drivers.
+    Drivers are started lazily, at most `size` of them, and handed to one thread at a time.
+    A driver released as broken is quit and replaced by a fresh one on the next acquire.
     """
-    data = []
 
-    accordions = driver.find_elements(By.CSS_SELECTOR, accordion_selector)
+    def __init__(self, size=4, factory=create_driver):
+        self.size = size
+        self.factory = factory
+        self._idle = queue.Queue()
+        self._created = 0
+        self._all = []
+        self._lock = threading.Lock()
 
-    for acc in accordions:
-        title = acc.find_element(By.TAG_NAME, "h3").text
-        content = acc.text.replace(title, "").strip()
+    def acquire(self):
+        with self._lock:
+            if self._idle.empty() and self._created < self.size:
+                self._created += 1
+                start_new = True
+            else:
+                start_new = False
+        if not start_new:
+            return self._idle.get()
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._all.append(driver)
+        return driver
 
-        data.append({
-            "title": title.strip(),
-            "content": content.strip()
-        })
+    def release(self, driver, broken=False):
+        if not broken:
+            self._idle.put(driver)
+            return
+        with self._lock:
+            self._created -= 1
+            self._all.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
 
-    return data 
+    def driver(self):
+        """
+        Context manager: `with pool.driver() as driver: ...`
+        """
+        return _PooledDriver(self)
 
-def scrape_table_to_dictionary(driver, table_selector):
+    def close(self):
+        with self._lock:
+            drivers, self._all = self._all, []
+            self._created = 0
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+class _PooledDriver:
+    def __init__(self, pool):
+        self.pool = pool
+        self.driver = None
+
+    def __enter__(self):
+        self.driver = self.pool.acquire()
+        return self.driver
+
+    def __exit__(self, exc_type, exc, tb):
+        # A WebDriver error may leave the browser session dead, so don't hand it out again
+        broken = exc_type is not None and issubclass(exc_type, WebDriverException)
+        self.pool.release(self.driver, broken=broken)
+        return False
+
+@contextmanager
+def page_timer(name):
     """
-    Converts HTML table to list of dictionaries
+    Times a page scrape: `with page_timer("internship"): ...`
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PAGE_TIMINGS[name] = time.perf_counter() - start
+        print(f"⏱ {name}: {PAGE_TIMINGS[name]:.2f}s")
+
+
+def wait_document_ready(driver, timeout=15):
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+
+def open_page(driver, url, timeout=15):
     """
-    table = driver.find_element(By.CSS_SELECTOR, table_selector)
-    rows = table.find_elements(By.TAG_NAME, "tr")
+    driver.get(url) and wait until the document has finished loading.
+    """
+    with page_timer(f"load {url}"):
+        driver.get(url)
+        wait_document_ready(driver, timeout)
 
-    headers = [th.text for th in rows[0].find_elements(By.TAG_NAME, "th")]
-    table_data = []
 
-    for row in rows[1:]:
-        cells = row.find_elements(By.TAG_NAME, "td")
-        row_dict = dict(zip(headers, [cell.text for cell in cells]))
-        table_data.append(row_dict)
+def wait_for_table_rows(driver, timeout=10):
+    """
+    Waits until at least one table row is present; returns False if none appear.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "table tr"))
+        )
+    except TimeoutException:
+        return False
+    return True
+
+
+def wait_for_body_text(driver, timeout=10):
+    """
+    Waits until the page body has rendered some text; returns it.
+    """
+    return WebDriverWait(driver, timeout).until(
+        lambda d: d.find_element(By.TAG_NAME, "body").text.strip() or False
+    )
+
+
+# One round trip for everything the scrapers read from a page. Collapsed panels are
+# display:none (no rendered innerText), so each one is shown just long enough to read it.
+EXTRACT_PAGE_JS = r"""
+const text = el => (el && el.innerText || '').trim();
+const panelFor = link => {
+    const target = link.getAttribute('data-target') || link.getAttribute('href') || '';
+    let panel = target.includes('#') ? document.getElementById(target.split('#')[1]) : null;
+    if (!panel) {
+        const parent = link.closest('.panel');
+        panel = parent && parent.querySelector('.panel-collapse');
+    }
+    return panel;
+};
+const accordions = Array.from(document.querySelectorAll('.panel-title a')).map(link => {
+    const panel = panelFor(link);
+    let content = '';
+    if (panel) {
+        const wasOpen = panel.classList.contains('in');
+        panel.classList.add('in');
+        content = text(panel.querySelector('.panel-body') || panel);
+        if (!wasOpen) panel.classList.remove('in');
+    }
+    return {title: text(link), content: content};
+});
+const tables = Array.from(document.querySelectorAll('table')).map(table => ({
+    th: Array.from(table.querySelectorAll('th')).map(text),
+    rows: Array.from(table.querySelectorAll('tr')).map(tr => Array.from(tr.querySelectorAll('td')).map(text))
+}));
+return {title: document.title, body_text: text(document.body), accordions: accordions, tables: tables};
+"""
+
+
+def extract_page(driver):
+    """
+    Accordion sections, tables (raw cell texts), title and body text of the loaded page in a single execute_script call.
+    """
+    return driver.execute_script(EXTRACT_PAGE_JS)
+
+
+def scrape_accordion(driver, accordion_selector):
+    """
+    Generic accordion scraper.
+    Returns list of {title, content}
+    """
+    return driver.execute_script("""
+        return Array.from(document.querySelectorAll(arguments[0])).map(acc => {
+            const h3 = acc.querySelector('h3');
+            const title = h3 ? h3.innerText : '';
+            return {title: title.trim(), content: acc.innerText.replace(title, '').trim()};
+        });
+    """, accordion_selector)
+
+
+def scrape_table_to_dictionary(driver, table_selector):
+    """
+    Converts HTML table to list of dictionaries
+    """
+    rows = driver.execute_script("""
+        const table = document.querySelector(arguments[0]);
+        if (!table) return null;
+        return Array.from(table.querySelectorAll('tr')).map(tr => ({
+            th: Array.from(tr.querySelectorAll('th')).map(th => th.innerText),
+            td: Array.from(tr.querySelectorAll('td')).map(td => td.innerText)
+        }));
+    """, table_selector)
+    if rows is None:
+        raise NoSuchElementException(f"No table matches {table_selector}")
 
-    return table_data   
+    headers = rows[0]["th"]
+    return [dict(zip(headers, row["td"])) for row in rows[1:]]